@@ -201,6 +201,11 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Disable progress bars",
     )
+    advanced_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Discard cached PyPI lookups and query pip afresh",
+    )
 
     # pip-sync style operations
     sync_group = parser.add_argument_group("pip-sync style operations")
@@ -411,6 +416,12 @@ def main(args: Optional[List[str]] = None) -> int:
     if parsed_args.parallel:
         logger.info("Parallel updates enabled (experimental)")
 
+    if parsed_args.refresh_cache:
+        from covert.pip_interface import clear_pip_cache
+
+        logger.info("Discarding cached PyPI lookups")
+        clear_pip_cache()
+
     # Handle progress bar flag
     if parsed_args.no_progress:
         logger.info("Progress bars disabled")
@@ -628,15 +639,20 @@ def main(args: Optional[List[str]] = None) -> int:
             duration = (session.end_time - session.start_time).total_seconds() if session.end_time else 0.0
 
             notifier = NotificationManager(config.notifications)
-            notifier.send_update_summary(
-                session_name=config.project.name,
-                updated=session.updated_count,
-                rolled_back=session.rolled_back_count,
-                failed=session.summary.get("failed_install", 0),
-                skipped=session.summary.get("skipped", 0),
-                duration=duration,
-                vulnerabilities=vulnerabilities_found,
-            )
+            try:
+                notifier.send_update_summary(
+                    session_name=config.project.name,
+                    updated=session.updated_count,
+                    rolled_back=session.rolled_back_count,
+                    failed=session.summary.get("failed_install", 0),
+                    skipped=session.summary.get("skipped", 0),
+                    duration=duration,
+                    vulnerabilities=vulnerabilities_found,
+                )
+            finally:
+                # Wait for the background delivery before exiting
+                if not notifier.close():
+                    logger.warning("Some notifications could not be delivered")
 
         # Git integration: Create branch, commit, and PR
         if (parsed_args.create_branch or parsed_args.commit or parsed_args.create_pr) and session and session.success:
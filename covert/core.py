@@ -9,7 +9,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from covert.backup import create_backup
 from covert.config import Config
@@ -19,6 +19,7 @@ from covert.pip_interface import (
     get_dependency_graph,
     get_outdated_packages,
     install_package,
+    install_packages,
     uninstall_package,
 )
 from covert.tester import run_tests
@@ -300,21 +301,31 @@ def run_update_session(
                 except Exception as e:
                     logger.warning(f"Failed to sort packages by dependencies: {e}")
 
-            for pkg_data in packages_to_update:
-                package = PackageInfo(
+            packages = [
+                PackageInfo(
                     name=pkg_data["name"],
                     current_version=pkg_data["version"],
                     latest_version=pkg_data["latest_version"],
                     package_type=pkg_data.get("package_type", "regular"),
                 )
-
-                result = _update_package(
-                    package,
-                    config,
-                    dry_run,
-                    no_tests,
-                )
-                session.results.append(result)
+                for pkg_data in packages_to_update
+            ]
+
+            # Without tests between updates there is nothing to roll back per
+            # package, so a single pip invocation can install everything
+            run_tests_per_package = not no_tests and config.testing.enabled
+            verify_hash = getattr(config.security, 'verify_hashes', False)
+            if len(packages) > 1 and not (dry_run or run_tests_per_package or verify_hash):
+                session.results.extend(_update_packages_batch(packages, config))
+            else:
+                for package in packages:
+                    result = _update_package(
+                        package,
+                        config,
+                        dry_run,
+                        no_tests,
+                    )
+                    session.results.append(result)
 
         session.end_time = datetime.now()
 
@@ -442,44 +453,9 @@ def _update_package(
     logger.info(f"  Latest:  {package.latest_version}")
 
     try:
-        # Check version policy
-        is_breaking = is_breaking_change(
-            package.current_version,
-            package.latest_version,
-            config.updates.version_policy,
-        )
-
-        if is_breaking:
-            logger.warning(
-                f"Skipping {package.name}: version change is breaking "
-                f"under '{config.updates.version_policy}' policy"
-            )
-            result.status = UpdateStatus.SKIPPED
-            return result
-
-        # Dry run mode
-        if dry_run:
-            logger.info(f"[DRY RUN] Would update {package.name} to {package.latest_version}")
-            result.status = UpdateStatus.UPDATED
-            return result
-
-        # Analyze dependency impact before installation
-        from covert.dependency_analyzer import analyze_package_impact
-
-        logger.info(f"Analyzing dependency impact for {package.name}=={package.latest_version}...")
-        impact = analyze_package_impact(package.name, package.latest_version)
-
-        if not impact["can_resolve"]:
-            logger.error(f"Cannot install {package.name}: {impact['resolution_error']}")
-            result.status = UpdateStatus.FAILED_INSTALL
-            result.error_message = f"Dependency resolution failed: {impact['resolution_error']}"
+        if not _prepare_update(package, config, result, dry_run):
             return result
 
-        if impact["current_deps_ok"]:
-            logger.info("Current dependencies: OK")
-        else:
-            logger.warning(f"Current environment has broken dependencies: {impact['current_broken']}")
-
         # Store current version for rollback
         old_version = package.current_version
 
@@ -512,16 +488,7 @@ def _update_package(
 
                 return result
 
-        result.status = UpdateStatus.UPDATED
-        logger.info(f"Successfully updated {package.name}")
-
-        # Step 7: Sync manifest files (requirements.txt, pyproject.toml)
-        try:
-            updated_manifests = update_manifest_file(package.name, package.latest_version)
-            for manifest in updated_manifests:
-                logger.info(f"Updated manifest file: {manifest}")
-        except Exception as e:
-            logger.warning(f"Failed to sync manifest files for {package.name}: {e}")
+        _mark_updated(package, result)
 
     except Exception as e:
         logger.error(f"Failed to update {package.name}: {e}")
@@ -531,6 +498,145 @@ def _update_package(
     return result
 
 
+def _prepare_update(
+    package: PackageInfo,
+    config: Config,
+    result: UpdateResult,
+    dry_run: bool = False,
+) -> bool:
+    """Run the pre-install checks for a package update.
+
+    Updates ``result`` when the package should not be installed.
+
+    Args:
+        package: Package information.
+        config: Configuration object.
+        result: Result to update for skipped, simulated or unresolvable updates.
+        dry_run: If True, stop after the version policy check.
+
+    Returns:
+        bool: True if the package should be installed.
+    """
+    # Check version policy
+    is_breaking = is_breaking_change(
+        package.current_version,
+        package.latest_version,
+        config.updates.version_policy,
+    )
+
+    if is_breaking:
+        logger.warning(
+            f"Skipping {package.name}: version change is breaking "
+            f"under '{config.updates.version_policy}' policy"
+        )
+        result.status = UpdateStatus.SKIPPED
+        return False
+
+    # Dry run mode
+    if dry_run:
+        logger.info(f"[DRY RUN] Would update {package.name} to {package.latest_version}")
+        result.status = UpdateStatus.UPDATED
+        return False
+
+    # Analyze dependency impact before installation
+    from covert.dependency_analyzer import analyze_package_impact
+
+    logger.info(f"Analyzing dependency impact for {package.name}=={package.latest_version}...")
+    impact = analyze_package_impact(package.name, package.latest_version)
+
+    if not impact.can_resolve:
+        logger.error(f"Cannot install {package.name}: {impact.resolution_error}")
+        result.status = UpdateStatus.FAILED_INSTALL
+        result.error_message = f"Dependency resolution failed: {impact.resolution_error}"
+        return False
+
+    if impact.current_deps_ok:
+        logger.info("Current dependencies: OK")
+    else:
+        logger.warning(f"Current environment has broken dependencies: {impact.current_broken}")
+
+    return True
+
+
+def _mark_updated(package: PackageInfo, result: UpdateResult) -> None:
+    """Record a successful update and sync manifest files.
+
+    Args:
+        package: Package that was updated.
+        result: Result to mark as updated.
+    """
+    result.status = UpdateStatus.UPDATED
+    logger.info(f"Successfully updated {package.name}")
+
+    # Step 7: Sync manifest files (requirements.txt, pyproject.toml)
+    try:
+        updated_manifests = update_manifest_file(package.name, package.latest_version)
+        for manifest in updated_manifests:
+            logger.info(f"Updated manifest file: {manifest}")
+    except Exception as e:
+        logger.warning(f"Failed to sync manifest files for {package.name}: {e}")
+
+
+def _update_packages_batch(
+    packages: List[PackageInfo],
+    config: Config,
+) -> List[UpdateResult]:
+    """Update several packages with a single pip invocation.
+
+    Only suitable when no tests run between updates. If the batch install
+    fails, each package is installed on its own so that failures are
+    attributed to the right package.
+
+    Args:
+        packages: Packages to update.
+        config: Configuration object.
+
+    Returns:
+        List[UpdateResult]: Results of update attempts, in input order.
+    """
+    results: List[UpdateResult] = []
+    ready: List[Tuple[PackageInfo, UpdateResult]] = []
+
+    for package in packages:
+        result = UpdateResult(
+            package=package,
+            status=UpdateStatus.PENDING,
+            timestamp=datetime.now(),
+        )
+        results.append(result)
+
+        try:
+            if _prepare_update(package, config, result):
+                ready.append((package, result))
+        except Exception as e:
+            logger.error(f"Failed to update {package.name}: {e}")
+            result.status = UpdateStatus.FAILED_INSTALL
+            result.error_message = str(e)
+
+    if not ready:
+        return results
+
+    try:
+        install_packages([(package.name, package.latest_version) for package, _ in ready])
+    except Exception as e:
+        logger.warning(f"Batch install failed, installing packages one at a time: {e}")
+        for package, result in ready:
+            try:
+                install_package(package.name, version=package.latest_version)
+            except Exception as install_error:
+                logger.error(f"Failed to update {package.name}: {install_error}")
+                result.status = UpdateStatus.FAILED_INSTALL
+                result.error_message = str(install_error)
+                continue
+            _mark_updated(package, result)
+        return results
+
+    for package, result in ready:
+        _mark_updated(package, result)
+
+    return results
+
+
 def _update_packages_parallel(
     packages: List[Dict[str, str]],
     config: Config,
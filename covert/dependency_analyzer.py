@@ -27,6 +27,39 @@ class DependencyCheckResult:
     message: str
 
 
+@dataclass(frozen=True)
+class PackageImpact:
+    """Impact analysis of installing a specific package version.
+
+    Attributes:
+        package: Name of the analyzed package.
+        version: Version of the analyzed package.
+        can_resolve: Whether the package dependencies can be resolved.
+        current_deps_ok: Whether the current environment is consistent.
+        current_broken: Broken packages in the current environment.
+        resolution_error: Resolution error message, if any.
+        recommendation: Human-readable recommendation.
+    """
+
+    __slots__ = (
+        "package",
+        "version",
+        "can_resolve",
+        "current_deps_ok",
+        "current_broken",
+        "resolution_error",
+        "recommendation",
+    )
+
+    package: str
+    version: str
+    can_resolve: bool
+    current_deps_ok: bool
+    current_broken: List[Dict[str, str]]
+    resolution_error: Optional[str]
+    recommendation: str
+
+
 def check_current_dependencies() -> DependencyCheckResult:
     """Check if current installed packages have broken dependencies.
 
@@ -49,8 +82,9 @@ def check_current_dependencies() -> DependencyCheckResult:
         )
 
     # Parse broken dependencies from output
+    stdout = result.stdout or ""
     broken = []
-    for line in result.stdout.splitlines():
+    for line in stdout.splitlines():
         # Format: "package requires otherpackage>=1.0"
         if " requires " in line:
             parts = line.split(" requires ")
@@ -63,7 +97,7 @@ def check_current_dependencies() -> DependencyCheckResult:
     return DependencyCheckResult(
         is_valid=False,
         broken_packages=broken,
-        message=result.stdout.strip(),
+        message=stdout.strip(),
     )
 
 
@@ -141,7 +175,7 @@ def dry_run_install(
 def analyze_package_impact(
     package_name: str,
     version: str,
-) -> Dict[str, any]:
+) -> PackageImpact:
     """Analyze the potential impact of installing a package.
 
     This function integrates pip-tools style analysis by:
@@ -154,7 +188,7 @@ def analyze_package_impact(
         version: Version to analyze.
 
     Returns:
-        Dictionary with analysis results.
+        PackageImpact with analysis results.
     """
     logger.info(f"Analyzing impact of {package_name}=={version}...")
 
@@ -165,17 +199,17 @@ def analyze_package_impact(
     resolution = dry_run_install(package_name, version)
 
     # Step 3: Build analysis result
-    analysis = {
-        "package": package_name,
-        "version": version,
-        "can_resolve": resolution.is_valid,
-        "current_deps_ok": current_state.is_valid,
-        "current_broken": current_state.broken_packages,
-        "resolution_error": resolution.message if not resolution.is_valid else None,
-        "recommendation": _get_recommendation(resolution, current_state),
-    }
-
-    logger.info(f"Analysis complete: {analysis['recommendation']}")
+    analysis = PackageImpact(
+        package=package_name,
+        version=version,
+        can_resolve=resolution.is_valid,
+        current_deps_ok=current_state.is_valid,
+        current_broken=current_state.broken_packages,
+        resolution_error=resolution.message if not resolution.is_valid else None,
+        recommendation=_get_recommendation(resolution, current_state),
+    )
+
+    logger.info(f"Analysis complete: {analysis.recommendation}")
 
     return analysis
 
@@ -6,15 +6,35 @@ This module provides Git integration features:
 - Create Pull Requests
 """
 
+import asyncio
+import atexit
+import functools
+import json
+import os
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
+from urllib.parse import urlparse
+
+import httpx
 
 from covert.logger import get_logger
+from covert.utils import run_coroutine_sync
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional dependency
+    pygit2 = None
 
 logger = get_logger(__name__)
 
+# Location of the GitHub CLI, resolved once at import time
+_GH_PATH: Optional[str] = shutil.which("gh")
+
 
 @dataclass
 class GitConfig:
@@ -29,38 +49,98 @@ class GitConfig:
     required_checks: Optional[List[str]] = None
 
 
+@dataclass
+class GitJob:
+    """A set of Git actions to perform in one repository."""
+
+    path: Path
+    files: List[str]
+    config: GitConfig
+    commit_message: Optional[str] = None
+
+
+# Backoff schedule for polling PR checks (seconds)
+_CHECK_POLL_INITIAL_DELAY = 2
+_CHECK_POLL_MAX_DELAY = 30
+_CHECK_POLL_MAX_WAIT = 300
+
+_PR_BODY_TEMPLATE = """## Summary
+
+Automated dependency update by Covert.
+
+### Changes
+
+- Updated packages: {files}
+
+### Testing
+
+Please ensure all tests pass before merging.
+
+---
+*Generated by Covert*"""
+
+_GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+_CHECKS_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      commits(last: 1) {
+        nodes {
+          commit {
+            statusCheckRollup {
+              contexts(first: 100) {
+                nodes {
+                  ... on CheckRun { name conclusion }
+                  ... on StatusContext { context state }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
 class GitError(Exception):
     """Error during Git operations."""
 
     pass
 
 
-def run_git_command(args: List[str], capture: bool = True) -> subprocess.CompletedProcess:
+def run_git_command(
+    args: List[str],
+    capture: bool = True,
+    cwd: Optional[Path] = None,
+) -> subprocess.CompletedProcess:
     """Run a git command securely.
 
     Args:
         args: Git command arguments (without 'git').
         capture: Whether to capture output.
+        cwd: Directory to run the command in. Defaults to current directory.
 
     Returns:
-        CompletedProcess result.
+        CompletedProcess result with undecoded (bytes) output; use _decode
+        to read it as text.
 
     Raises:
         GitError: If command fails.
     """
-    cmd = ["git"] + args
-    logger.debug(f"Running: {' '.join(cmd)}")
+    logger.debug("Running: git %s", args)
 
     try:
         result = subprocess.run(
-            cmd,
+            ("git", *args),
             capture_output=capture,
-            text=True,
             check=False,
             shell=False,
+            cwd=cwd,
         )
         if result.returncode != 0:
-            raise GitError(f"Git command failed: {result.stderr}")
+            raise GitError(f"Git command failed: {_decode(result.stderr)}")
         return result
     except FileNotFoundError:
         raise GitError("Git not found. Is Git installed?")
@@ -68,70 +148,323 @@ def run_git_command(args: List[str], capture: bool = True) -> subprocess.Complet
         raise GitError(f"Git command failed: {e}")
 
 
-def is_git_repo(path: Optional[Path] = None) -> bool:
-    """Check if path is a Git repository.
+class _GitWorker:
+    """Long-lived ``git cat-file --batch-check`` process for object lookups.
+
+    Resolving a revision through a persistent process avoids paying a full
+    fork/exec of ``git`` for every read-only query. The process is started
+    lazily and shared between threads behind a lock. Without a fixed
+    directory it follows the current directory, restarting when it changes.
+    """
+
+    def __init__(self, cwd: Optional[Path] = None) -> None:
+        self._fixed_cwd = str(cwd) if cwd is not None else None
+        self._proc: Optional[subprocess.Popen] = None
+        self._cwd: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        cwd = self._fixed_cwd or os.getcwd()
+        if self._proc is not None and (self._proc.poll() is not None or self._cwd != cwd):
+            self._close_locked()
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding="utf-8",
+                errors="replace",
+                shell=False,
+                cwd=cwd,
+            )
+            self._cwd = cwd
+        return self._proc
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a revision to its object SHA.
+
+        Args:
+            rev: Revision to resolve (e.g., "HEAD" or "refs/heads/main").
+
+        Returns:
+            Full object SHA, or None if the revision does not exist.
+
+        Raises:
+            GitError: If the lookup process cannot be used.
+        """
+        if not rev or "\n" in rev:
+            raise GitError(f"Invalid revision: {rev!r}")
+
+        with self._lock:
+            try:
+                proc = self._ensure_started()
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(rev + "\n")
+                proc.stdin.flush()
+                line: str = proc.stdout.readline()
+            except FileNotFoundError as e:
+                raise GitError("Git not found. Is Git installed?") from e
+            except (OSError, ValueError) as e:
+                self._close_locked()
+                raise GitError(f"Git object lookup failed: {e}") from e
+
+            if not line:
+                # The process exited, e.g. because cwd is not a repository
+                self._close_locked()
+                raise GitError(f"Git object lookup failed for: {rev}")
+
+        # Output format: "<sha> <type> <size>" or "<rev> missing"
+        parts = line.split()
+        if len(parts) < 2 or parts[-1] == "missing":
+            return None
+        return parts[0]
+
+    def close(self) -> None:
+        """Terminate the worker process, if running."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        proc, self._proc, self._cwd = self._proc, None, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+_worker = _GitWorker()
+_workers: Dict[Path, _GitWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def _get_worker(cwd: Optional[Path] = None) -> _GitWorker:
+    """Get the cat-file worker for a repository directory.
 
     Args:
-        path: Path to check. Defaults to current directory.
+        cwd: Repository directory. Defaults to following the current directory.
 
     Returns:
-        True if path is a Git repository.
+        Worker bound to the directory.
+    """
+    if cwd is None:
+        return _worker
+    key = cwd.resolve()
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = _workers[key] = _GitWorker(key)
+    return worker
+
+
+def _close_workers() -> None:
+    """Terminate all cat-file workers."""
+    _worker.close()
+    with _workers_lock:
+        for worker in _workers.values():
+            worker.close()
+        _workers.clear()
+
+
+atexit.register(_close_workers)
+
+
+def _run(args: List[str], cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a command with captured text output and no shell."""
+    return subprocess.run(
+        args,
+        capture_output=True,
+        text=True,
+        check=False,
+        shell=False,
+        cwd=cwd,
+    )
+
+
+async def _run_async(args: List[str], cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop; async counterpart of _run."""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    stdout, stderr = await proc.communicate()
+    returncode = await proc.wait()
+    return subprocess.CompletedProcess(
+        args,
+        returncode,
+        stdout=_decode(stdout),
+        stderr=_decode(stderr),
+    )
+
+
+def _decode(output: Optional[bytes]) -> str:
+    """Decode captured git output as UTF-8 regardless of the locale."""
+    return output.decode("utf-8", "replace") if output else ""
+
+
+def _resolve_path(path: Optional[Path]) -> Path:
+    """Resolve a repository path, defaulting to the current directory."""
+    return (path or Path.cwd()).resolve()
+
+
+@functools.lru_cache(maxsize=32)
+def _open_repo(path: Path) -> Optional["pygit2.Repository"]:
+    """Open the repository containing path in-process with pygit2.
+
+    Returns:
+        Repository, or None if pygit2 is unavailable or path is not in a repo.
     """
+    if pygit2 is None:
+        return None
+    try:
+        repo_path = pygit2.discover_repository(str(path))
+        if repo_path is None:
+            return None
+        return pygit2.Repository(repo_path)
+    except pygit2.GitError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _is_git_repo(path: Path) -> bool:
+    if pygit2 is not None:
+        return _open_repo(path) is not None
     try:
-        run_git_command(["rev-parse", "--git-dir"], capture=True)
+        run_git_command(["rev-parse", "--git-dir"], capture=True, cwd=path)
         return True
     except GitError:
         return False
 
 
-def get_current_branch() -> str:
+@functools.lru_cache(maxsize=32)
+def _get_current_branch(path: Path) -> str:
+    if pygit2 is not None:
+        repo = _open_repo(path)
+        if repo is None:
+            raise GitError(f"Not a Git repository: {path}")
+        # Read HEAD as a symbolic ref so unborn branches resolve too;
+        # a detached HEAD yields "" like 'git branch --show-current'
+        target = repo.references["HEAD"].target
+        if isinstance(target, str) and target.startswith("refs/heads/"):
+            return target[len("refs/heads/"):]
+        return ""
+    result = run_git_command(["branch", "--show-current"], cwd=path)
+    return _decode(result.stdout).strip()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_remote_url(path: Path) -> Optional[str]:
+    if pygit2 is not None:
+        repo = _open_repo(path)
+        if repo is None:
+            return None
+        try:
+            url = repo.remotes["origin"].url
+        except KeyError:
+            return None
+        return str(url) if url is not None else None
+    try:
+        result = run_git_command(["remote", "get-url", "origin"], cwd=path)
+        return _decode(result.stdout).strip()
+    except GitError:
+        return None
+
+
+def _branch_exists(branch_name: str, cwd: Optional[Path] = None) -> bool:
+    """Check whether a local branch exists."""
+    repo = _open_repo(_resolve_path(cwd))
+    if repo is not None:
+        return branch_name in repo.branches.local
+    return _get_worker(cwd).resolve(f"refs/heads/{branch_name}") is not None
+
+
+def _invalidate_git_cache() -> None:
+    """Clear memoized repository queries."""
+    _open_repo.cache_clear()
+    _is_git_repo.cache_clear()
+    _get_current_branch.cache_clear()
+    _get_remote_url.cache_clear()
+
+
+def is_git_repo(path: Optional[Path] = None) -> bool:
+    """Check if path is a Git repository.
+
+    Results are memoized per resolved path.
+
+    Args:
+        path: Path to check. Defaults to current directory.
+
+    Returns:
+        True if path is a Git repository.
+    """
+    return _is_git_repo(_resolve_path(path))
+
+
+def get_current_branch(path: Optional[Path] = None) -> str:
     """Get the current branch name.
 
+    Results are memoized per resolved path until the branch is changed
+    through create_branch.
+
+    Args:
+        path: Repository path. Defaults to current directory.
+
     Returns:
         Current branch name.
 
     Raises:
         GitError: If not in a repo or on no branch.
     """
-    result = run_git_command(["branch", "--show-current"])
-    return result.stdout.strip()
+    return _get_current_branch(_resolve_path(path))
 
 
-def get_remote_url() -> Optional[str]:
+def get_remote_url(path: Optional[Path] = None) -> Optional[str]:
     """Get the URL of the 'origin' remote.
 
+    Results are memoized per resolved path.
+
+    Args:
+        path: Repository path. Defaults to current directory.
+
     Returns:
         Remote URL or None if not available.
     """
-    try:
-        result = run_git_command(["remote", "get-url", "origin"])
-        return result.stdout.strip()
-    except GitError:
-        return None
+    return _get_remote_url(_resolve_path(path))
 
 
-def create_branch(branch_name: str, checkout: bool = True) -> None:
+def create_branch(branch_name: str, checkout: bool = True, cwd: Optional[Path] = None) -> None:
     """Create a new Git branch.
 
     Args:
         branch_name: Name of the new branch.
         checkout: Whether to switch to the new branch after creation.
+        cwd: Repository directory. Defaults to current directory.
 
     Raises:
         GitError: If branch creation fails.
     """
     # Check if branch already exists
-    try:
-        run_git_command(["rev-parse", "--verify", branch_name])
+    if _branch_exists(branch_name, cwd=cwd):
         logger.info(f"Branch '{branch_name}' already exists, checking it out")
         if checkout:
-            run_git_command(["checkout", branch_name])
-    except GitError:
+            run_git_command(["checkout", branch_name], cwd=cwd)
+            _invalidate_git_cache()
+    else:
         # Branch doesn't exist, create it
-        run_git_command(["branch", branch_name])
+        run_git_command(["branch", branch_name], cwd=cwd)
         logger.info(f"Created branch: {branch_name}")
         if checkout:
-            run_git_command(["checkout", branch_name])
+            run_git_command(["checkout", branch_name], cwd=cwd)
+            _invalidate_git_cache()
             logger.info(f"Switched to branch: {branch_name}")
 
 
@@ -139,13 +472,18 @@ def commit_changes(
     files: List[str],
     message: str,
     author: Optional[str] = None,
+    cwd: Optional[Path] = None,
 ) -> str:
     """Commit changes to Git.
 
+    Only the given files are committed; anything else already staged stays
+    staged and is left out of the commit.
+
     Args:
         files: List of files to commit.
         message: Commit message.
         author: Optional author string (e.g., "Name <email>").
+        cwd: Repository directory. Defaults to current directory.
 
     Returns:
         Commit SHA.
@@ -153,30 +491,50 @@ def commit_changes(
     Raises:
         GitError: If commit fails.
     """
-    # Add files
-    run_git_command(["add"] + files)
-    logger.info(f"Staged {len(files)} file(s)")
-
-    # Build commit command
     cmd = ["commit", "-m", message]
     if author:
         cmd.extend(["--author", author])
 
-    run_git_command(cmd)
-    logger.info(f"Committed with message: {message}")
+    if not (files and _all_tracked(files, cwd=cwd)):
+        # --only cannot pick up untracked files, so stage them explicitly
+        run_git_command(["add", "--"] + files, cwd=cwd)
+    # Stage and commit just the given paths, whatever else is in the index
+    run_git_command(cmd + ["--only", "--"] + files, cwd=cwd)
+    logger.info(f"Committed {len(files)} file(s) with message: {message}")
 
     # Get commit SHA
-    result = run_git_command(["rev-parse", "HEAD"])
-    return result.stdout.strip()[:8]
+    sha = _get_worker(cwd).resolve("HEAD")
+    if sha is None:
+        raise GitError("Could not resolve HEAD after commit")
+    return sha[:8]
+
+
+def _all_tracked(files: List[str], cwd: Optional[Path] = None) -> bool:
+    """Check whether all files exist in HEAD, without spawning a process per file."""
+    worker = _get_worker(cwd)
+    try:
+        for file in files:
+            relative = os.path.relpath(file, cwd) if os.path.isabs(file) else file
+            if worker.resolve(f"HEAD:./{Path(relative).as_posix()}") is None:
+                return False
+    except GitError:
+        return False
+    return True
 
 
-def push_branch(branch_name: str, remote: str = "origin", set_upstream: bool = True) -> None:
+def push_branch(
+    branch_name: str,
+    remote: str = "origin",
+    set_upstream: bool = True,
+    cwd: Optional[Path] = None,
+) -> None:
     """Push branch to remote.
 
     Args:
         branch_name: Name of branch to push.
         remote: Remote name (default: origin).
         set_upstream: Whether to set upstream branch.
+        cwd: Repository directory. Defaults to current directory.
 
     Raises:
         GitError: If push fails.
@@ -185,7 +543,7 @@ def push_branch(branch_name: str, remote: str = "origin", set_upstream: bool = T
     if set_upstream:
         cmd.append("--set-upstream")
 
-    run_git_command(cmd)
+    run_git_command(cmd, cwd=cwd)
     logger.info(f"Pushed branch '{branch_name}' to {remote}")
 
 
@@ -195,6 +553,7 @@ def create_pull_request(
     head: str,
     base: str = "main",
     remote: str = "origin",
+    cwd: Optional[Path] = None,
 ) -> Optional[str]:
     """Create a Pull Request using GitHub CLI.
 
@@ -204,36 +563,27 @@ def create_pull_request(
         head: Branch name containing changes.
         base: Base branch to merge into.
         remote: Remote name.
+        cwd: Repository directory. Defaults to current directory.
 
     Returns:
         PR URL if successful, None otherwise.
     """
     # Check if gh CLI is available
-    try:
-        subprocess.run(
-            ["gh", "--version"],
-            capture_output=True,
-            check=True,
-            shell=False,
-        )
-    except (FileNotFoundError, subprocess.CalledProcessError):
+    if _GH_PATH is None:
         logger.warning("GitHub CLI (gh) not found. Cannot create PR.")
         logger.info("Install gh from https://cli.github.com/")
         return None
 
     try:
-        result = subprocess.run(
+        result = _run(
             [
-                "gh", "pr", "create",
+                _GH_PATH, "pr", "create",
                 "--title", title,
                 "--body", body,
                 "--head", head,
                 "--base", base,
             ],
-            capture_output=True,
-            text=True,
-            check=False,
-            shell=False,
+            cwd=cwd,
         )
 
         if result.returncode == 0:
@@ -253,6 +603,7 @@ def perform_git_actions(
     files: List[str],
     config: GitConfig,
     commit_message: Optional[str] = None,
+    cwd: Optional[Path] = None,
 ) -> Optional[str]:
     """Perform Git actions based on configuration.
 
@@ -260,11 +611,12 @@ def perform_git_actions(
         files: List of files to commit.
         config: Git configuration.
         commit_message: Custom commit message.
+        cwd: Repository directory. Defaults to current directory.
 
     Returns:
         PR URL if PR was created, None otherwise.
     """
-    if not is_git_repo():
+    if not is_git_repo(cwd):
         logger.warning("Not in a Git repository. Skipping Git operations.")
         return None
 
@@ -272,42 +624,30 @@ def perform_git_actions(
 
     # Create branch if requested
     if config.branch:
-        original_branch = get_current_branch()
-        create_branch(config.branch, checkout=True)
+        original_branch = get_current_branch(cwd)
+        create_branch(config.branch, checkout=True, cwd=cwd)
 
         # Commit changes
         if config.commit:
             message = commit_message or config.commit_message
-            commit_sha = commit_changes(files, message)
+            commit_sha = commit_changes(files, message, cwd=cwd)
             logger.info(f"Changes committed: {commit_sha}")
 
             # Push branch
-            push_branch(config.branch)
+            push_branch(config.branch, cwd=cwd)
 
             # Create PR if requested
             if config.create_pr:
-                remote_url = get_remote_url()
+                remote_url = get_remote_url(cwd)
                 if remote_url and "github.com" in remote_url:
                     pr_title = f"Update dependencies - {config.branch}"
-                    pr_body = f"""## Summary
-
-Automated dependency update by Covert.
-
-### Changes
-
-- Updated packages: {', '.join(files)}
-
-### Testing
-
-Please ensure all tests pass before merging.
-
----
-*Generated by Covert*"""
+                    pr_body = _PR_BODY_TEMPLATE.format(files=", ".join(files))
 
                     pr_url = create_pull_request(
                         title=pr_title,
                         body=pr_body,
                         head=config.branch,
+                        cwd=cwd,
                     )
 
                     if pr_url:
@@ -315,7 +655,12 @@ Please ensure all tests pass before merging.
 
                         # Auto-merge if requested
                         if config.auto_merge:
-                            auto_merge_pr(pr_url, config.auto_merge_method, config.required_checks)
+                            auto_merge_pr(
+                                pr_url,
+                                config.auto_merge_method,
+                                config.required_checks,
+                                cwd=cwd,
+                            )
                 else:
                     logger.warning("Remote is not GitHub. Cannot create PR automatically.")
                     logger.info("Push your branch manually and create a PR.")
@@ -327,98 +672,301 @@ Please ensure all tests pass before merging.
         # No branch requested, just commit if asked
         if config.commit:
             message = commit_message or config.commit_message
-            commit_sha = commit_changes(files, message)
+            commit_sha = commit_changes(files, message, cwd=cwd)
             logger.info(f"Changes committed: {commit_sha}")
 
     return pr_url
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_pr_url(pr_url: str) -> Tuple[str, Optional[Tuple[str, str, int]]]:
+    """Parse a pull request URL.
+
+    Args:
+        pr_url: URL such as https://github.com/owner/repo/pull/123.
+
+    Returns:
+        Tuple of the PR number as a string and, for github.com URLs,
+        (owner, repo, number); otherwise None.
+    """
+    pr_number = pr_url.rstrip("/").split("/")[-1]
+    parsed = urlparse(pr_url)
+    parts = parsed.path.strip("/").split("/")
+    if (
+        parsed.hostname == "github.com"
+        and len(parts) == 4
+        and parts[2] == "pull"
+        and parts[3].isdigit()
+    ):
+        return pr_number, (parts[0], parts[1], int(parts[3]))
+    return pr_number, None
+
+
+def _gh_executable() -> str:
+    """Return the path of the gh CLI.
+
+    Raises:
+        GitError: If gh is not on PATH.
+    """
+    if _GH_PATH is None:
+        raise GitError("GitHub CLI (gh) not found")
+    return _GH_PATH
+
+
+class _CheckPoller:
+    """Fetch the status checks of a pull request across repeated polls.
+
+    For github.com PRs the checks are queried through the GraphQL API over
+    one pooled HTTP connection, authenticated with a token read once from
+    ``gh auth token``. Otherwise, or if that fails, each poll falls back to
+    ``gh pr view --json statusCheckRollup``.
+    """
+
+    def __init__(
+        self,
+        pr_url: str,
+        cwd: Optional[Path] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._pr_number, github_pr = _parse_pr_url(pr_url)
+        self._cwd = cwd
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._variables: Optional[Dict[str, Any]] = None
+        if github_pr is not None:
+            owner, repo, number = github_pr
+            self._variables = {"owner": owner, "repo": repo, "number": number}
+
+    async def fetch(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the current status checks.
+
+        Returns:
+            Checks as dicts with "name" and "conclusion", or None if the
+            status could not be retrieved.
+        """
+        client = await self._get_client()
+        if client is not None:
+            try:
+                response = await client.post(
+                    _GITHUB_GRAPHQL_URL,
+                    json={"query": _CHECKS_QUERY, "variables": self._variables},
+                )
+                response.raise_for_status()
+                return _parse_graphql_checks(response.json())
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+                logger.debug(f"GraphQL check query failed, falling back to gh: {e}")
+                await self.aclose()
+                self._variables = None
+
+        result = await _run_async(
+            [_gh_executable(), "pr", "view", self._pr_number, "--json", "statusCheckRollup"],
+            cwd=self._cwd,
+        )
+        if result.returncode != 0:
+            return None
+        return cast(List[Dict[str, Any]], json.loads(result.stdout).get("statusCheckRollup", []))
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool, if open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_client(self) -> Optional[httpx.AsyncClient]:
+        if self._client is not None or self._variables is None:
+            return self._client
+
+        result = await _run_async([_gh_executable(), "auth", "token"], cwd=self._cwd)
+        token = result.stdout.strip() if result.returncode == 0 else ""
+        if not token:
+            self._variables = None
+            return None
+
+        self._client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=30,
+            transport=self._transport,
+        )
+        return self._client
+
+
+def _parse_graphql_checks(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Normalize a GraphQL statusCheckRollup response to gh's JSON shape."""
+    if data.get("errors"):
+        raise ValueError(f"GraphQL errors: {data['errors']}")
+
+    commits = data["data"]["repository"]["pullRequest"]["commits"]["nodes"]
+    rollup = commits[0]["commit"]["statusCheckRollup"] if commits else None
+    if not rollup:
+        return []
+
+    checks = []
+    for node in rollup["contexts"]["nodes"]:
+        if "context" in node:
+            checks.append({"name": node["context"], "conclusion": node.get("state")})
+        else:
+            checks.append({"name": node.get("name", ""), "conclusion": node.get("conclusion")})
+    return checks
+
+
+def perform_git_actions_many(
+    jobs: List[GitJob],
+    max_workers: int = 8,
+) -> Dict[Path, Optional[str]]:
+    """Perform Git actions for several repositories concurrently.
+
+    Each job runs perform_git_actions in its own repository directory, so
+    the network-bound push and PR steps of different repositories overlap.
+
+    Args:
+        jobs: Git jobs, one per repository.
+        max_workers: Maximum number of repositories processed at once.
+
+    Returns:
+        Mapping of repository path to PR URL (None if no PR was created or
+        the job failed).
+    """
+    results: Dict[Path, Optional[str]] = {}
+    if not jobs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {
+            executor.submit(
+                perform_git_actions,
+                job.files,
+                job.config,
+                job.commit_message,
+                cwd=job.path,
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results[job.path] = future.result()
+            except GitError as e:
+                logger.error(f"Git actions failed for {job.path}: {e}")
+                results[job.path] = None
+
+    return results
+
+
 def auto_merge_pr(
     pr_url: str,
     merge_method: str = "squash",
     required_checks: Optional[List[str]] = None,
+    cwd: Optional[Path] = None,
 ) -> bool:
     """Auto-merge a pull request when checks pass (Dependabot style).
 
+    Synchronous wrapper around auto_merge_pr_async. It may also be called
+    while an event loop is running (from async code or a notebook); it
+    then blocks until done, so async callers should await
+    auto_merge_pr_async instead.
+
     Args:
         pr_url: URL of the pull request.
         merge_method: Merge method (squash, merge, rebase).
         required_checks: List of required checks that must pass.
+        cwd: Repository directory. Defaults to current directory.
 
     Returns:
         True if merge was successful or waiting for checks.
     """
-    import time
+    return run_coroutine_sync(auto_merge_pr_async(pr_url, merge_method, required_checks, cwd=cwd))
+
+
+def auto_merge_prs(
+    pr_urls: List[str],
+    merge_method: str = "squash",
+    required_checks: Optional[List[str]] = None,
+    cwd: Optional[Path] = None,
+) -> List[bool]:
+    """Auto-merge several pull requests, waiting on their checks concurrently.
+
+    Args:
+        pr_urls: URLs of the pull requests.
+        merge_method: Merge method (squash, merge, rebase).
+        required_checks: List of required checks that must pass.
+        cwd: Repository directory. Defaults to current directory.
+
+    Returns:
+        Result of auto_merge_pr for each URL, in order.
+    """
+
+    async def merge_all() -> List[bool]:
+        return list(await asyncio.gather(*(
+            auto_merge_pr_async(url, merge_method, required_checks, cwd=cwd)
+            for url in pr_urls
+        )))
+
+    return run_coroutine_sync(merge_all())
+
+
+async def auto_merge_pr_async(
+    pr_url: str,
+    merge_method: str = "squash",
+    required_checks: Optional[List[str]] = None,
+    cwd: Optional[Path] = None,
+) -> bool:
+    """Auto-merge a pull request when checks pass, without blocking the event loop.
 
+    Args:
+        pr_url: URL of the pull request.
+        merge_method: Merge method (squash, merge, rebase).
+        required_checks: List of required checks that must pass.
+        cwd: Repository directory. Defaults to current directory.
+
+    Returns:
+        True if merge was successful or waiting for checks.
+    """
     # Check if gh CLI is available
-    try:
-        subprocess.run(
-            ["gh", "--version"],
-            capture_output=True,
-            check=True,
-            shell=False,
-        )
-    except (FileNotFoundError, subprocess.CalledProcessError):
+    if _GH_PATH is None:
         logger.warning("GitHub CLI (gh) not found. Cannot auto-merge.")
         return False
 
-    # Extract PR number from URL
-    # URL format: https://github.com/owner/repo/pull/123
-    pr_number = pr_url.split("/")[-1]
+    pr_number, _ = _parse_pr_url(pr_url)
 
     try:
-        # Wait for PR checks to pass
+        # Without required checks, 'gh pr merge --auto' lets GitHub wait for
+        # the branch protection checks server-side, so there is nothing to poll
         if required_checks:
             logger.info(f"Waiting for required checks: {', '.join(required_checks)}")
-            max_wait = 300  # 5 minutes max
-            wait_interval = 10  # Check every 10 seconds
-
-            for _ in range(max_wait // wait_interval):
-                # Get PR status
-                result = subprocess.run(
-                    ["gh", "pr", "view", pr_number, "--json", "statusCheckRollup"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                    shell=False,
-                )
-
-                if result.returncode == 0:
-                    import json
-
-                    data = json.loads(result.stdout)
-                    checks = data.get("statusCheckRollup", [])
-
-                    # Check if all required checks passed
-                    all_passed = True
-                    for required in required_checks:
-                        check_found = False
-                        for check in checks:
-                            if required.lower() in check.get("name", "").lower():
-                                check_found = True
-                                if check.get("conclusion") != "SUCCESS":
-                                    all_passed = False
-                                    break
-                        if not check_found:
-                            all_passed = False
-
-                    if all_passed:
-                        logger.info("All required checks passed!")
-                        break
-                    else:
+            required_lower = [required.lower() for required in required_checks]
+            delay = _CHECK_POLL_INITIAL_DELAY
+            elapsed = 0
+
+            poller = _CheckPoller(pr_url, cwd=cwd)
+            try:
+                while elapsed < _CHECK_POLL_MAX_WAIT:
+                    # Get PR status
+                    checks = await poller.fetch()
+
+                    if checks is not None:
+                        status = _evaluate_checks(checks, required_lower)
+
+                        if status is True:
+                            logger.info("All required checks passed!")
+                            break
+                        if status is False:
+                            logger.error(
+                                f"Required checks failed for PR #{pr_number}, not merging"
+                            )
+                            return False
                         logger.info("Checks still running, waiting...")
-                        time.sleep(wait_interval)
-                else:
-                    time.sleep(wait_interval)
+
+                    await asyncio.sleep(delay)
+                    elapsed += delay
+                    delay = min(delay * 2, _CHECK_POLL_MAX_DELAY)
+            finally:
+                await poller.aclose()
 
         # Merge the PR
         logger.info(f"Merging PR #{pr_number} using {merge_method} merge...")
-        result = subprocess.run(
-            ["gh", "pr", "merge", pr_number, f"--{merge_method}", "--auto"],
-            capture_output=True,
-            text=True,
-            check=False,
-            shell=False,
+        result = await _run_async(
+            [_GH_PATH, "pr", "merge", pr_number, f"--{merge_method}", "--auto"],
+            cwd=cwd,
         )
 
         if result.returncode == 0:
@@ -431,3 +979,30 @@ def auto_merge_pr(
     except Exception as e:
         logger.error(f"Error during auto-merge: {e}")
         return False
+
+
+def _evaluate_checks(checks: List[dict], required_lower: List[str]) -> Optional[bool]:
+    """Evaluate PR status checks against the required ones.
+
+    Args:
+        checks: Entries of the PR's statusCheckRollup.
+        required_lower: Lowercased names of required checks.
+
+    Returns:
+        True if all required checks succeeded, False if any of them failed,
+        None if some are still pending or missing.
+    """
+    all_passed = True
+    for required in required_lower:
+        check_found = False
+        for check in checks:
+            if required in check.get("name", "").lower():
+                check_found = True
+                conclusion = check.get("conclusion")
+                if conclusion == "FAILURE":
+                    return False
+                if conclusion != "SUCCESS":
+                    all_passed = False
+        if not check_found:
+            all_passed = False
+    return True if all_passed else None
@@ -5,10 +5,24 @@ for guided updates.
 
 """
 
+import re
 import sys
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
+# Package selection shortcuts, checked before parsing package numbers
+_QUICK_SELECTIONS = {"": "all", "a": "all", "all": "all", "n": "none", "none": "none"}
+_NUM_RE = re.compile(r"\d+")
+
+# Separator bars, built once instead of on every prompt
+_BAR_EQ50 = "=" * 50
+_BAR_DASH50 = "-" * 50
+_BAR_BANG50 = "!" * 50
+_BAR_EQ60 = "=" * 60
+
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
 
 @dataclass
 class InteractiveConfig:
@@ -60,22 +74,23 @@ class InteractivePrompter:
         if not self.config.enabled:
             return packages
 
-        self._print_banner("Package Selection")
-        print(f"\nFound {len(packages)} package(s) with updates:\n")
-
-        for i, pkg in enumerate(packages, 1):
-            name = pkg.get("name", "unknown")
-            current = pkg.get("version", "unknown")
-            latest = pkg.get("latest_version", "unknown")
-            print(f"  {i}. {name}: {current} → {latest}")
-
-        print("\n" + "-" * 50)
-        print("Options:")
-        print("  [A]ll - Update all packages")
-        print("  [N]one - Skip all updates")
-        print("  [1,2,3] - Select specific packages (comma-separated)")
-        print("  [Enter] - Update all (default)")
-        print("-" * 50 + "\n")
+        out = self._banner_lines("Package Selection")
+        out.append(f"\nFound {len(packages)} package(s) with updates:\n")
+        out.extend(
+            f"  {i}. {pkg.get('name', 'unknown')}: "
+            f"{pkg.get('version', 'unknown')} → {pkg.get('latest_version', 'unknown')}"
+            for i, pkg in enumerate(packages, 1)
+        )
+        out.extend([
+            "\n" + _BAR_DASH50,
+            "Options:",
+            "  [A]ll - Update all packages",
+            "  [N]one - Skip all updates",
+            "  [1,2,3] - Select specific packages (comma-separated)",
+            "  [Enter] - Update all (default)",
+            _BAR_DASH50 + "\n",
+        ])
+        _write_lines(out)
 
         while True:
             try:
@@ -84,32 +99,27 @@ class InteractivePrompter:
                 print("\n\nExiting interactive mode...")
                 sys.exit(0)
 
-            if not response or response == "a" or response == "all":
+            action = _QUICK_SELECTIONS.get(response)
+            if action == "all":
                 self._selected_packages = [p.get("name", "") for p in packages]
                 return packages
 
-            if response == "n" or response == "none":
+            if action == "none":
                 print("No packages will be updated.")
                 return []
 
-            # Try to parse as package numbers
-            try:
-                indices = []
-                for part in response.split(","):
-                    part = part.strip()
-                    if part.isdigit():
-                        idx = int(part) - 1
-                        if 0 <= idx < len(packages):
-                            indices.append(idx)
-
-                if indices:
-                    selected = [packages[i] for i in indices]
-                    self._selected_packages = [p.get("name", "") for p in selected]
-                    return selected
-
-                print("Invalid selection. Please try again.")
-            except (ValueError, IndexError):
-                print("Invalid selection. Please try again.")
+            # Parse as package numbers
+            indices = [
+                idx for idx in (int(m) - 1 for m in _NUM_RE.findall(response))
+                if 0 <= idx < len(packages)
+            ]
+
+            if indices:
+                selected = [packages[i] for i in indices]
+                self._selected_packages = [p.get("name", "") for p in selected]
+                return selected
+
+            print("Invalid selection. Please try again.")
 
     def confirm_update(
         self, package: Dict[str, str]
@@ -129,30 +139,22 @@ class InteractivePrompter:
         current = package.get("version", "unknown")
         latest = package.get("latest_version", "unknown")
 
-        print("\n" + "=" * 50)
-        print(f"Package: {name}")
-        print(f"  Current: {current}")
-        print(f"  Latest:  {latest}")
-        print("=" * 50 + "\n")
-
-        while True:
-            try:
-                response = self._input_func(
-                    f"Update {name} to {latest}? [Y]es/[N]o/[S]kip all: "
-                ).strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                print("\n\nExiting interactive mode...")
-                sys.exit(0)
-
-            if response in ("y", "yes"):
-                return True
-            if response in ("n", "no"):
-                return False
-            if response == "s" and self.config.allow_skip:
-                self._skipped_packages.append(name)
-                return False
-
-            print("Please enter Y, N, or S (if skipping all).")
+        _write_lines([
+            "\n" + _BAR_EQ50,
+            f"Package: {name}",
+            f"  Current: {current}",
+            f"  Latest:  {latest}",
+            _BAR_EQ50 + "\n",
+        ])
+
+        answer = self._ask_yes_no(
+            f"Update {name} to {latest}? [Y]es/[N]o/[S]kip all: ",
+            allow_skip=self.config.allow_skip,
+        )
+        if answer is None:
+            self._skipped_packages.append(name)
+            return False
+        return answer
 
     def prompt_continue_after_failure(
         self,
@@ -173,26 +175,14 @@ class InteractivePrompter:
 
         name = package.get("name", "unknown")
 
-        print("\n" + "!" * 50)
-        print(f"Update failed for {name}")
-        print(f"Error: {error}")
-        print("!" * 50 + "\n")
+        _write_lines([
+            "\n" + _BAR_BANG50,
+            f"Update failed for {name}",
+            f"Error: {error}",
+            _BAR_BANG50 + "\n",
+        ])
 
-        while True:
-            try:
-                response = self._input_func(
-                    "Continue with remaining packages? [Y]es/[N]o: "
-                ).strip().lower()
-            except (EOFError, KeyboardInterrupt):
-                print("\n\nExiting interactive mode...")
-                sys.exit(0)
-
-            if response in ("y", "yes"):
-                return True
-            if response in ("n", "no"):
-                return False
-
-            print("Please enter Y or N.")
+        return bool(self._ask_yes_no("Continue with remaining packages? [Y]es/[N]o: "))
 
     def prompt_continue_after_rollback(
         self,
@@ -211,25 +201,42 @@ class InteractivePrompter:
 
         name = package.get("name", "unknown")
 
-        print("\n" + "!" * 50)
-        print(f"Tests failed for {name} - rolled back to previous version")
-        print("!" * 50 + "\n")
+        _write_lines([
+            "\n" + _BAR_BANG50,
+            f"Tests failed for {name} - rolled back to previous version",
+            _BAR_BANG50 + "\n",
+        ])
+
+        return bool(self._ask_yes_no("Continue with remaining packages? [Y]es/[N]o: "))
 
+    def _ask_yes_no(self, prompt: str, allow_skip: bool = False) -> Optional[bool]:
+        """Ask a yes/no question until a valid answer is given.
+
+        Args:
+            prompt: Prompt to display.
+            allow_skip: Whether "s" (skip) is an accepted answer.
+
+        Returns:
+            Optional[bool]: True for yes, False for no, None for skip.
+        """
         while True:
             try:
-                response = self._input_func(
-                    "Continue with remaining packages? [Y]es/[N]o: "
-                ).strip().lower()
+                response = self._input_func(prompt).strip().lower()
             except (EOFError, KeyboardInterrupt):
                 print("\n\nExiting interactive mode...")
                 sys.exit(0)
 
-            if response in ("y", "yes"):
+            if response in _YES:
                 return True
-            if response in ("n", "no"):
+            if response in _NO:
                 return False
+            if allow_skip and response == "s":
+                return None
 
-            print("Please enter Y or N.")
+            if allow_skip:
+                print("Please enter Y, N, or S (if skipping all).")
+            else:
+                print("Please enter Y or N.")
 
     def summary(self) -> Dict[str, List[str]]:
         """Get summary of interactive selections.
@@ -248,10 +255,32 @@ class InteractivePrompter:
         Args:
             title: Banner title.
         """
-        width = 60
-        print("\n" + "=" * width)
-        print(f"  {title}".center(width))
-        print("=" * width)
+        _write_lines(self._banner_lines(title))
+
+    def _banner_lines(self, title: str) -> List[str]:
+        """Build the lines of a formatted banner.
+
+        Args:
+            title: Banner title.
+
+        Returns:
+            List[str]: Banner lines.
+        """
+        return [
+            "\n" + _BAR_EQ60,
+            f"  {title}".center(len(_BAR_EQ60)),
+            _BAR_EQ60,
+        ]
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write lines to stdout in a single write and flush.
+
+    Args:
+        lines: Lines to write, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def create_interactive_config(
@@ -7,19 +7,69 @@ This module provides pip-tools-like functionality:
 - Diff/change reports before applying updates
 """
 
+import asyncio
+import atexit
+import functools
 import hashlib
-import json
+import logging
+import mmap
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import httpx
+from packaging.version import InvalidVersion, Version
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
+
+from covert import pip_worker
 from covert.logger import get_logger
+from covert.utils import json_dumps, json_loads, run_coroutine_sync
 
 logger = get_logger(__name__)
 
+PYPI_JSON_URL = "https://pypi.org/pypi/{name}/{version}/json"
 
-@dataclass
+# Files smaller than this are hashed from a single read
+SMALL_FILE_HASH_LIMIT = 4 * 1024 * 1024
+
+# Maximum number of concurrent connections to PyPI when fetching hashes
+MAX_HASH_FETCH_CONNECTIONS = 50
+
+# Names and versions safe to use as cache path components
+_CACHE_KEY_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._+!-]*")
+
+# setup.py patterns: install_requires=[...], extras_require={...} and
+# the individual 'extra': [...] items inside extras_require
+_INSTALL_REQUIRES_RE = re.compile(r"install_requires\s*=\s*\[(.*?)\]", re.DOTALL)
+_EXTRAS_REQUIRE_RE = re.compile(r"extras_require\s*=\s*\{(.*?)\}", re.DOTALL)
+_EXTRA_ITEM_RE = re.compile(r"['\"](\w+)['\"]\s*:\s*\[(.*?)\]", re.DOTALL)
+
+# A "name[extras]==version" requirement at the start of a line
+_PIN_LINE_RE = re.compile(
+    r"^[ \t]*([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]\n]*\])?[ \t]*==[ \t]*([^\s;\\]+)",
+    re.MULTILINE,
+)
+
+# Shared keep-alive client for sequential PyPI requests
+_pypi_client: Optional[httpx.Client] = None
+
+# In-process memo of hashes already read from or written to the disk cache
+_hash_memo: Dict[Tuple[str, str], List[str]] = {}
+
+
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class LockFileConfig:
     """Configuration for lock file generation."""
 
@@ -32,7 +82,7 @@ class LockFileConfig:
     annotate: bool = True  # Add comments showing why each package is included
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PackageLock:
     """A locked package entry."""
 
@@ -65,39 +115,31 @@ def parse_pyproject_dependencies(pyproject_path: Path) -> List[str]:
     Raises:
         ValueError: If pyproject.toml is invalid.
     """
-    import tomli
-
-    try:
-        with open(pyproject_path, "rb") as f:
-            data = tomli.load(f)
-    except ImportError:
-        # Fallback to tomllib (Python 3.11+)
-        import tomllib
-
-        with open(pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+    with open(pyproject_path, "rb") as f:
+        data = tomllib.load(f)
 
-    deps = []
+    deps: List[str] = []
+    project = data.get("project", {})
 
-    # Check for project.dependencies
-    if "project" in data and "dependencies" in data["project"]:
-        deps.extend(data["project"]["dependencies"])
+    # project.dependencies
+    deps.extend(project.get("dependencies", ()))
 
-    # Check for project.optional-dependencies (extras)
-    if "project" in data and "optional-dependencies" in data["project"]:
-        for extra, extra_deps in data["project"]["optional-dependencies"].items():
-            deps.extend([f"{dep} [{extra}]" for dep in extra_deps])
+    # project.optional-dependencies (extras)
+    for extra, extra_deps in project.get("optional-dependencies", {}).items():
+        deps.extend(f"{dep} [{extra}]" for dep in extra_deps)
 
-    # Check for setuptools dependencies (legacy)
-    if "project" in data and "requires-python":
-        deps.append(f"python>={data['project']['requires-python']}")
+    # project.requires-python
+    requires_python = project.get("requires-python", "").strip()
+    if requires_python:
+        # Bare versions such as "3.8" are treated as a lower bound
+        if requires_python[0].isdigit():
+            requires_python = f">={requires_python}"
+        deps.append(f"python{requires_python}")
 
-    # Check build-system if present
-    if "build-system" in data:
-        build_deps = data["build-system"].get("requires", [])
-        deps.extend(build_deps)
+    # build-system requirements
+    deps.extend(data.get("build-system", {}).get("requires", ()))
 
-    logger.debug(f"Parsed {len(deps)} dependencies from {pyproject_path}")
+    logger.debug("Parsed %d dependencies from %s", len(deps), pyproject_path)
     return deps
 
 
@@ -118,14 +160,7 @@ def parse_setup_py_dependencies(setup_path: Path) -> List[str]:
     try:
         content = setup_path.read_text()
 
-        # Simple regex to find install_requires
-        import re
-
-        # Match install_requires=[...] or install_requires=(...)
-        pattern = r"install_requires\s*=\s*\[(.*?)\]"
-        matches = re.findall(pattern, content, re.DOTALL)
-
-        for match in matches:
+        for match in _INSTALL_REQUIRES_RE.findall(content):
             # Split by comma and clean up
             for dep in match.split(","):
                 dep = dep.strip().strip("'\"").strip()
@@ -133,14 +168,9 @@ def parse_setup_py_dependencies(setup_path: Path) -> List[str]:
                     deps.append(dep)
 
         # Also check for extras_require
-        extras_pattern = r"extras_require\s*=\s*\{(.*?)\}"
-        extras_matches = re.findall(extras_pattern, content, re.DOTALL)
-
-        for match in extras_matches:
+        for match in _EXTRAS_REQUIRE_RE.findall(content):
             # Extract extra name and its dependencies
-            extra_pattern = r"['\"](\w+)['\"]\s*:\s*\[(.*?)\]"
-            extra_deps = re.findall(extra_pattern, match)
-            for extra_name, extra_dep_list in extra_deps:
+            for extra_name, extra_dep_list in _EXTRA_ITEM_RE.findall(match):
                 for dep in extra_dep_list.split(","):
                     dep = dep.strip().strip("'\"").strip()
                     if dep:
@@ -149,7 +179,7 @@ def parse_setup_py_dependencies(setup_path: Path) -> List[str]:
     except Exception as e:
         logger.warning(f"Failed to parse setup.py: {e}")
 
-    logger.debug(f"Parsed {len(deps)} dependencies from {setup_path}")
+    logger.debug("Parsed %d dependencies from %s", len(deps), setup_path)
     return deps
 
 
@@ -174,13 +204,96 @@ def parse_requirements_in(requirements_path: Path) -> List[str]:
     except Exception as e:
         logger.warning(f"Failed to parse requirements.in: {e}")
 
-    logger.debug(f"Parsed {len(deps)} dependencies from {requirements_path}")
+    logger.debug("Parsed %d dependencies from %s", len(deps), requirements_path)
     return deps
 
 
+def _hash_cache_path(package_name: str, version: str) -> Optional[Path]:
+    """Get the on-disk cache path for a package version's hashes.
+
+    Returns:
+        Cache file path, or None if the name or version is not path-safe.
+    """
+    if not (_CACHE_KEY_RE.fullmatch(package_name) and _CACHE_KEY_RE.fullmatch(version)):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "covert" / "pypi_hashes" / package_name.lower() / f"{version}.json"
+
+
+def _load_cached_hashes(package_name: str, version: str) -> Optional[List[str]]:
+    """Load cached hashes for a package version.
+
+    Released files on PyPI are immutable, so cached entries never expire.
+
+    Returns:
+        Cached hashes, or None on a cache miss.
+    """
+    key = (package_name.lower(), version)
+    if key in _hash_memo:
+        return list(_hash_memo[key])
+
+    cache_path = _hash_cache_path(package_name, version)
+    if cache_path is None:
+        return None
+
+    try:
+        hashes = json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(hashes, list):
+        return None
+
+    _hash_memo[key] = hashes
+    return list(hashes)
+
+
+def _store_cached_hashes(package_name: str, version: str, hashes: List[str]) -> None:
+    """Store hashes for a package version in the on-disk cache.
+
+    Empty results are not cached, as they usually mean the fetch failed.
+    """
+    if not hashes:
+        return
+
+    _hash_memo[(package_name.lower(), version)] = list(hashes)
+
+    cache_path = _hash_cache_path(package_name, version)
+    if cache_path is None:
+        return
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent runs never read a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json_dumps(hashes))
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug("Could not cache hashes for %s==%s: %s", package_name, version, e)
+
+
+def _get_pypi_client() -> httpx.Client:
+    """Get the shared PyPI client, creating it on first use.
+
+    Reusing one client keeps the TLS connection to PyPI alive across calls
+    instead of paying a new handshake per package.
+    """
+    global _pypi_client
+    if _pypi_client is None:
+        _pypi_client = httpx.Client(
+            transport=httpx.HTTPTransport(retries=3),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=10,
+            headers={"Accept": "application/json"},
+        )
+        atexit.register(_pypi_client.close)
+    return _pypi_client
+
+
 def get_package_hashes(package_name: str, version: str) -> List[str]:
     """Get hashes for a specific package version from PyPI.
 
+    Results are cached on disk under ``$XDG_CACHE_HOME/covert/pypi_hashes``.
+
     Args:
         package_name: Name of the package.
         version: Version string.
@@ -188,33 +301,124 @@ def get_package_hashes(package_name: str, version: str) -> List[str]:
     Returns:
         List of hash strings (sha256).
     """
-    import urllib.request
+    cached = _load_cached_hashes(package_name, version)
+    if cached is not None:
+        return cached
 
-    hashes = []
+    hashes: List[str] = []
 
     try:
         # Get package info from PyPI JSON API
-        url = f"https://pypi.org/pypi/{package_name}/{version}/json"
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read())
-
-            # Get hashes from files
-            for file_info in data.get("urls", []):
-                if file_info.get("digests", {}).get("sha256"):
-                    hashes.append(f"sha256:{file_info['digests']['sha256']}")
+        url = PYPI_JSON_URL.format(name=package_name, version=version)
+        response = _get_pypi_client().get(url)
+        response.raise_for_status()
+        hashes = _extract_hashes(json_loads(response.content))
 
     except Exception as e:
-        logger.debug(f"Could not get hashes for {package_name}=={version}: {e}")
+        logger.debug("Could not get hashes for %s==%s: %s", package_name, version, e)
 
+    _store_cached_hashes(package_name, version, hashes)
     return hashes
 
 
+def fetch_package_hashes(
+    packages: List[Tuple[str, str]],
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[Tuple[str, str], List[str]]:
+    """Get hashes for many package versions from PyPI concurrently.
+
+    Versions already in the hash cache are not requested again. The rest
+    share one connection pool, so N packages cost roughly one round-trip
+    of wall-clock time instead of N.
+
+    Args:
+        packages: List of (package_name, version) tuples.
+        transport: Optional HTTP transport (for testing).
+
+    Returns:
+        Dictionary mapping (package_name, version) to hash strings. Packages
+        whose hashes could not be fetched map to an empty list.
+    """
+    results: Dict[Tuple[str, str], List[str]] = {}
+    missing: List[Tuple[str, str]] = []
+    for package in dict.fromkeys(packages):
+        cached = _load_cached_hashes(*package)
+        if cached is not None:
+            results[package] = cached
+        else:
+            missing.append(package)
+
+    if missing:
+        fetched = run_coroutine_sync(_fetch_hashes_async(missing, transport))
+        for package, hashes in fetched.items():
+            _store_cached_hashes(*package, hashes)
+        results.update(fetched)
+
+    return results
+
+
+async def _fetch_hashes_async(
+    packages: List[Tuple[str, str]],
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[Tuple[str, str], List[str]]:
+    limits = httpx.Limits(max_connections=MAX_HASH_FETCH_CONNECTIONS)
+    async with httpx.AsyncClient(
+        limits=limits,
+        timeout=10,
+        headers={"Accept": "application/json"},
+        transport=transport,
+    ) as client:
+
+        async def fetch(package_name: str, version: str) -> List[str]:
+            try:
+                response = await client.get(
+                    PYPI_JSON_URL.format(name=package_name, version=version)
+                )
+                response.raise_for_status()
+                return _extract_hashes(json_loads(response.content))
+            except (httpx.HTTPError, ValueError) as e:
+                logger.debug("Could not get hashes for %s==%s: %s", package_name, version, e)
+                return []
+
+        results = await asyncio.gather(*(fetch(name, version) for name, version in packages))
+
+    return dict(zip(packages, results))
+
+
+def _extract_hashes(data: Dict[str, Any]) -> List[str]:
+    """Extract sha256 hashes from a PyPI JSON API release response."""
+    hashes = []
+    for file_info in data.get("urls", []):
+        if file_info.get("digests", {}).get("sha256"):
+            hashes.append(f"sha256:{file_info['digests']['sha256']}")
+    return hashes
+
+
+# Header written at the top of generated lock files
+_LOCK_FILE_HEADER = (
+    "# Generated by Covert\n"
+    "# DO NOT EDIT - manually maintained lockfiles may be overwritten\n"
+    "# Use 'covert --upgrade' to update\n"
+)
+
+# Write buffer size for generated lock files
+LOCK_FILE_WRITE_BUFFER = 1 << 20
+
+# requirements.txt entry layouts, keyed by (has_hash, has_annotation)
+_REQUIREMENT_LINE_TEMPLATES = {
+    (False, False): "{name}=={version}",
+    (True, False): "{name}=={version} \\\n    --hash={hash}",
+    (False, True): "{name}=={version}\n    # {annotation}",
+    (True, True): "{name}=={version} \\\n    --hash={hash}\n    # {annotation}",
+}
+
+
 def generate_requirements_line(
     package_name: str,
     version: str,
     include_hash: bool = False,
     annotation: Optional[str] = None,
+    hashes: Optional[List[str]] = None,
 ) -> str:
     """Generate a requirements.txt line for a package.
 
@@ -223,25 +427,26 @@ def generate_requirements_line(
         version: Package version.
         include_hash: Whether to include hash.
         annotation: Comment explaining why package is included.
+        hashes: Precomputed hashes. Fetched from PyPI when include_hash is
+            set and no hashes are given.
 
     Returns:
         Formatted requirements line.
     """
-    line = f"{package_name}=={version}"
+    hash_part = None
 
     # Add hash if requested
     if include_hash:
-        hashes = get_package_hashes(package_name, version)
+        if hashes is None:
+            hashes = get_package_hashes(package_name, version)
         if hashes:
             # Use hash from first file
             hash_part = hashes[0]
-            line = f"{line} \\\n    --hash={hash_part}"
-
-    # Add annotation as comment
-    if annotation:
-        line = f"{line}\n    # {annotation}"
 
-    return line
+    template = _REQUIREMENT_LINE_TEMPLATES[hash_part is not None, bool(annotation)]
+    return template.format(
+        name=package_name, version=version, hash=hash_part, annotation=annotation
+    )
 
 
 def generate_lock_file(
@@ -256,40 +461,51 @@ def generate_lock_file(
         output_path: Path to write the lock file.
         config: Lock file configuration.
     """
-    lines: List[str] = []
-
-    # Header comment
-    lines.append("# Generated by Covert")
-    lines.append(f"# DO NOT EDIT - manually maintained lockfiles may be overwritten")
-    lines.append(f"# Use 'covert --upgrade' to update")
-    lines.append("")
-
-    for pkg in packages:
-        name = pkg["name"]
-        version = pkg.get("latest_version", pkg.get("version", ""))
-
-        # Get annotation if enabled
-        annotation = None
-        if config.annotate:
-            # Check if it's a new package or upgrade
-            if pkg.get("version") != pkg.get("latest_version"):
-                annotation = f"via {name} (was {pkg.get('version', 'unknown')})"
-
-        line = generate_requirements_line(
-            name,
-            version,
-            include_hash=config.generate_hashes,
-            annotation=annotation,
-        )
-        lines.append(line)
-        lines.append("")
+    # Fetch all hashes concurrently up front
+    all_hashes: Dict[Tuple[str, str], List[str]] = {}
+    if config.generate_hashes:
+        all_hashes = fetch_package_hashes([
+            (pkg["name"], pkg.get("latest_version", pkg.get("version", "")))
+            for pkg in packages
+        ])
 
-    # Write to file
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text("\n".join(lines))
 
-    logger.info(f"Generated lock file: {output_path}")
+    # Stream entries into a temporary file and swap it in atomically
+    tmp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", buffering=LOCK_FILE_WRITE_BUFFER) as f:
+            f.write(_LOCK_FILE_HEADER)
+
+            for pkg in packages:
+                name = pkg["name"]
+                version = pkg.get("latest_version", pkg.get("version", ""))
+
+                # Get annotation if enabled
+                annotation = None
+                if config.annotate:
+                    # Check if it's a new package or upgrade
+                    if pkg.get("version") != pkg.get("latest_version"):
+                        annotation = f"via {name} (was {pkg.get('version', 'unknown')})"
+
+                line = generate_requirements_line(
+                    name,
+                    version,
+                    include_hash=config.generate_hashes,
+                    annotation=annotation,
+                    hashes=all_hashes.get((name, version)),
+                )
+                f.write("\n")
+                f.write(line)
+                f.write("\n")
+
+        tmp_path.replace(output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info("Generated lock file: %s", output_path)
 
 
 def compute_file_hash(file_path: Path) -> str:
@@ -301,11 +517,38 @@ def compute_file_hash(file_path: Path) -> str:
     Returns:
         Hex-encoded SHA256 hash.
     """
-    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size < SMALL_FILE_HASH_LIMIT:
+            # Typical lockfiles: one read and one hash call
+            return hashlib.sha256(f.read()).hexdigest()
+
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Hash the whole mapped file in a single call
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def _parse_pin(line: str) -> Optional[Tuple[str, str]]:
+    """Split a pinned requirement line into name and version.
+
+    Environment markers (``; ...``) and trailing options or line
+    continuations (``--hash=...``, ``\\``) are dropped.
+
+    Args:
+        line: Stripped requirement line, e.g. "requests==2.31.0".
+
+    Returns:
+        Tuple of (name, version), or None if the line is not pinned with "==".
+    """
+    name, sep, rest = line.partition("==")
+    if not sep:
+        return None
+    version = rest.partition(";")[0].split(None, 1)
+    return name.strip(), version[0] if version else ""
 
 
 def load_existing_lock_file(lock_path: Path) -> Dict[str, PackageLock]:
@@ -327,18 +570,19 @@ def load_existing_lock_file(lock_path: Path) -> Dict[str, PackageLock]:
     try:
         with open(lock_path) as f:
             for line in f:
-                line = line.strip()
-
                 # Skip comments and empty lines
+                if line[0] in "#\n":
+                    continue
+                line = line.strip()
                 if not line or line.startswith("#"):
                     continue
 
                 # Parse package==version
-                if "==" in line:
-                    # Handle multi-line with backslash
-                    base = line.split("==")[0]
-                    version_part = line.split("==")[1].split(";")[0].strip()
-                    packages[base] = PackageLock(name=base, version=version_part)
+                pin = _parse_pin(line)
+                if pin is not None:
+                    # Names recur across old/new lock files and diffs
+                    name = sys.intern(pin[0])
+                    packages[name] = PackageLock(name=name, version=pin[1])
 
     except Exception as e:
         logger.warning(f"Could not parse existing lock file: {e}")
@@ -360,51 +604,41 @@ def compute_diff(
         LockFileDiff with all changes.
     """
     diff = LockFileDiff()
+    seen: Set[str] = set()
 
-    new_names = {pkg["name"] for pkg in new_packages}
-    old_names = set(old_packages.keys())
-
-    # Added packages
     for pkg in new_packages:
-        if pkg["name"] not in old_names:
-            diff.added.append(PackageLock(
-                name=pkg["name"],
-                version=pkg.get("latest_version", pkg.get("version", "")),
-            ))
+        name = pkg["name"]
+        seen.add(name)
+        new_version = pkg.get("latest_version", pkg.get("version", ""))
 
-    # Removed packages
-    for name in old_names:
-        if name not in new_names:
-            diff.removed.append(old_packages[name])
+        old_pkg = old_packages.get(name)
+        if old_pkg is None:
+            diff.added.append(PackageLock(name=sys.intern(name), version=new_version))
+            continue
 
-    # Upgraded/Downgraded
-    for pkg in new_packages:
-        name = pkg["name"]
-        if name in old_names:
-            old_pkg = old_packages[name]
-            new_version = pkg.get("latest_version", pkg.get("version", ""))
+        old_v = _parse_version(old_pkg.version)
+        new_v = _parse_version(new_version)
+        if old_v is None or new_v is None:
+            continue
+        if new_v > old_v:
+            diff.upgraded.append((old_pkg, PackageLock(name=name, version=new_version)))
+        elif new_v < old_v:
+            diff.downgraded.append((old_pkg, PackageLock(name=name, version=new_version)))
 
-            # Simple version comparison
-            from packaging.version import parse as parse_version
-            try:
-                old_v = parse_version(old_pkg.version)
-                new_v = parse_version(new_version)
-                if new_v > old_v:
-                    diff.upgraded.append((
-                        old_pkg,
-                        PackageLock(name=name, version=new_version),
-                    ))
-                elif new_v < old_v:
-                    diff.downgraded.append((
-                        old_pkg,
-                        PackageLock(name=name, version=new_version),
-                    ))
-            except Exception:
-                pass
+    diff.removed.extend(pkg for name, pkg in old_packages.items() if name not in seen)
 
     return diff
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Optional[Version]:
+    """Parse a version string, returning None if it is not PEP 440 compliant."""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
 def format_diff_text(diff: LockFileDiff) -> str:
     """Format diff as human-readable text.
 
@@ -453,31 +687,34 @@ def format_diff_text(diff: LockFileDiff) -> str:
     return "\n".join(lines)
 
 
+# Recognized dependency input files, in priority order, mapped to input type
+_INPUT_FILES = {
+    "pyproject.toml": "pyproject",
+    "setup.py": "setup.py",
+    "requirements.in": "requirements.in",
+}
+
+
 def find_input_files() -> Dict[str, Path]:
     """Find available input files in current directory.
 
     Returns:
         Dictionary mapping input type to file path.
     """
-    inputs: Dict[str, Path] = {}
     cwd = Path.cwd()
 
-    # Check for pyproject.toml
-    pyproject = cwd / "pyproject.toml"
-    if pyproject.exists():
-        inputs["pyproject"] = pyproject
-
-    # Check for setup.py
-    setup_py = cwd / "setup.py"
-    if setup_py.exists():
-        inputs["setup.py"] = setup_py
+    # One directory scan instead of a stat() per candidate
+    with os.scandir(cwd) as entries:
+        found = {
+            entry.name for entry in entries
+            if entry.name in _INPUT_FILES and entry.is_file()
+        }
 
-    # Check for requirements.in
-    req_in = cwd / "requirements.in"
-    if req_in.exists():
-        inputs["requirements.in"] = req_in
-
-    return inputs
+    return {
+        input_type: cwd / file_name
+        for file_name, input_type in _INPUT_FILES.items()
+        if file_name in found
+    }
 
 
 @dataclass
@@ -493,7 +730,7 @@ class SyncConfig:
     pip_args: str = ""  # Additional pip arguments
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SyncAction:
     """Represents a sync action to be performed."""
 
@@ -506,9 +743,34 @@ class SyncAction:
 def get_installed_packages() -> Dict[str, str]:
     """Get currently installed packages.
 
+    Reads distribution metadata in-process with importlib.metadata, falling
+    back to ``pip list`` if it is unavailable or if the ``pip`` on PATH
+    manages a different environment than covert's own.
+
     Returns:
         Dictionary mapping package names to versions.
     """
+    try:
+        from importlib.metadata import distributions
+    except ImportError:
+        return _get_installed_packages_pip()
+
+    if not pip_worker.pip_uses_this_interpreter():
+        return _get_installed_packages_pip()
+
+    installed: Dict[str, str] = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        # Normalize name; the first distribution found on sys.path wins, like pip
+        installed.setdefault(name.lower().replace("_", "-"), dist.version)
+
+    return installed
+
+
+def _get_installed_packages_pip() -> Dict[str, str]:
+    """Get currently installed packages from ``pip list``."""
     import subprocess
 
     installed: Dict[str, str] = {}
@@ -517,15 +779,12 @@ def get_installed_packages() -> Dict[str, str]:
         result = subprocess.run(
             ["pip", "list", "--format=json"],
             capture_output=True,
-            text=True,
             shell=False,
             timeout=30,
         )
 
         if result.returncode == 0:
-            import json
-
-            packages = json.loads(result.stdout)
+            packages = json_loads(result.stdout)
             for pkg in packages:
                 # Normalize name (lowercase, replace underscores with hyphens)
                 name = pkg["name"].lower().replace("_", "-")
@@ -549,28 +808,10 @@ def parse_requirements_file(req_path: Path) -> Dict[str, str]:
     packages: Dict[str, str] = {}
 
     try:
-        with open(req_path) as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
-
-                # Skip flags like --hash=sha256:...
-                if line.startswith("--"):
-                    continue
-
-                # Parse package==version
-                if "==" in line:
-                    # Handle extras like package[extra]==version
-                    name = line.split("==")[0].split("[")[0]
-                    version = line.split("==")[1].split(";")[0].strip()
-
-                    # Normalize name
-                    name = name.lower().replace("_", "-")
-
-                    packages[name] = version
+        # Scan the whole file at once; comments and flag lines such as
+        # --hash=sha256:... never match the pattern
+        for name, version in _PIN_LINE_RE.findall(req_path.read_text()):
+            packages[sys.intern(name.lower().replace("_", "-"))] = version
 
     except Exception as e:
         logger.warning(f"Could not parse requirements file: {e}")
@@ -688,19 +929,26 @@ def sync_environment(
     if config is None:
         config = SyncConfig(requirements_files=requirements_files)
 
-    logger.info(f"Syncing environment with {len(requirements_files)} requirements file(s)")
+    logger.info("Syncing environment with %d requirements file(s)", len(requirements_files))
 
-    # Parse all requirements files
-    required: Dict[str, str] = {}
+    # Parse all requirements files concurrently; later files still take
+    # precedence because results are merged in the given order
+    req_paths = []
     for req_file in requirements_files:
         req_path = Path(req_file)
         if not req_path.exists():
             logger.warning(f"Requirements file not found: {req_file}")
             continue
+        req_paths.append(req_path)
 
-        packages = parse_requirements_file(req_path)
-        required.update(packages)
-        logger.debug(f"Loaded {len(packages)} packages from {req_file}")
+    required: Dict[str, str] = {}
+    if req_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(req_paths))) as executor:
+            for req_path, packages in zip(
+                req_paths, executor.map(parse_requirements_file, req_paths)
+            ):
+                required.update(packages)
+                logger.debug("Loaded %d packages from %s", len(packages), req_path)
 
     if not required:
         logger.error("No packages to sync")
@@ -708,7 +956,7 @@ def sync_environment(
 
     # Get currently installed packages
     installed = get_installed_packages()
-    logger.debug(f"Found {len(installed)} installed packages")
+    logger.debug("Found %d installed packages", len(installed))
 
     # Compute actions
     actions = compute_sync_actions(required, installed, config)
@@ -718,36 +966,40 @@ def sync_environment(
         return True
 
     # Show what will happen
-    logger.info(format_sync_actions(actions))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(format_sync_actions(actions))
 
     if config.dry_run:
         logger.info("Dry-run mode - no changes will be made")
         return True
 
-    # Perform actions
-    from covert.pip_interface import install_package, uninstall_package
+    # Perform actions, batching each phase into a single pip invocation
+    from covert.pip_interface import install_packages, uninstall_packages
 
     success = True
 
     # First uninstall (to handle version conflicts)
-    for action in actions:
-        if action.action_type == "uninstall":
-            try:
-                logger.info(f"Uninstalling {action.package_name}")
-                uninstall_package(action.package_name)
-            except Exception as e:
-                logger.error(f"Failed to uninstall {action.package_name}: {e}")
-                success = False
-
-    # Then install/upgrade
-    for action in actions:
-        if action.action_type in ["install", "upgrade"]:
-            try:
-                logger.info(f"Installing {action.package_name}=={action.new_version}")
-                install_package(action.package_name, version=action.new_version)
-            except Exception as e:
-                logger.error(f"Failed to install {action.package_name}: {e}")
-                success = False
+    to_uninstall = [a.package_name for a in actions if a.action_type == "uninstall"]
+    if to_uninstall:
+        try:
+            uninstall_packages(to_uninstall)
+        except Exception as e:
+            logger.error(f"Failed to uninstall {', '.join(to_uninstall)}: {e}")
+            success = False
+
+    # Then install/upgrade; requirements files pin the full dependency
+    # closure, so pip's resolver can be skipped
+    to_install = [
+        (a.package_name, a.new_version)
+        for a in actions
+        if a.action_type in ["install", "upgrade"]
+    ]
+    if to_install:
+        try:
+            install_packages(to_install, no_deps=True)
+        except Exception as e:
+            logger.error(f"Failed to install {', '.join(name for name, _ in to_install)}: {e}")
+            success = False
 
     if success:
         logger.info("Environment synced successfully")
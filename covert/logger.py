@@ -5,17 +5,25 @@ and output destinations (file and console). It uses Rich for enhanced
 terminal output when available.
 """
 
-import json
+import functools
 import logging
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 from covert.config import LoggingConfig
 from covert.exceptions import ConfigError
+from covert.utils import json_dumps
+
+# Configured level names mapped to logging constants
+_LEVEL_MAP = MappingProxyType({
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+})
 
 
 def setup_logging(
@@ -52,7 +60,9 @@ def setup_logging(
 
     # Set up console handler
     if logging_config.console:
-        console_handler = _get_console_handler(logging_config.format, level)
+        console_handler = _get_console_handler(
+            logging_config.format, level, show_locals=verbose_level >= 2
+        )
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
@@ -66,6 +76,7 @@ def setup_logging(
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def _get_log_level(config_level: str, verbose_level: int) -> int:
     """Determine the effective log level.
 
@@ -76,15 +87,7 @@ def _get_log_level(config_level: str, verbose_level: int) -> int:
     Returns:
         int: Logging level constant.
     """
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
-    base_level = level_map.get(config_level.upper(), logging.INFO)
+    base_level = _LEVEL_MAP.get(config_level.upper(), logging.INFO)
 
     # Adjust based on verbose level
     if verbose_level >= 2:
@@ -113,27 +116,40 @@ def _get_formatter(format_type: str) -> logging.Formatter:
         )
 
 
-def _get_console_handler(format_type: str, level: int) -> logging.Handler:
+def _get_console_handler(
+    format_type: str,
+    level: int,
+    show_locals: bool = False,
+) -> logging.Handler:
     """Get a console handler based on the format type.
 
+    Rich is only used when stderr is a terminal; CI runs, pipes and
+    redirected output get a plain stream handler without importing Rich.
+
     Args:
         format_type: Format type ("simple", "detailed", or "json").
         level: Log level for the handler.
+        show_locals: Include local variables in Rich tracebacks.
 
     Returns:
         logging.Handler: Configured console handler.
     """
     if format_type == "json":
         handler = logging.StreamHandler(sys.stdout)
+    elif not sys.stderr.isatty():
+        handler = logging.StreamHandler(sys.stderr)
     else:
         # Use Rich for enhanced terminal output
+        from rich.console import Console
+        from rich.logging import RichHandler
+
         console = Console(stderr=True)
         handler = RichHandler(  # type: ignore[assignment]
             console=console,
             show_time=format_type == "detailed",
             show_path=False,
             rich_tracebacks=True,
-            tracebacks_show_locals=True,
+            tracebacks_show_locals=show_locals,
         )
 
     handler.setLevel(level)
@@ -171,6 +187,13 @@ def _get_file_handler(file_path: str, level: int) -> Optional[logging.Handler]:
         return None
 
 
+# Field layout of JsonFormatter output; values are JSON-encoded before filling
+_JSON_RECORD_TEMPLATE = (
+    '{"timestamp":%s,"level":%s,"logger":%s,"message":%s,'
+    '"module":%s,"function":%s,"line":%d}'
+)
+
+
 class JsonFormatter(logging.Formatter):
     """JSON log formatter for structured logging.
 
@@ -187,8 +210,22 @@ class JsonFormatter(logging.Formatter):
         Returns:
             str: JSON-formatted log message.
         """
+        timestamp = self.formatTime(record, self.datefmt)
+
+        # Common case: fill a fixed template instead of building a dict
+        if not record.exc_info and not hasattr(record, "extra"):
+            return _JSON_RECORD_TEMPLATE % (
+                json_dumps(timestamp),
+                json_dumps(record.levelname),
+                json_dumps(record.name),
+                json_dumps(record.getMessage()),
+                json_dumps(record.module),
+                json_dumps(record.funcName),
+                record.lineno,
+            )
+
         log_data = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            "timestamp": timestamp,
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -205,12 +242,16 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data["extra"] = record.extra
 
-        return json.dumps(log_data)
+        return json_dumps(log_data)
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name.
 
+    Results are memoized; loggers are never destroyed, so the cached
+    instance is always the one ``logging.getLogger`` would return.
+
     Args:
         name: Logger name, typically __name__ of the calling module.
 
@@ -5,16 +5,100 @@ update status via various channels (Slack,).
 
 """
 
-import json
+import base64
+import functools
+import random
 import smtplib
-import urllib.request
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
+from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional
+from email.policy import compat32
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlencode
 
+import httpx
+
+from covert.utils import json_dumps
+
+# Attempts per Slack/webhook post and the base of the exponential backoff between them
+_POST_ATTEMPTS = 3
+_BACKOFF_BASE = 0.5
+# Longest Retry-After delay honored on HTTP 429
+_MAX_RETRY_AFTER = 30.0
+# Slack accepts about one message per second per workspace
+_SLACK_MIN_INTERVAL = 1.0
+
+# Accent color for each message severity, shared by Slack and email
+_SEVERITY_COLORS = {
+    "success": "#36a64f",
+    "warning": "#ff9800",
+    "error": "#f44336",
+    "info": "#2196f3",
+}
+_DEFAULT_COLOR = _SEVERITY_COLORS["info"]
+
+# Policy for the email package fallback: the default header handling, but
+# with the CRLF line endings SMTP requires
+_SMTP_COMPAT32 = compat32.clone(linesep="\r\n")
+
+# Raw multipart/alternative email, filled in by NotificationManager._render_email.
+# Both parts are base64 encoded, and base64 lines never start with "--", so a
+# fixed boundary cannot collide with message content.
+_EMAIL_BOUNDARY = "===============covert-notification=="
+_EMAIL_TEMPLATE = (
+    'Content-Type: multipart/alternative; boundary="{boundary}"\r\n'
+    "MIME-Version: 1.0\r\n"
+    "Subject: {subject}\r\n"
+    "From: {sender}\r\n"
+    "To: {to}\r\n"
+    "\r\n"
+    "--{boundary}\r\n"
+    'Content-Type: text/plain; charset="utf-8"\r\n'
+    "MIME-Version: 1.0\r\n"
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "{text}"
+    "--{boundary}\r\n"
+    'Content-Type: text/html; charset="utf-8"\r\n'
+    "MIME-Version: 1.0\r\n"
+    "Content-Transfer-Encoding: base64\r\n"
+    "\r\n"
+    "{html}"
+    "--{boundary}--\r\n"
+)
+
+# HTML email layout, filled in by NotificationManager._format_html_message
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
+        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+        .header {{ background-color: {color}; color: white; padding: 20px; border-radius: 5px 5px 0 0; }}
+        .content {{ background-color: #f9f9f9; padding: 20px; border-radius: 0 0 5px 5px; }}
+        .footer {{ color: #666; font-size: 12px; margin-top: 20px; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h2>{title}</h2>
+        </div>
+        <div class="content">
+            <pre style="white-space: pre-wrap; font-family: Arial, sans-serif;">{body}</pre>
+        </div>
+        <div class="footer">
+            Sent by Covert Updater at {timestamp}
+        </div>
+    </div>
+</body>
+</html>"""
+
 
 @dataclass
 class NotificationConfig:
@@ -73,11 +157,25 @@ class NotificationMessage:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    @functools.cached_property
+    def _webhook_json(self) -> bytes:
+        """Webhook payload, encoded once and reused across sends."""
+        return json_dumps({
+            "title": self.title,
+            "body": self.body,
+            "severity": self.severity,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
+        }).encode("utf-8")
+
 
 class NotificationManager:
     """Manager for sending notifications through various channels.
 
     This class handles sending notifications via Slack, email, and webhooks.
+    Messages are delivered on a background worker so that network latency
+    stays off the caller's path; call ``flush()`` or ``close()`` to wait for
+    delivery.
     """
 
     def __init__(self, config: NotificationConfig):
@@ -88,37 +186,118 @@ class NotificationManager:
         """
         self.config = config
         self._sent_count: int = 0
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._channel_executor: Optional[ThreadPoolExecutor] = None
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        self._slack_lock = threading.Lock()
+        self._next_slack_ts: float = 0.0
+        self._pending: List[Future[bool]] = []
+        # Sender for each supported notification channel
+        self._dispatchers: Dict[str, Callable[[NotificationMessage], bool]] = {
+            "slack": self._send_slack,
+            "email": self._send_email,
+            "webhook": self._send_webhook,
+        }
 
     def send(self, message: NotificationMessage) -> bool:
-        """Send a notification message.
+        """Queue a notification message for delivery.
 
         Args:
             message: Message to send.
 
         Returns:
-            bool: True if all configured channels sent successfully.
+            bool: True once the message is queued. Use ``flush()`` to learn
+                whether delivery succeeded.
         """
         if not self.config.enabled:
             return True
 
-        success = True
+        if self._executor is None:
+            # One worker keeps messages in order and the SMTP connection single-user
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="covert-notify")
+        self._pending.append(self._executor.submit(self._dispatch, message))
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued notifications to be delivered.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely.
+
+        Returns:
+            bool: True if every queued message was sent on all its channels
+                within the timeout.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return True
+
+        done, not_done = wait(pending, timeout=timeout)
+        # Keep unfinished messages so a later flush can still wait for them
+        self._pending.extend(not_done)
+        return not not_done and all(future.result() for future in done)
+
+    def _dispatch(self, message: NotificationMessage) -> bool:
+        """Send a message to every configured channel.
 
-        for channel in self.config.channels:
-            if channel == "slack":
-                if not self._send_slack(message):
-                    success = False
-            elif channel == "email":
-                if not self._send_email(message):
-                    success = False
-            elif channel == "webhook":
-                if not self._send_webhook(message):
-                    success = False
+        Args:
+            message: Message to send.
 
+        Returns:
+            bool: True if all configured channels sent successfully.
+        """
+        dispatchers = self._dispatchers
+        senders = [
+            dispatchers[channel] for channel in self.config.channels if channel in dispatchers
+        ]
+
+        if len(senders) > 1:
+            # Channels are independent, so wait for the slowest rather than the sum
+            if self._channel_executor is None:
+                self._channel_executor = ThreadPoolExecutor(
+                    max_workers=len(self._dispatchers), thread_name_prefix="covert-notify-channel"
+                )
+            futures = [self._channel_executor.submit(sender, message) for sender in senders]
+            results = [future.result() for future in futures]
+        else:
+            # Build the full list so a failed channel does not skip the rest
+            results = [sender(message) for sender in senders]
+
+        success = all(results)
         if success:
             self._sent_count += 1
 
         return success
 
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Deliver queued notifications and release resources.
+
+        Args:
+            timeout: Maximum time to wait for queued messages in seconds.
+
+        Returns:
+            bool: Result of flushing the queued notifications.
+        """
+        delivered = self.flush(timeout)
+
+        for executor in (self._executor, self._channel_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._executor = self._channel_executor = None
+
+        with self._smtp_lock:
+            self._drop_smtp()
+
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+        return delivered
+
     def summary(self) -> Dict[str, int]:
         """Get summary of notifications sent.
 
@@ -149,8 +328,11 @@ class NotificationManager:
             vulnerabilities: Number of vulnerabilities found.
 
         Returns:
-            bool: True if notification sent successfully.
+            bool: True once the notification is queued.
         """
+        if not self.config.enabled:
+            return True
+
         if failed > 0 or rolled_back > 0:
             severity = "error"
         elif vulnerabilities > 0:
@@ -198,19 +380,11 @@ Timestamp: {datetime.now().isoformat()}"""
         if not self.config.slack_webhook:
             return False
 
-        # Map severity to Slack colors
-        color_map = {
-            "success": "#36a64f",
-            "warning": "#ff9800",
-            "error": "#f44336",
-            "info": "#2196f3",
-        }
-
         payload = {
             "username": self.config.slack_username,
             "attachments": [
                 {
-                    "color": color_map.get(message.severity, "#2196f3"),
+                    "color": _SEVERITY_COLORS.get(message.severity, _DEFAULT_COLOR),
                     "title": message.title,
                     "text": message.body,
                     "footer": "Covert Updater",
@@ -223,14 +397,13 @@ Timestamp: {datetime.now().isoformat()}"""
             payload["channel"] = self.config.slack_channel
 
         try:
-            data = json.dumps(payload).encode("utf-8")
-            req = urllib.request.Request(
+            data = json_dumps(payload).encode("utf-8")
+            return self._post_json(
                 self.config.slack_webhook,
-                data=data,
-                headers={"Content-Type": "application/json"},
+                data,
+                {"Content-Type": "application/json"},
+                throttle=True,
             )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return response.status == 200
         except Exception:
             return False
 
@@ -250,42 +423,109 @@ Timestamp: {datetime.now().isoformat()}"""
             return False
 
         try:
+            msg = self._render_email(message)
+
+            # Send over the cached connection
+            with self._smtp_lock:
+                server = self._get_smtp()
+                try:
+                    server.sendmail(
+                        self.config.email_from,
+                        self.config.email_to,
+                        msg,
+                    )
+                except (smtplib.SMTPServerDisconnected, OSError):
+                    self._drop_smtp()
+                    raise
+
+            return True
+        except Exception:
+            return False
+
+    def _render_email(self, message: NotificationMessage) -> bytes:
+        """Render a message as a raw multipart email.
+
+        Fills _EMAIL_TEMPLATE directly instead of assembling MIME objects.
+        Non-ASCII addresses need header encoding the template cannot do, so
+        they fall back to the email package.
+
+        Args:
+            message: Message to render.
+
+        Returns:
+            bytes: Email ready for ``sendmail``.
+        """
+        to = ", ".join(self.config.email_to)
+        html_body = self._format_html_message(message)
+
+        if not (self.config.email_from + to).isascii():
             msg = MIMEMultipart("alternative")
             msg["Subject"] = message.title
             msg["From"] = self.config.email_from
-            msg["To"] = ", ".join(self.config.email_to)
+            msg["To"] = to
+            msg.attach(MIMEText(message.body, "plain"))
+            msg.attach(MIMEText(html_body, "html"))
+            return msg.as_bytes(policy=_SMTP_COMPAT32)
 
-            # Plain text part
-            text_part = MIMEText(message.body, "plain")
-            msg.attach(text_part)
+        subject = " ".join(message.title.splitlines())
+        if not subject.isascii():
+            subject = Header(subject, "utf-8").encode(linesep="\r\n")
 
-            # HTML part
-            html_body = self._format_html_message(message)
-            html_part = MIMEText(html_body, "html")
-            msg.attach(html_part)
+        return _EMAIL_TEMPLATE.format(
+            boundary=_EMAIL_BOUNDARY,
+            subject=subject,
+            sender=self.config.email_from,
+            to=to,
+            text=_base64_lines(message.body),
+            html=_base64_lines(html_body),
+        ).encode("utf-8")
 
-            # Connect to SMTP server and send
-            server = smtplib.SMTP(
-                self.config.email_smtp_host,
-                self.config.email_smtp_port,
-            )
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Get a live SMTP connection, reusing the cached one when possible.
+
+        The caller must hold ``_smtp_lock``.
+
+        Returns:
+            smtplib.SMTP: Connected and authenticated SMTP client.
+        """
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_smtp()
+
+        server = smtplib.SMTP(
+            self.config.email_smtp_host,
+            self.config.email_smtp_port,
+        )
 
+        try:
             if self.config.email_use_tls:
                 server.starttls()
 
             if self.config.email_username and self.config.email_password:
                 server.login(self.config.email_username, self.config.email_password)
+        except Exception:
+            server.close()
+            raise
 
-            server.sendmail(
-                self.config.email_from,
-                self.config.email_to,
-                msg.as_string(),
-            )
-            server.quit()
+        self._smtp = server
+        return server
 
-            return True
-        except Exception:
-            return False
+    def _drop_smtp(self) -> None:
+        """Quit and forget the cached SMTP connection.
+
+        The caller must hold ``_smtp_lock``.
+        """
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
 
     def _send_webhook(self, message: NotificationMessage) -> bool:
         """Send notification to a generic webhook.
@@ -299,27 +539,93 @@ Timestamp: {datetime.now().isoformat()}"""
         if not self.config.webhook_url:
             return False
 
-        payload = {
-            "title": message.title,
-            "body": message.body,
-            "severity": message.severity,
-            "timestamp": message.timestamp.isoformat(),
-            "metadata": message.metadata,
-        }
-
         try:
-            data = json.dumps(payload).encode("utf-8")
+            data = message._webhook_json
             headers = {"Content-Type": "application/json", **self.config.webhook_headers}
-            req = urllib.request.Request(
-                self.config.webhook_url,
-                data=data,
-                headers=headers,
-            )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return response.status < 400
+            return self._post_json(self.config.webhook_url, data, headers)
         except Exception:
             return False
 
+    def _post_json(
+        self,
+        url: str,
+        data: bytes,
+        headers: Dict[str, str],
+        throttle: bool = False,
+    ) -> bool:
+        """POST a JSON body, retrying transient failures.
+
+        Connection errors and 5xx responses are retried with exponential
+        backoff; 429 responses wait for the server's Retry-After delay.
+
+        Args:
+            url: URL to post to.
+            data: Encoded JSON body.
+            headers: Request headers.
+            throttle: Whether to keep posts at least _SLACK_MIN_INTERVAL apart.
+
+        Returns:
+            bool: True if the server answered with a 2xx status.
+        """
+        for attempt in range(_POST_ATTEMPTS):
+            if throttle:
+                self._throttle_slack()
+
+            delay: Optional[float] = None
+            try:
+                response = self._get_http().post(url, content=data, headers=headers)
+            except httpx.TransportError:
+                pass
+            else:
+                if response.is_success:
+                    return True
+                if response.status_code == 429:
+                    delay = _retry_after(response)
+                elif response.status_code < 500:
+                    return False
+
+            if attempt == _POST_ATTEMPTS - 1:
+                break
+            if delay is None:
+                delay = _BACKOFF_BASE * 2 ** attempt + random.uniform(0, 0.1)
+            self._sleep(delay)
+
+        return False
+
+    def _throttle_slack(self) -> None:
+        """Wait until the next Slack post is allowed."""
+        with self._slack_lock:
+            now = time.monotonic()
+            delay = self._next_slack_ts - now
+            self._next_slack_ts = max(now, self._next_slack_ts) + _SLACK_MIN_INTERVAL
+        if delay > 0:
+            self._sleep(delay)
+
+    def _sleep(self, seconds: float) -> None:
+        """Pause the delivery worker between attempts.
+
+        Args:
+            seconds: Time to wait in seconds.
+        """
+        time.sleep(seconds)
+
+    def _get_http(self) -> httpx.Client:
+        """Get the shared HTTP client, creating it on first use.
+
+        Keeping one client keeps the connections to Slack and webhook hosts
+        alive across notifications.
+
+        Returns:
+            httpx.Client: HTTP client for Slack and webhook requests.
+        """
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                    timeout=30,
+                )
+            return self._http
+
     def _format_html_message(self, message: NotificationMessage) -> str:
         """Format message as HTML.
 
@@ -329,40 +635,43 @@ Timestamp: {datetime.now().isoformat()}"""
         Returns:
             str: HTML formatted message.
         """
-        severity_colors = {
-            "success": "#36a64f",
-            "warning": "#ff9800",
-            "error": "#f44336",
-            "info": "#2196f3",
-        }
+        return _HTML_TEMPLATE.format(
+            color=_SEVERITY_COLORS.get(message.severity, _DEFAULT_COLOR),
+            title=message.title,
+            body=message.body,
+            timestamp=message.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
-        color = severity_colors.get(message.severity, "#2196f3")
 
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: {color}; color: white; padding: 20px; border-radius: 5px 5px 0 0; }}
-        .content {{ background-color: #f9f9f9; padding: 20px; border-radius: 0 0 5px 5px; }}
-        .footer {{ color: #666; font-size: 12px; margin-top: 20px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h2>{message.title}</h2>
-        </div>
-        <div class="content">
-            <pre style="white-space: pre-wrap; font-family: Arial, sans-serif;">{message.body}</pre>
-        </div>
-        <div class="footer">
-            Sent by Covert Updater at {message.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-        </div>
-    </div>
-</body>
-</html>"""
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Read the Retry-After delay of a rate-limited response.
+
+    Args:
+        response: HTTP 429 response.
+
+    Returns:
+        Optional[float]: Delay in seconds capped at _MAX_RETRY_AFTER, or None
+            if the header is missing or not a number of seconds.
+    """
+    try:
+        return min(max(float(response.headers["Retry-After"]), 0.0), _MAX_RETRY_AFTER)
+    except (KeyError, ValueError):
+        return None
+
+
+def _base64_lines(text: str) -> str:
+    """Base64 encode text as a MIME body with CRLF line endings.
+
+    ``sendmail`` sends bytes as-is, so the line endings must already be the
+    CRLF that SMTP requires.
+
+    Args:
+        text: Text to encode as UTF-8.
+
+    Returns:
+        str: Base64 lines, each terminated by CRLF.
+    """
+    return base64.encodebytes(text.encode("utf-8")).decode("ascii").replace("\n", "\r\n")
 
 
 def create_notification_config(
@@ -5,50 +5,372 @@ installing, and uninstalling packages. All commands are executed without
 shell=True for security.
 """
 
+import functools
 import hashlib
+import importlib
+import importlib.metadata
 import json
+import logging
+import os
+import re
+import shlex
+import site
 import subprocess
+import sys
+import sysconfig
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from packaging.tags import Tag, sys_tags
+from packaging.utils import InvalidWheelFilename, canonicalize_name, parse_wheel_filename
+from packaging.version import InvalidVersion, Version
+
+from covert import pip_worker
 from covert.exceptions import PipError, ValidationError
 from covert.logger import get_logger
-from covert.utils import sanitize_package_name, validate_version
+from covert.utils import json_dumps, json_loads, sanitize_package_name, validate_version
 
 logger = get_logger(__name__)
 
+# How long environment listings stay valid when nothing was (un)installed
+ENVIRONMENT_CACHE_TTL = 30.0
+
+# How long PyPI lookups stay valid on disk, overridable with COVERT_PIP_CACHE_TTL
+PIP_CACHE_TTL = 3600.0
+
+# Cached results: (sys.prefix, function name, *args) -> (timestamp, result)
+_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+# Functions whose on-disk results describe the environment and go stale on (un)install
+_environment_listings: Set[str] = set()
+
+# Installed versions keyed by canonical name, built by get_package_versions: (timestamp, index)
+_installed_cache: Optional[Tuple[float, Dict[str, str]]] = None
+
+# Directories already created this session, so repeat writes skip mkdir
+_ensured_dirs: Set[Path] = set()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Summary line pip prints after a successful install
+_INSTALLED_RE = re.compile(r"^Successfully installed (.+)$", re.MULTILINE)
+
+# Pinned "name==version" lines of pip freeze output
+_FREEZE_RE = re.compile(r"^([A-Za-z0-9_.\-]+)==(\S+)\s*$", re.MULTILINE)
+
+# Fixed pip invocations, built once
+_CMD_OUTDATED = ("pip", "list", "--outdated", "--format=json")
+_CMD_LIST = ("pip", "list", "--format=json")
+_CMD_FREEZE = ("pip", "freeze")
+
+# Makes pip write a JSON install report to stdout instead of its progress log
+_REPORT_OPTIONS = ("--quiet", "--report", "-")
+
+
+class CommandResult(subprocess.CompletedProcess):
+    """Result of a command run by run_secure_command.
+
+    Output is captured as bytes and only decoded to text when ``stdout`` or
+    ``stderr`` is first read, so callers that only check the return code or
+    parse JSON from ``stdout_bytes`` never pay for decoding.
+
+    Attributes:
+        args: The command that was run.
+        returncode: Exit status of the command.
+        stdout_bytes: Raw captured stdout, or None if not captured.
+        stderr_bytes: Raw captured stderr, or None if not captured.
+    """
+
+    def __init__(
+        self,
+        args: List[str],
+        returncode: int,
+        stdout_bytes: Optional[bytes] = None,
+        stderr_bytes: Optional[bytes] = None,
+    ):
+        """Initialize the command result.
+
+        Args:
+            args: The command that was run.
+            returncode: Exit status of the command.
+            stdout_bytes: Raw captured stdout.
+            stderr_bytes: Raw captured stderr.
+        """
+        # CompletedProcess.__init__ would assign stdout/stderr eagerly
+        self.args = args
+        self.returncode = returncode
+        self.stdout_bytes = stdout_bytes
+        self.stderr_bytes = stderr_bytes
+
+    @functools.cached_property
+    def stdout(self) -> Optional[str]:  # type: ignore[override]
+        """Captured stdout decoded as UTF-8."""
+        return _decode(self.stdout_bytes)
+
+    @functools.cached_property
+    def stderr(self) -> Optional[str]:  # type: ignore[override]
+        """Captured stderr decoded as UTF-8."""
+        return _decode(self.stderr_bytes)
+
+
+def _decode(output: Optional[bytes]) -> Optional[str]:
+    """Decode captured command output as UTF-8 regardless of the locale."""
+    return output.decode("utf-8", "replace") if output is not None else None
+
+
+def _ttl_cache(ttl: float, persist: bool = False, environment: bool = True) -> Callable[[_F], _F]:
+    """Cache a pip query's result for ``ttl`` seconds.
+
+    Results are keyed on the active environment and the call arguments,
+    copied on every hit so callers cannot mutate the cached value, and
+    dropped by _invalidate_cache whenever packages are installed or
+    uninstalled. Persisted results are also kept on disk for
+    _pip_cache_ttl() seconds so later runs skip the network round-trip;
+    on-disk environment listings are only reused while site-packages is
+    unchanged, so installs made outside covert are noticed. A False
+    result is a miss that may be a network error, so it is never cached.
+
+    Args:
+        ttl: Seconds a result stays valid in memory.
+        persist: Whether to also cache the result on disk.
+        environment: Whether the result depends on the installed packages,
+            so its on-disk entry must be dropped on (un)install.
+
+    Returns:
+        Callable: Decorator for pip query functions.
+    """
+
+    def decorator(func: _F) -> _F:
+        if persist and environment:
+            _environment_listings.add(func.__name__)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (
+                (sys.prefix, func.__name__)
+                + tuple(str(arg) for arg in args)
+                + tuple(f"{name}={value}" for name, value in sorted(kwargs.items()))
+            )
+            cached = _cache.get(key)
+            now = time.monotonic()
+            if cached is None or now - cached[0] > ttl:
+                state = _environment_state() if persist and environment else None
+                use_disk = persist and (state is not None or not environment)
+                result = _read_disk_cache(key, state) if use_disk else None
+                if result is None:
+                    result = func(*args, **kwargs)
+                    if result is False:
+                        return result
+                    if use_disk:
+                        _write_disk_cache(key, result, state)
+                cached = (now, result)
+                _cache[key] = cached
+            return _copy_result(cached[1])
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _copy_result(result: Any) -> Any:
+    """Copy a cached listing so callers cannot mutate the cached one."""
+    if isinstance(result, list):
+        return [dict(item) for item in result]
+    return result
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory and its parents once per session.
+
+    Args:
+        path: Directory to create.
+
+    Raises:
+        OSError: If the directory cannot be created.
+    """
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+def _pip_cache_dir() -> Path:
+    """Get the directory holding on-disk pip query results."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "covert" / "pip"
+
+
+def _pip_cache_ttl() -> float:
+    """Get how long on-disk pip query results stay valid, in seconds."""
+    try:
+        return float(os.environ.get("COVERT_PIP_CACHE_TTL", PIP_CACHE_TTL))
+    except ValueError:
+        return PIP_CACHE_TTL
+
+
+def _disk_cache_path(key: Tuple[str, ...]) -> Path:
+    """Get the on-disk cache file for a cache key."""
+    digest = hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()
+    return _pip_cache_dir() / f"{digest}.json"
+
+
+def _environment_state() -> Optional[str]:
+    """Fingerprint the installed packages by their site-packages mtimes.
+
+    Installing, upgrading or removing a package adds or removes metadata
+    directories, which updates the modification time of the directory
+    holding them.
+
+    Returns:
+        Optional[str]: Fingerprint, or None if pip manages an environment
+            other than covert's own and its site-packages is unknown.
+    """
+    if not pip_worker.pip_uses_this_interpreter():
+        return None
+    paths = sysconfig.get_paths()
+    site_dirs = dict.fromkeys([paths["purelib"], paths["platlib"]])
+    if site.ENABLE_USER_SITE:
+        site_dirs[site.getusersitepackages()] = None
+    mtimes = []
+    for site_dir in site_dirs:
+        try:
+            mtimes.append(str(os.stat(site_dir).st_mtime_ns))
+        except OSError:
+            mtimes.append("-")
+    return ":".join(mtimes)
+
+
+def _read_disk_cache(key: Tuple[str, ...], state: Optional[str] = None) -> Any:
+    """Read an unexpired result from the on-disk cache.
+
+    Args:
+        key: Cache key.
+        state: Environment fingerprint the entry must have been written with.
+
+    Returns:
+        Any: Cached result, or None on a miss, expired or stale entry.
+    """
+    try:
+        entry = json_loads(_disk_cache_path(key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or time.time() - entry.get("timestamp", 0) > _pip_cache_ttl():
+        return None
+    if entry.get("environment") != state:
+        return None
+    return entry.get("payload")
+
+
+def _write_disk_cache(key: Tuple[str, ...], payload: Any, state: Optional[str] = None) -> None:
+    """Store a result in the on-disk cache, ignoring write failures."""
+    cache_path = _disk_cache_path(key)
+    try:
+        _ensure_dir(cache_path.parent)
+        # Write atomically so concurrent runs never read a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        entry = {"timestamp": time.time(), "environment": state, "payload": payload}
+        tmp_path.write_text(json_dumps(entry))
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.debug("Could not cache pip result: %s", e)
+
+
+def _invalidate_cache() -> None:
+    """Drop cached environment listings after the environment changed."""
+    global _installed_cache
+    _cache.clear()
+    _installed_cache = None
+    # The worker's interpreter may hold stale metadata for the old environment
+    pip_worker.restart_worker()
+    for name in _environment_listings:
+        try:
+            _disk_cache_path((sys.prefix, name)).unlink()
+        except OSError:
+            pass
+
+
+def clear_pip_cache() -> None:
+    """Drop every cached pip query result, in memory and on disk.
+
+    Used by ``covert --refresh-cache`` to force fresh PyPI lookups.
+    """
+    _invalidate_cache()
+    cache_dir = _pip_cache_dir()
+    if not cache_dir.is_dir():
+        return
+    for path in cache_dir.glob("*.json"):
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.debug("Could not remove %s: %s", path, e)
+
+
+@functools.lru_cache(maxsize=128)
+def _split_command(command: str) -> Tuple[str, ...]:
+    """Split a command string into argv using shell-like quoting rules.
+
+    Args:
+        command: Command string.
+
+    Returns:
+        Tuple[str, ...]: Command arguments.
+    """
+    return tuple(shlex.split(command))
+
 
 def run_secure_command(
-    command: Union[str, List[str]],
+    command: Union[str, Sequence[str]],
     capture_output: bool = True,
     check: bool = False,
     timeout: Optional[int] = None,
-) -> subprocess.CompletedProcess:
+) -> CommandResult:
     """Execute command securely without shell=True.
 
     This function is a security-hardened wrapper around subprocess.run
     that never uses shell=True to prevent command injection attacks.
+    Read-only pip commands without a timeout are served by the persistent
+    pip worker when it is available, and by a fresh pip process otherwise.
 
     Args:
-        command: Command as string (split automatically) or list.
+        command: Command as string (split with shell-like quoting) or sequence.
         capture_output: Whether to capture stdout/stderr.
         check: Whether to raise an exception if command returns non-zero.
         timeout: Maximum time to wait for command completion in seconds.
 
     Returns:
-        CompletedProcess: Result of command execution.
+        CommandResult: Result of command execution, with lazily decoded output.
 
     Raises:
         PipError: If command execution fails.
     """
     if isinstance(command, str):
         # Split command safely
-        cmd_list = command.split()
+        cmd_list = list(_split_command(command))
     else:
-        cmd_list = command
+        cmd_list = list(command)
 
-    logger.debug(f"Executing command: {' '.join(cmd_list)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing command: %s", " ".join(cmd_list))
+
+    if capture_output and timeout is None and pip_worker.handles(cmd_list):
+        worker_result = pip_worker.run_pip(cmd_list[1:])
+        if worker_result is not None:
+            return _check_result(CommandResult(cmd_list, *worker_result), check)
 
     try:
         result = subprocess.run(
@@ -57,7 +379,9 @@ def run_secure_command(
             check=False,
             stdout=subprocess.PIPE if capture_output else None,
             stderr=subprocess.PIPE if capture_output else None,
-            text=True,
+            # Security: never leak inherited descriptors into pip or its
+            # build backends; PEP 446 only covers ones Python creates itself
+            close_fds=True,
             timeout=timeout,
         )
     except subprocess.TimeoutExpired as e:
@@ -70,18 +394,36 @@ def run_secure_command(
         logger.error(f"Failed to execute command: {e}")
         raise PipError("Failed to execute command") from e
 
-    if check and result.returncode != 0:
-        error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-        logger.error(f"Command failed with return code {result.returncode}: {error_msg}")
+    return _check_result(CommandResult(cmd_list, result.returncode, result.stdout, result.stderr), check)
+
+
+def _check_result(command_result: CommandResult, check: bool) -> CommandResult:
+    """Raise for a failed command when the caller asked for it.
+
+    Args:
+        command_result: Result of the command.
+        check: Whether a non-zero return code is an error.
+
+    Returns:
+        CommandResult: The result, unchanged.
+
+    Raises:
+        PipError: If check is set and the command failed.
+    """
+    if check and command_result.returncode != 0:
+        error_msg = command_result.stderr.strip() if command_result.stderr else "Unknown error"
+        logger.error(f"Command failed with return code {command_result.returncode}: {error_msg}")
         raise PipError(f"Command failed: {error_msg}")
 
-    return result
+    return command_result
 
 
 def get_package_hash(package_name: str, version: str) -> Optional[str]:
     """Get SHA256 hash of a package from PyPI.
 
-    Downloads the package temporarily and computes its hash.
+    Reads the digest PyPI publishes for the distribution pip would pick
+    (the best matching wheel, else the sdist). If the JSON API is
+    unavailable, downloads the package temporarily and computes its hash.
     This is used for secure verification before installation.
 
     Args:
@@ -91,44 +433,123 @@ def get_package_hash(package_name: str, version: str) -> Optional[str]:
     Returns:
         Optional[str]: SHA256 hash of the package, or None if unable to get.
     """
-    logger.debug(f"Computing hash for {package_name}=={version}")
+    published = _get_published_hash(package_name, version)
+    if published:
+        return published
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        # Download package to temp directory
-        download_cmd = [
-            "pip", "download",
-            f"{package_name}=={version}",
-            "--no-deps",
-            "--dest", tmpdir,
-        ]
-        result = run_secure_command(download_cmd, timeout=60)
+        downloaded = _download_and_hash(package_name, version, Path(tmpdir))
+        return downloaded[0] if downloaded else None
 
-        if result.returncode != 0:
-            logger.warning(f"Could not download {package_name}=={version} for hashing")
-            return None
-
-        # Find downloaded file
-        tmp_path = Path(tmpdir)
-        wheel_or_tar = None
-        for f in tmp_path.iterdir():
-            if f.suffix in (".whl", ".tar.gz", ".zip"):
-                wheel_or_tar = f
-                break
-
-        if not wheel_or_tar:
-            logger.warning(f"No package file found for {package_name}=={version}")
-            return None
-
-        # Compute hash
-        sha256_hash = hashlib.sha256()
-        try:
-            with open(wheel_or_tar, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
-            return f"sha256:{sha256_hash.hexdigest()}"
-        except OSError as e:
-            logger.warning(f"Could not hash {wheel_or_tar}: {e}")
-            return None
+
+def _download_and_hash(
+    package_name: str,
+    version: str,
+    dest: Path,
+) -> Optional[Tuple[str, Path]]:
+    """Download a package distribution and compute its SHA256 hash.
+
+    Args:
+        package_name: Name of the package.
+        version: Specific version to download.
+        dest: Directory to download into; the file is left there.
+
+    Returns:
+        Optional[Tuple[str, Path]]: Hash (``sha256:<hex>``) and path of the
+            downloaded file, or None if unable to download or hash it.
+    """
+    logger.debug("Computing hash for %s==%s", package_name, version)
+
+    download_cmd = [
+        "pip", "download",
+        f"{package_name}=={version}",
+        "--no-deps",
+        "--dest", str(dest),
+    ]
+    result = run_secure_command(download_cmd, timeout=60)
+
+    if result.returncode != 0:
+        logger.warning(f"Could not download {package_name}=={version} for hashing")
+        return None
+
+    # Find downloaded file
+    wheel_or_tar = None
+    for f in dest.iterdir():
+        if f.suffix in (".whl", ".zip") or f.name.endswith(".tar.gz"):
+            wheel_or_tar = f
+            break
+
+    if not wheel_or_tar:
+        logger.warning(f"No package file found for {package_name}=={version}")
+        return None
+
+    # Compute hash; the read loop runs in C (file_digest or mmap)
+    from covert.lockfile import compute_file_hash
+
+    try:
+        return f"sha256:{compute_file_hash(wheel_or_tar)}", wheel_or_tar
+    except OSError as e:
+        logger.warning(f"Could not hash {wheel_or_tar}: {e}")
+        return None
+
+
+def _get_published_hash(package_name: str, version: str) -> Optional[str]:
+    """Get the PyPI-published SHA256 of the distribution pip would install.
+
+    Args:
+        package_name: Name of the package.
+        version: Specific version to get hash for.
+
+    Returns:
+        Optional[str]: "sha256:<digest>", or None if it cannot be determined.
+    """
+    from covert.lockfile import PYPI_JSON_URL, _get_pypi_client
+
+    try:
+        response = _get_pypi_client().get(PYPI_JSON_URL.format(name=package_name, version=version))
+        response.raise_for_status()
+        files = json_loads(response.content).get("urls", [])
+    except Exception as e:
+        logger.debug("Could not read PyPI metadata for %s==%s: %s", package_name, version, e)
+        return None
+
+    best_rank: Optional[int] = None
+    best_digest: Optional[str] = None
+    tag_ranks = _supported_tag_ranks()
+
+    for file_info in files:
+        digest = file_info.get("digests", {}).get("sha256")
+        if not digest:
+            continue
+
+        if file_info.get("packagetype") == "bdist_wheel":
+            try:
+                wheel_tags = parse_wheel_filename(file_info.get("filename", ""))[3]
+            except InvalidWheelFilename:
+                continue
+            ranks = [tag_ranks[tag] for tag in wheel_tags if tag in tag_ranks]
+            if not ranks:
+                continue
+            rank = min(ranks)
+        elif file_info.get("packagetype") == "sdist":
+            # Only used when no compatible wheel exists
+            rank = len(tag_ranks)
+        else:
+            continue
+
+        if best_rank is None or rank < best_rank:
+            best_rank, best_digest = rank, digest
+
+    return f"sha256:{best_digest}" if best_digest else None
+
+
+@functools.lru_cache(maxsize=1)
+def _supported_tag_ranks() -> Dict[Tag, int]:
+    """Map each wheel tag supported by this interpreter to its priority."""
+    ranks: Dict[Tag, int] = {}
+    for rank, tag in enumerate(sys_tags()):
+        ranks.setdefault(tag, rank)
+    return ranks
 
 
 def verify_and_install_package(
@@ -140,8 +561,14 @@ def verify_and_install_package(
 ) -> Dict[str, str]:
     """Install a package with hash verification.
 
-    Downloads the package, computes its hash, verifies against expected hash,
-    and only installs if verification passes.
+    Downloads the package once, checks its hash against the digests PyPI
+    publishes for the release, and installs that same file offline with
+    ``--require-hashes`` so pip cannot fetch a different artifact. Only the
+    package's own file is verified: its dependencies are then resolved by a
+    normal ``pip install`` of the same pinned spec, which leaves the
+    verified package in place and adds or upgrades whatever it requires.
+    Without a version there is nothing to verify against and the package is
+    installed normally.
 
     Args:
         package_name: Name of the package to install.
@@ -155,7 +582,8 @@ def verify_and_install_package(
 
     Raises:
         ValidationError: If package name or version is invalid.
-        PipError: If installation fails or hash verification fails.
+        PipError: If installation fails, no published hashes are available,
+            or hash verification fails.
     """
     sanitized_name = sanitize_package_name(package_name)
 
@@ -167,36 +595,70 @@ def verify_and_install_package(
     if version:
         package_spec = f"{sanitized_name}=={version}"
 
-    logger.info(f"Installing package with hash verification: {package_spec}")
-
-    # Get expected hash
-    expected_hash = get_package_hash(sanitized_name, version) if version else None
-
-    # Build install command with hash verification
-    install_cmd = ["pip", "install", package_spec]
-
-    if expected_hash:
-        install_cmd.extend(["--require-hashes", "--no-input"])
+    logger.info("Installing package with hash verification: %s", package_spec)
 
+    options = []
     if upgrade:
-        install_cmd.append("--upgrade")
-
+        options.append("--upgrade")
     if pre_release:
-        install_cmd.append("--pre")
+        options.append("--pre")
+
+    if not version:
+        if _pip_supports_report():
+            options.extend(_REPORT_OPTIONS)
+        result = run_secure_command(["pip", "install", package_spec] + options, timeout=timeout)
+    else:
+        from covert.lockfile import get_package_hashes
+
+        published = get_package_hashes(sanitized_name, version)
+        if not published:
+            logger.error(f"No published hashes found for {package_spec}")
+            raise PipError("No published hashes available for verification")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            downloaded = _download_and_hash(sanitized_name, version, Path(tmpdir))
+            if not downloaded:
+                raise PipError("Could not download package for hash verification")
+            file_hash, file_path = downloaded
+
+            if file_hash not in published:
+                logger.error(f"Hash mismatch for {file_path.name}: {file_hash}")
+                raise PipError("Hash verification failed")
+
+            requirements = Path(tmpdir) / "requirements.txt"
+            requirements.write_text(f"{package_spec} --hash={file_hash}\n")
+
+            # Install the verified file itself; --no-index keeps pip from re-downloading
+            install_cmd = [
+                "pip", "install",
+                "--no-index",
+                "--find-links", tmpdir,
+                "--require-hashes",
+                "--no-deps",
+                "--no-input",
+                "-r", str(requirements),
+            ]
+            result = run_secure_command(install_cmd + options, timeout=timeout)
 
-    result = run_secure_command(install_cmd, timeout=timeout)
+        if result.returncode == 0:
+            # The pinned spec is already satisfied, so this only pulls in dependencies
+            result = run_secure_command(
+                ["pip", "install", "--no-input", package_spec] + options, timeout=timeout
+            )
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() if result.stderr else "Unknown error"
         logger.error(f"Failed to install {package_spec}: {error_msg}")
         raise PipError("Failed to install package")
 
+    _invalidate_cache()
+
     # Get the installed version
-    installed_version = version
+    installed_version = version or _installed_versions(result).get(sanitized_name)
     if not installed_version:
-        installed_version = get_package_version(sanitized_name)
+        installed_version = _get_package_version_unchecked(sanitized_name)
 
-    logger.info(f"Successfully installed {sanitized_name}=={installed_version}")
+    logger.info("Successfully installed %s==%s", sanitized_name, installed_version)
 
     return {
         "name": sanitized_name,
@@ -204,6 +666,55 @@ def verify_and_install_package(
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _pip_supports_report() -> bool:
+    """Whether the installed pip can write a JSON install report (pip 22.2+).
+
+    Returns:
+        bool: True if ``pip install --report`` is available.
+    """
+    try:
+        return Version(importlib.metadata.version("pip")) >= Version("22.2")
+    except (importlib.metadata.PackageNotFoundError, InvalidVersion):
+        return False
+
+
+def _installed_versions(result: CommandResult) -> Dict[str, str]:
+    """Extract the versions a successful ``pip install`` run installed.
+
+    Reads the JSON install report when pip wrote one to stdout, and the
+    "Successfully installed" line otherwise.
+
+    Args:
+        result: Result of the ``pip install`` run.
+
+    Returns:
+        Dict[str, str]: Installed versions keyed by canonical package name.
+            Packages that were already satisfied are not included.
+    """
+    if isinstance(result.stdout_bytes, bytes) and result.stdout_bytes.lstrip().startswith(b"{"):
+        try:
+            report = json_loads(result.stdout_bytes)
+            return {
+                canonicalize_name(item["metadata"]["name"]): item["metadata"]["version"]
+                for item in report.get("install", [])
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.debug("Could not parse pip install report")
+
+    match = _INSTALLED_RE.search(result.stdout or "")
+    if not match:
+        return {}
+
+    versions: Dict[str, str] = {}
+    for item in match.group(1).split():
+        name, _, version = item.rpartition("-")
+        if name:
+            versions[canonicalize_name(name)] = version
+    return versions
+
+
+@_ttl_cache(ENVIRONMENT_CACHE_TTL, persist=True)
 def get_outdated_packages() -> List[Dict[str, str]]:
     """Get list of outdated packages using pip.
 
@@ -217,24 +728,24 @@ def get_outdated_packages() -> List[Dict[str, str]]:
     """
     logger.info("Checking for outdated packages...")
 
-    command = ["pip", "list", "--outdated", "--format=json"]
-    result = run_secure_command(command)
+    result = run_secure_command(_CMD_OUTDATED)
 
     if result.returncode != 0:
         # No outdated packages is not an error
+        stderr = result.stderr or ""
         if (
-            "WARNING: No packages found" in result.stderr
-            or "WARNING: Could not find a version" in result.stderr
+            "WARNING: No packages found" in stderr
+            or "WARNING: Could not find a version" in stderr
         ):
             logger.info("No outdated packages found")
             return []
         raise PipError("Failed to get outdated packages")
 
     try:
-        packages: List[Dict[str, str]] = json.loads(result.stdout)
-        logger.info(f"Found {len(packages)} outdated package(s)")
+        packages: List[Dict[str, str]] = json_loads(result.stdout_bytes or b"")
+        logger.info("Found %d outdated package(s)", len(packages))
         return packages
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"Failed to parse pip output: {e}")
         raise PipError("Failed to parse pip output") from e
 
@@ -249,6 +760,9 @@ def install_package(
 ) -> Dict[str, str]:
     """Install a package using pip.
 
+    Thin wrapper around install_packages for a single package, except that
+    hash verification goes through verify_and_install_package.
+
     Args:
         package_name: Name of the package to install.
         version: Specific version to install (e.g., "2.31.0").
@@ -264,18 +778,6 @@ def install_package(
         ValidationError: If package name or version is invalid.
         PipError: If installation fails.
     """
-    sanitized_name = sanitize_package_name(package_name)
-
-    if version and not validate_version(version):
-        raise ValidationError(f"Invalid version format: {version}")
-
-    # Build package specifier
-    package_spec = sanitized_name
-    if version:
-        package_spec = f"{sanitized_name}=={version}"
-
-    logger.info(f"Installing package: {package_spec}")
-
     # If hash verification is enabled, use it
     if verify_hash and version:
         return verify_and_install_package(
@@ -286,32 +788,125 @@ def install_package(
             timeout=timeout,
         )
 
-    command = ["pip", "install", package_spec]
+    return install_packages(
+        [(package_name, version)],
+        timeout=timeout,
+        upgrade=upgrade,
+        pre_release=pre_release,
+    )[0]
 
-    if upgrade:
-        command.append("--upgrade")
 
+def install_packages(
+    packages: List[Tuple[str, Optional[str]]],
+    timeout: Optional[int] = None,
+    no_deps: bool = False,
+    upgrade: bool = False,
+    pre_release: bool = False,
+) -> List[Dict[str, str]]:
+    """Install several packages with a single pip invocation.
+
+    One resolver run covers the whole set, sharing index fetches and
+    downloads instead of resolving each package from scratch.
+
+    Args:
+        packages: List of (package_name, version) tuples; version may be None.
+        timeout: Maximum time to wait for installation in seconds.
+        no_deps: Skip dependency resolution. Only safe when the list already
+            pins the full dependency closure, e.g. from a lock file.
+        upgrade: Whether to upgrade packages that are already installed.
+        pre_release: Whether to include pre-release versions.
+
+    Returns:
+        List[Dict[str, str]]: Name and version of each package; for packages
+            without a requested version, the version that was installed.
+
+    Raises:
+        ValidationError: If a package name or version is invalid.
+        PipError: If installation fails.
+    """
+    specs = []
+    installed = []
+    for package_name, version in packages:
+        sanitized_name = sanitize_package_name(package_name)
+        if version and not validate_version(version):
+            raise ValidationError(f"Invalid version format: {version}")
+        specs.append(f"{sanitized_name}=={version}" if version else sanitized_name)
+        installed.append({"name": sanitized_name, "version": version or ""})
+
+    if not specs:
+        return []
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Installing %d package(s): %s", len(specs), " ".join(specs))
+
+    cmd = ["pip", "install", "--no-deps"] if no_deps else ["pip", "install"]
+    cmd += specs
+    if upgrade:
+        cmd.append("--upgrade")
     if pre_release:
-        command.append("--pre")
+        cmd.append("--pre")
+    # Only unpinned packages need pip to tell us what it installed
+    if _pip_supports_report() and any(not package["version"] for package in installed):
+        cmd.extend(_REPORT_OPTIONS)
 
-    result = run_secure_command(command, timeout=timeout)
+    result = run_secure_command(cmd, timeout=timeout)
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-        logger.error(f"Failed to install {package_spec}: {error_msg}")
-        raise PipError("Failed to install package")
+        logger.error(f"Failed to install packages: {error_msg}")
+        raise PipError("Failed to install packages")
 
-    # Get the installed version
-    installed_version = version
-    if not installed_version:
-        installed_version = get_package_version(sanitized_name)
+    _invalidate_cache()
 
-    logger.info(f"Successfully installed {sanitized_name}=={installed_version}")
+    # Fill in versions pip chose, scanning the environment once for any it did not report
+    unversioned = [package for package in installed if not package["version"]]
+    if unversioned:
+        reported = _installed_versions(result)
+        for package in unversioned:
+            package["version"] = reported.get(package["name"], "")
+        unversioned = [package for package in unversioned if not package["version"]]
+    if unversioned:
+        versions = get_package_versions([package["name"] for package in unversioned])
+        for package in unversioned:
+            package["version"] = versions[package["name"]] or ""
 
-    return {
-        "name": sanitized_name,
-        "version": installed_version or "",
-    }
+    logger.info("Successfully installed %d package(s)", len(specs))
+
+    return installed
+
+
+def uninstall_packages(
+    package_names: List[str],
+    timeout: Optional[int] = None,
+) -> None:
+    """Uninstall several packages with a single pip invocation.
+
+    Args:
+        package_names: Names of the packages to uninstall.
+        timeout: Maximum time to wait for uninstallation in seconds.
+
+    Raises:
+        ValidationError: If a package name is invalid.
+        PipError: If uninstallation fails.
+    """
+    sanitized_names = [sanitize_package_name(name) for name in package_names]
+    if not sanitized_names:
+        return
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Uninstalling %d package(s): %s", len(sanitized_names), " ".join(sanitized_names))
+
+    command = ["pip", "uninstall", "-y"] + sanitized_names
+    result = run_secure_command(command, timeout=timeout)
+
+    if result.returncode != 0:
+        error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+        logger.error(f"Failed to uninstall packages: {error_msg}")
+        raise PipError("Failed to uninstall packages")
+
+    _invalidate_cache()
+
+    logger.info("Successfully uninstalled %d package(s)", len(sanitized_names))
 
 
 def uninstall_package(
@@ -330,7 +925,7 @@ def uninstall_package(
     """
     sanitized_name = sanitize_package_name(package_name)
 
-    logger.info(f"Uninstalling package: {sanitized_name}")
+    logger.info("Uninstalling package: %s", sanitized_name)
 
     command = ["pip", "uninstall", "-y", sanitized_name]
     result = run_secure_command(command, timeout=timeout)
@@ -340,7 +935,9 @@ def uninstall_package(
         logger.error(f"Failed to uninstall {sanitized_name}: {error_msg}")
         raise PipError("Failed to uninstall package")
 
-    logger.info(f"Successfully uninstalled {sanitized_name}")
+    _invalidate_cache()
+
+    logger.info("Successfully uninstalled %s", sanitized_name)
 
 
 def freeze_requirements(
@@ -365,40 +962,37 @@ def freeze_requirements(
     if format_type not in ("txt", "json"):
         raise ValidationError(f"Invalid format type: {format_type}")
 
-    command = ["pip", "freeze"]
-    result = run_secure_command(command)
+    result = run_secure_command(_CMD_FREEZE)
 
     if result.returncode != 0:
         error_msg = result.stderr.strip() if result.stderr else "Unknown error"
         logger.error(f"Failed to freeze requirements: {error_msg}")
         raise PipError(f"Failed to freeze requirements: {error_msg}")
 
-    requirements = result.stdout
+    requirements = result.stdout or ""
 
+    output: Union[str, List[Dict[str, str]]]
     if format_type == "json":
-        # Parse pip freeze output into JSON format
-        packages = []
-        for line in requirements.splitlines():
-            if "==" in line:
-                name, version = line.split("==", 1)
-                packages.append({"name": name, "version": version})
-        output = packages
+        # Parse pip freeze output into JSON format in a single regex pass
+        output = [
+            {"name": match.group(1), "version": match.group(2)}
+            for match in _FREEZE_RE.finditer(requirements)
+        ]
     else:
         output = requirements
 
     # Save to file if path provided
     if output_path:
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if format_type == "json":
-            content = json.dumps(output, indent=2)
-        else:
-            content = str(output)
+        _ensure_dir(output_path.parent)
 
         try:
-            output_path.write_text(content)
-            logger.info(f"Requirements saved to: {output_path}")
+            if format_type == "json":
+                output_path.write_text(json.dumps(output, indent=2))
+            else:
+                # Write pip's bytes as-is rather than re-encoding the decoded text
+                output_path.write_bytes(result.stdout_bytes or b"")
+            logger.info("Requirements saved to: %s", output_path)
         except OSError as e:
             logger.error(f"Failed to save requirements to {output_path}: {e}")
             raise PipError("Failed to save requirements") from e
@@ -406,11 +1000,16 @@ def freeze_requirements(
     return output
 
 
-def get_package_version(package_name: str) -> Optional[str]:
+def get_package_version(package_name: str, use_pip: bool = False) -> Optional[str]:
     """Get the installed version of a package.
 
+    Reads distribution metadata in-process instead of running ``pip show``,
+    unless the ``pip`` on PATH manages a different environment.
+
     Args:
         package_name: Name of the package.
+        use_pip: Ask ``pip show`` instead, for when pip's view of the
+            environment is wanted (e.g. pip belongs to another environment).
 
     Returns:
         Optional[str]: Installed version, or None if not found.
@@ -418,52 +1017,170 @@ def get_package_version(package_name: str) -> Optional[str]:
     Raises:
         ValidationError: If package name is invalid.
     """
-    sanitized_name = sanitize_package_name(package_name)
+    return _get_package_version_unchecked(sanitize_package_name(package_name), use_pip)
 
-    command = ["pip", "show", sanitized_name]
-    result = run_secure_command(command)
 
-    if result.returncode != 0:
+def _get_package_version_unchecked(sanitized_name: str, use_pip: bool = False) -> Optional[str]:
+    """Get the installed version of an already sanitized package name.
+
+    Args:
+        sanitized_name: Package name as returned by sanitize_package_name.
+        use_pip: Ask ``pip show`` instead of reading metadata in-process.
+
+    Returns:
+        Optional[str]: Installed version, or None if not found.
+    """
+    if use_pip or not pip_worker.pip_uses_this_interpreter():
+        return _pip_show_versions([sanitized_name]).get(sanitized_name)
+
+    # Pick up packages installed since the metadata was last scanned
+    importlib.invalidate_caches()
+
+    try:
+        return importlib.metadata.version(sanitized_name)
+    except importlib.metadata.PackageNotFoundError:
         return None
 
-    # Parse output to find version
-    for line in result.stdout.splitlines():
-        if line.startswith("Version:"):
-            return line.split(":", 1)[1].strip()  # type: ignore[no-any-return]
 
-    return None  # type: ignore[no-any-return]
+def get_package_versions(
+    package_names: List[str],
+    use_pip: bool = False,
+) -> Dict[str, Optional[str]]:
+    """Get the installed versions of several packages.
 
+    Indexes the installed packages once, so looking up N packages costs a
+    single scan of the environment instead of N metadata lookups. The index
+    follows the same TTL and invalidation as the environment listings.
 
-def list_installed_packages() -> List[Dict[str, str]]:
+    Args:
+        package_names: Names of the packages.
+        use_pip: Ask ``pip show`` instead, for when pip's view of the
+            environment is wanted. All packages are queried in one pip run.
+
+    Returns:
+        Dict[str, Optional[str]]: Mapping of each given name to its installed
+            version, or None if it is not installed.
+
+    Raises:
+        ValidationError: If ``use_pip`` is set and a package name is invalid.
+    """
+    global _installed_cache
+
+    if use_pip:
+        sanitized_names = [sanitize_package_name(name) for name in package_names]
+        versions = _pip_show_versions(sanitized_names) if sanitized_names else {}
+        return {
+            name: versions.get(canonicalize_name(sanitized))
+            for name, sanitized in zip(package_names, sanitized_names)
+        }
+
+    now = time.monotonic()
+    if _installed_cache is None or now - _installed_cache[0] > ENVIRONMENT_CACHE_TTL:
+        index: Dict[str, str] = {}
+        for package in iter_installed_packages():
+            index.setdefault(canonicalize_name(package["name"]), package["version"])
+        _installed_cache = (now, index)
+
+    index = _installed_cache[1]
+    return {name: index.get(canonicalize_name(name)) for name in package_names}
+
+
+def _pip_show_versions(package_names: List[str]) -> Dict[str, str]:
+    """Get installed versions from a single ``pip show`` run.
+
+    pip shows every requested package in one process, so the interpreter
+    and pip startup cost is paid once rather than per package.
+
+    Args:
+        package_names: Sanitized names of the packages.
+
+    Returns:
+        Dict[str, str]: Installed versions keyed by canonical name. Packages
+            pip does not know are left out.
+    """
+    # pip exits non-zero when some packages are missing but still shows the rest
+    result = run_secure_command(["pip", "show"] + package_names)
+
+    versions: Dict[str, str] = {}
+    name = None
+    for line in (result.stdout or "").splitlines():
+        key, _, value = line.partition(":")
+        if key == "Name":
+            name = canonicalize_name(value.strip())
+        elif key == "Version" and name is not None:
+            versions[name] = value.strip()
+    return versions
+
+
+@_ttl_cache(ENVIRONMENT_CACHE_TTL)
+def list_installed_packages(use_pip: bool = False) -> List[Dict[str, str]]:
     """List all installed packages.
 
+    Reads distribution metadata in-process instead of running ``pip list``,
+    unless the ``pip`` on PATH manages a different environment.
+
+    Args:
+        use_pip: Ask ``pip list`` instead, for when pip's view of the
+            environment is wanted (e.g. pip belongs to another environment).
+
     Returns:
-        List[Dict[str, str]]: List of installed packages with metadata.
+        List[Dict[str, str]]: Installed packages with name and version, sorted
+            by name like ``pip list``.
 
     Raises:
-        PipError: If pip list command fails.
+        PipError: If ``use_pip`` is set and pip fails or returns invalid JSON.
     """
     logger.debug("Listing installed packages...")
 
-    command = ["pip", "list", "--format=json"]
-    result = run_secure_command(command)
+    if use_pip or not pip_worker.pip_uses_this_interpreter():
+        result = run_secure_command(_CMD_LIST)
+        if result.returncode != 0:
+            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            logger.error(f"Failed to list installed packages: {error_msg}")
+            raise PipError(f"Failed to list installed packages: {error_msg}")
+        try:
+            return json_loads(result.stdout_bytes or b"")  # type: ignore[no-any-return]
+        except ValueError as e:
+            logger.error(f"Failed to parse pip output: {e}")
+            raise PipError("Failed to parse pip output") from e
 
-    if result.returncode != 0:
-        error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-        logger.error(f"Failed to list installed packages: {error_msg}")
-        raise PipError(f"Failed to list installed packages: {error_msg}")
+    return sorted(iter_installed_packages(), key=lambda package: package["name"].lower())
 
-    try:
-        packages: List[Dict[str, str]] = json.loads(result.stdout)
-        return packages
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse pip output: {e}")
-        raise PipError("Failed to parse pip output") from e
+
+def iter_installed_packages() -> Iterator[Dict[str, str]]:
+    """Yield installed packages as their metadata is read.
+
+    Streams distributions in sys.path order without building the whole
+    listing, for callers that index or filter packages on the fly. When the
+    ``pip`` on PATH manages a different environment, its ``pip list`` is
+    used instead.
+
+    Yields:
+        Dict[str, str]: Name and version of each installed package. When a
+            package is installed more than once, only the first one found
+            on sys.path is yielded, like pip.
+    """
+    if not pip_worker.pip_uses_this_interpreter():
+        # pip manages another environment, so ask it rather than sys.path
+        yield from list_installed_packages(use_pip=True)
+        return
+
+    seen: Set[str] = set()
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name or name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        yield {"name": name, "version": dist.version}
 
 
+@_ttl_cache(PIP_CACHE_TTL, persist=True, environment=False)
 def check_package_exists(package_name: str) -> bool:
     """Check if a package exists on PyPI.
 
+    Positive answers are cached, also on disk; a miss may be a network
+    error, so it is looked up again next time.
+
     Args:
         package_name: Name of the package to check.
 
@@ -481,6 +1198,45 @@ def check_package_exists(package_name: str) -> bool:
     return result.returncode == 0
 
 
+def check_packages_exist(package_names: List[str]) -> Dict[str, bool]:
+    """Check whether several packages exist on PyPI concurrently.
+
+    Each lookup runs check_package_exists on the shared thread pool, so the
+    network-bound pip queries overlap. All names are validated before any
+    lookup starts.
+
+    Args:
+        package_names: Names of the packages to check.
+
+    Returns:
+        Dict[str, bool]: Mapping of each given name to whether it exists, in
+            the order the names were given.
+
+    Raises:
+        ValidationError: If a package name is invalid.
+    """
+    for name in package_names:
+        sanitize_package_name(name)
+
+    if not package_names:
+        return {}
+
+    return dict(zip(package_names, _pool().map(check_package_exists, package_names)))
+
+
+@functools.lru_cache(maxsize=None)
+def _pool() -> ThreadPoolExecutor:
+    """Shared thread pool for fanning out subprocess- and network-bound queries."""
+    return ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4))
+
+
+def shutdown_pool() -> None:
+    """Shut down the shared thread pool; it is recreated on next use."""
+    if _pool.cache_info().currsize:
+        _pool().shutdown(wait=True)
+        _pool.cache_clear()
+
+
 def get_dependency_graph() -> Dict[str, List[str]]:
     """Get dependency graph of installed packages.
 
@@ -495,7 +1251,7 @@ def get_dependency_graph() -> Dict[str, List[str]]:
         result = run_secure_command(command)
 
         if result.returncode == 0:
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout_bytes or b"")
             graph = {}
 
             def walk(node):
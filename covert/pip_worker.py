@@ -0,0 +1,291 @@
+"""Persistent pip worker module for Covert.
+
+This module keeps a single Python process with pip already imported and
+feeds it read-only pip commands over a line-based JSON protocol, so a
+session that queries pip many times only pays for interpreter start-up
+and the pip import once.
+
+"""
+
+import atexit
+import functools
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from covert.logger import get_logger
+from covert.utils import json_dumps, json_loads
+
+logger = get_logger(__name__)
+
+# pip subcommands that only read the environment and are safe to run
+# repeatedly inside one long-lived interpreter
+READ_ONLY_COMMANDS = frozenset({"check", "freeze", "index", "list", "show"})
+
+# Runs inside the worker: one JSON request per stdin line, one JSON
+# response per stdout line. pip's own output is captured per request.
+BOOTSTRAP = """
+import contextlib, io, json, sys, traceback
+# -c puts the current directory first on sys.path; the pip script does not
+if sys.path and sys.path[0] == "":
+    del sys.path[0]
+from pip._internal.cli.main import main
+channel = sys.stdout
+for line in sys.stdin:
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = main(json.loads(line)["args"])
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        err.write(traceback.format_exc())
+        code = 1
+    channel.write(json.dumps({"returncode": code or 0, "stdout": out.getvalue(), "stderr": err.getvalue()}) + "\\n")
+    channel.flush()
+"""
+
+
+class PipWorker:
+    """A long-lived Python process that runs pip commands in-process.
+
+    One request runs at a time; a request made while the worker is busy, or
+    after the process failed to start or died, gets None and the caller
+    falls back to a fresh subprocess.
+    """
+
+    def __init__(self, python: Optional[str] = None):
+        """Initialize the worker without starting it.
+
+        Args:
+            python: Interpreter to run pip with. Defaults to sys.executable;
+                see pip_interpreter for the one behind the ``pip`` on PATH.
+        """
+        self.python = python or sys.executable
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def run(self, args: Sequence[str]) -> Optional[Tuple[int, bytes, bytes]]:
+        """Run a pip command in the worker.
+
+        Args:
+            args: pip arguments, without the leading ``pip``.
+
+        Returns:
+            Optional[Tuple[int, bytes, bytes]]: Return code, stdout and stderr,
+            or None if the worker is unavailable.
+        """
+        # A busy worker would serialize concurrent callers; let them spawn
+        # their own pip process instead of queueing
+        if not self._lock.acquire(blocking=False):
+            return None
+
+        try:
+            if self._failed:
+                return None
+
+            try:
+                process = self._ensure_started()
+                assert process.stdin is not None and process.stdout is not None
+                process.stdin.write(json_dumps({"args": list(args)}).encode() + b"\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+                if not line:
+                    raise EOFError("pip worker exited")
+                response = json_loads(line)
+            except (OSError, ValueError, EOFError) as e:
+                logger.debug("pip worker unavailable, falling back to subprocess: %s", e)
+                self._failed = True
+                self._stop()
+                return None
+        finally:
+            self._lock.release()
+
+        return (
+            int(response["returncode"]),
+            response["stdout"].encode("utf-8"),
+            response["stderr"].encode("utf-8"),
+        )
+
+    def close(self) -> None:
+        """Stop the worker process; the next request starts a new one."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the worker process if it is not running.
+
+        Returns:
+            subprocess.Popen: The running worker process.
+        """
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self.python, "-u", "-c", BOOTSTRAP],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                shell=False,  # Security: Never use shell=True
+            )
+        return self._process
+
+    def _stop(self) -> None:
+        """Terminate the worker process, if any."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        finally:
+            if process.stdout is not None:
+                process.stdout.close()
+
+
+_worker: Optional[PipWorker] = None
+_worker_lock = threading.Lock()
+
+
+def worker_enabled() -> bool:
+    """Whether pip commands may be routed to the persistent worker.
+
+    Set ``COVERT_PIP_WORKER=0`` to always spawn a fresh pip process.
+
+    Returns:
+        bool: True unless disabled through the environment.
+    """
+    return os.environ.get("COVERT_PIP_WORKER", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def handles(command: List[str]) -> bool:
+    """Whether a command can be served by the persistent worker.
+
+    Args:
+        command: Full command, including the leading ``pip``.
+
+    Returns:
+        bool: True for read-only pip commands when the worker is enabled.
+    """
+    return (
+        len(command) > 1
+        and command[0] == "pip"
+        and command[1] in READ_ONLY_COMMANDS
+        and worker_enabled()
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def pip_interpreter(search_path: Optional[str]) -> Optional[str]:
+    """Find the interpreter behind the ``pip`` command on ``search_path``.
+
+    Commands that are not routed to the worker run that ``pip``, so the
+    worker must use the same interpreter to report the same environment.
+    The interpreter is read from the script's shebang; a script whose
+    shebang is not an interpreter (a launcher, a pyenv shim) is only
+    accepted when it lives in covert's own environment.
+
+    Args:
+        search_path: The PATH to search, part of the cache key.
+
+    Returns:
+        Optional[str]: Interpreter path, or None if it cannot be determined.
+    """
+    pip_path = shutil.which("pip", path=search_path)
+    if pip_path is None:
+        return None
+
+    try:
+        with open(pip_path, "rb") as f:
+            first_line = f.readline(4096)
+    except OSError:
+        first_line = b""
+
+    if first_line.startswith(b"#!"):
+        parts = first_line[2:].decode("utf-8", "replace").split()
+        if len(parts) >= 2 and os.path.basename(parts[0]) == "env":
+            parts = [shutil.which(parts[1], path=search_path) or ""]
+        if parts and _is_python(parts[0]) and os.path.isfile(parts[0]):
+            return parts[0]
+
+    scripts_dir = sysconfig.get_path("scripts")
+    if scripts_dir and os.path.realpath(os.path.dirname(pip_path)) == os.path.realpath(scripts_dir):
+        return sys.executable
+    return None
+
+
+def _is_python(path: str) -> bool:
+    """Whether a path names a Python interpreter, going by its file name.
+
+    Args:
+        path: Executable path.
+
+    Returns:
+        bool: True for names like python, python3.11 or pypy3.
+    """
+    name = os.path.basename(path).lower()
+    return name.startswith(("python", "pypy"))
+
+
+def pip_uses_this_interpreter() -> bool:
+    """Whether the ``pip`` on PATH manages covert's own environment.
+
+    Only then may installed packages be read in-process: covert installed
+    with pipx, for example, runs in its own environment while installs go
+    to the one behind ``pip``. The interpreters must share a directory as
+    well as a binary, since a virtualenv's python links to its base.
+
+    Returns:
+        bool: True if pip's interpreter is ``sys.executable``.
+    """
+    python = pip_interpreter(os.environ.get("PATH"))
+    if python is None:
+        return False
+    if os.path.dirname(os.path.abspath(python)) != os.path.dirname(os.path.abspath(sys.executable)):
+        return False
+    try:
+        return os.path.samefile(python, sys.executable)
+    except OSError:
+        return False
+
+
+def run_pip(args: Sequence[str]) -> Optional[Tuple[int, bytes, bytes]]:
+    """Run a pip command in the shared worker, starting it on first use.
+
+    Args:
+        args: pip arguments, without the leading ``pip``.
+
+    Returns:
+        Optional[Tuple[int, bytes, bytes]]: Return code, stdout and stderr,
+        or None if the worker is unavailable or the interpreter behind
+        ``pip`` is unknown.
+    """
+    global _worker
+
+    python = pip_interpreter(os.environ.get("PATH"))
+    if python is None:
+        return None
+
+    with _worker_lock:
+        if _worker is None or _worker.python != python:
+            if _worker is None:
+                atexit.register(restart_worker)
+            else:
+                _worker.close()
+            _worker = PipWorker(python)
+        worker = _worker
+
+    return worker.run(args)
+
+
+def restart_worker() -> None:
+    """Stop the shared worker so the next request sees a fresh environment."""
+    if _worker is not None:
+        _worker.close()
@@ -5,53 +5,84 @@ for displaying progress during package updates and test execution.
 
 """
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeRemainingColumn,
-    TimeElapsedColumn,
-)
-from rich.style import Style
+# rich is imported on first use so that importing this module, or running
+# with progress disabled, does not load it
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, TaskID
+
+# Minimum seconds between redraws of a high-rate task (20 Hz)
+_RENDER_INTERVAL = 0.05
 
 
 class ProgressManager:
     """Manager for displaying progress bars and spinners.
 
     This class provides progress bar functionality for package updates,
-    test execution, and other long-running operations.
+    test execution, and other long-running operations. Constructing it with
+    ``enabled=False`` returns a ``_NullProgressManager`` whose methods do
+    nothing, so the enabled methods never need to check the flag.
     """
 
-    def __init__(self, enabled: bool = True, console: Optional[Console] = None):
+    def __new__(cls, enabled: bool = True, console: Optional["Console"] = None) -> "ProgressManager":
+        """Pick the no-op implementation when progress bars are disabled."""
+        if cls is ProgressManager and not enabled:
+            cls = _NullProgressManager
+        return super().__new__(cls)
+
+    def __init__(self, enabled: bool = True, console: Optional["Console"] = None):
         """Initialize the progress manager.
 
         Args:
             enabled: Whether progress bars are enabled.
-            console: Optional rich Console instance.
+            console: Optional rich Console instance, created on first use if
+                not given.
         """
         self.enabled = enabled
-        self.console = console or Console()
-        self._progress: Optional[Progress] = None
-        self._task_ids: Dict[str, int] = {}
-
-    def create_progress_bar(self, description: str = "Working...") -> Optional[Progress]:
-        """Create a progress bar for tracking a task.
-
-        Args:
-            description: Description of the task.
+        self._console = console
+        self._progress: Optional[Progress] = self._build_progress() if enabled else None
+        self._started = False
+        self._task_ids: Dict[str, TaskID] = {}
+        self._last_render: Dict[str, float] = {}
+        # Per task: advance not yet rendered, description template and its args
+        self._pending: Dict[str, Tuple[int, str, Tuple[Any, ...]]] = {}
+
+    @property
+    def console(self) -> "Console":
+        """The rich Console used for output."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __enter__(self) -> "ProgressManager":
+        """Enter the context, returning the manager itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the progress display on leaving the context."""
+        self.close()
+
+    def _build_progress(self) -> "Progress":
+        """Build the rich Progress display shared by every phase.
 
         Returns:
-            Optional[Progress]: Progress bar instance, or None if disabled.
+            Progress: Progress bar instance.
         """
-        if not self.enabled:
-            return None
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+            TimeRemainingColumn,
+        )
 
-        self._progress = Progress(
+        return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
             BarColumn(bar_width=40),
@@ -61,8 +92,102 @@ class ProgressManager:
             console=self.console,
         )
 
+    def create_progress_bar(self, description: str = "Working...") -> Optional["Progress"]:
+        """Return the progress bar shared by all phases.
+
+        The bar is built once and reused; phases add and remove their own
+        tasks on it instead of creating a new display each time.
+
+        Args:
+            description: Description of the task.
+
+        Returns:
+            Optional[Progress]: Progress bar instance, or None if disabled.
+        """
+        if self._progress is None:
+            self._progress = self._build_progress()
+
         return self._progress
 
+    def close(self) -> None:
+        """Stop the progress display and drop any remaining tasks."""
+        if self._progress is not None and self._started:
+            self._progress.stop()
+        self._started = False
+        self._task_ids.clear()
+        self._last_render.clear()
+        self._pending.clear()
+
+    def _start_task(self, key: str, description: str, total: Optional[float]) -> Optional[int]:
+        """Add a phase task to the shared progress bar, starting it if needed.
+
+        Args:
+            key: Phase name used to look up the task later.
+            description: Task description.
+            total: Total number of steps, or None if unknown.
+
+        Returns:
+            Optional[int]: Task ID, or None if disabled.
+        """
+        progress = self.create_progress_bar(description)
+        if progress is None:
+            return None
+
+        self._finish_task(key)
+        if not self._started:
+            progress.start()
+            self._started = True
+        self._task_ids[key] = progress.add_task(description, total=total)
+        return self._task_ids[key]
+
+    def _finish_task(self, key: str) -> None:
+        """Remove a phase task from the shared progress bar.
+
+        Args:
+            key: Phase name the task was started under.
+        """
+        self._flush(key)
+        self._last_render.pop(key, None)
+        task_id = self._task_ids.pop(key, None)
+        if task_id is not None and self._progress is not None:
+            self._progress.remove_task(task_id)
+
+    def _throttled_update(self, key: str, template: str, *args: Any) -> None:
+        """Advance a task by one, redrawing at most every ``_RENDER_INTERVAL``.
+
+        Advances are accumulated and the description is only formatted when
+        the task is actually redrawn.
+
+        Args:
+            key: Phase name the task was started under.
+            template: ``str.format`` template for the task description.
+            *args: Arguments for the template.
+        """
+        advance = self._pending[key][0] + 1 if key in self._pending else 1
+        self._pending[key] = (advance, template, args)
+
+        now = time.monotonic()
+        if now - self._last_render.get(key, 0.0) >= _RENDER_INTERVAL:
+            self._last_render[key] = now
+            self._flush(key)
+
+    def _flush(self, key: str) -> None:
+        """Apply any accumulated advance and description to a task.
+
+        Args:
+            key: Phase name the task was started under.
+        """
+        pending = self._pending.pop(key, None)
+        if pending is None or self._progress is None or key not in self._task_ids:
+            return
+
+        advance, template, args = pending
+        self._progress.update(
+            self._task_ids[key],
+            advance=advance,
+            description=template.format(*args),
+        )
+
     def start_package_updates(self, total: int) -> Optional[int]:
         """Start progress tracking for package updates.
 
@@ -72,19 +197,7 @@ class ProgressManager:
         Returns:
             Optional[int]: Task ID for updating progress.
         """
-        if not self.enabled:
-            return None
-
-        self._progress = self.create_progress_bar("Updating packages...")
-        if self._progress:
-            self._progress.start()
-            self._task_ids["packages"] = self._progress.add_task(
-                "Updating packages",
-                total=total,
-            )
-            return self._task_ids["packages"]
-
-        return None
+        return self._start_task("packages", "Updating packages", total)
 
     def update_package_progress(
         self,
@@ -99,21 +212,14 @@ class ProgressManager:
             package_number: Current package number.
             total: Total number of packages.
         """
-        if not self.enabled or "packages" not in self._task_ids:
+        if "packages" not in self._task_ids:
             return
 
-        if self._progress:
-            self._progress.update(
-                self._task_ids["packages"],
-                advance=1,
-                description=f"Updating {package_name} ({package_number}/{total})",
-            )
+        self._throttled_update("packages", "Updating {} ({}/{})", package_name, package_number, total)
 
     def complete_package_updates(self) -> None:
         """Complete the package updates progress bar."""
-        if self._progress:
-            self._progress.stop()
-            self._progress = None
+        self._finish_task("packages")
 
     def start_test_execution(self, test_command: str) -> Optional[int]:
         """Start progress tracking for test execution.
@@ -124,19 +230,8 @@ class ProgressManager:
         Returns:
             Optional[int]: Task ID for updating progress.
         """
-        if not self.enabled:
-            return None
-
-        self._progress = self.create_progress_bar(f"Running {test_command}...")
-        if self._progress:
-            self._progress.start()
-            self._task_ids["tests"] = self._progress.add_task(
-                f"Running {test_command}",
-                total=None,  # Unknown duration
-            )
-            return self._task_ids["tests"]
-
-        return None
+        # Unknown duration
+        return self._start_task("tests", f"Running {test_command}", None)
 
     def update_test_progress(self, description: str = "Running tests...") -> None:
         """Update progress for test execution.
@@ -144,7 +239,7 @@ class ProgressManager:
         Args:
             description: Current test description.
         """
-        if not self.enabled or "tests" not in self._task_ids:
+        if "tests" not in self._task_ids:
             return
 
         if self._progress:
@@ -155,9 +250,7 @@ class ProgressManager:
 
     def complete_test_execution(self) -> None:
         """Complete the test execution progress bar."""
-        if self._progress:
-            self._progress.stop()
-            self._progress = None
+        self._finish_task("tests")
 
     def start_vulnerability_scan(self, total: int = 0) -> Optional[int]:
         """Start progress tracking for vulnerability scanning.
@@ -168,22 +261,10 @@ class ProgressManager:
         Returns:
             Optional[int]: Task ID for updating progress.
         """
-        if not self.enabled:
-            return None
-
-        self._progress = self.create_progress_bar("Scanning for vulnerabilities...")
-        if self._progress:
-            self._progress.start()
-            desc = "Scanning packages"
-            if total > 0:
-                desc = f"Scanning {total} packages"
-            self._task_ids["vuln_scan"] = self._progress.add_task(
-                desc,
-                total=total if total > 0 else 100,
-            )
-            return self._task_ids["vuln_scan"]
-
-        return None
+        desc = "Scanning packages"
+        if total > 0:
+            desc = f"Scanning {total} packages"
+        return self._start_task("vuln_scan", desc, total if total > 0 else 100)
 
     def update_vuln_scan_progress(self, package_name: str, completed: int, total: int) -> None:
         """Update progress for vulnerability scanning.
@@ -193,15 +274,10 @@ class ProgressManager:
             completed: Number of packages scanned.
             total: Total number of packages.
         """
-        if not self.enabled or "vuln_scan" not in self._task_ids:
+        if "vuln_scan" not in self._task_ids:
             return
 
-        if self._progress:
-            self._progress.update(
-                self._task_ids["vuln_scan"],
-                advance=1,
-                description=f"Scanning {package_name} ({completed}/{total})",
-            )
+        self._throttled_update("vuln_scan", "Scanning {} ({}/{})", package_name, completed, total)
 
     def complete_vuln_scan(self, vulnerabilities_found: int) -> None:
         """Complete the vulnerability scan progress bar.
@@ -209,11 +285,11 @@ class ProgressManager:
         Args:
             vulnerabilities_found: Number of vulnerabilities found.
         """
-        if self._progress:
-            self._progress.stop()
-            self._progress = None
+        self._finish_task("vuln_scan")
+
+        if vulnerabilities_found > 0:
+            from rich.style import Style
 
-        if self.enabled and vulnerabilities_found > 0:
             self.console.print(
                 f"[yellow]Warning:[/yellow] Found {vulnerabilities_found} vulnerabilities!",
                 style=Style(color="yellow"),
@@ -225,19 +301,7 @@ class ProgressManager:
         Returns:
             Optional[int]: Task ID for updating progress.
         """
-        if not self.enabled:
-            return None
-
-        self._progress = self.create_progress_bar("Creating backup...")
-        if self._progress:
-            self._progress.start()
-            self._task_ids["backup"] = self._progress.add_task(
-                "Creating backup",
-                total=100,
-            )
-            return self._task_ids["backup"]
-
-        return None
+        return self._start_task("backup", "Creating backup", 100)
 
     def update_backup_progress(self, description: str = "Creating backup...") -> None:
         """Update progress for backup creation.
@@ -245,7 +309,7 @@ class ProgressManager:
         Args:
             description: Current backup description.
         """
-        if not self.enabled or "backup" not in self._task_ids:
+        if "backup" not in self._task_ids:
             return
 
         if self._progress:
@@ -261,9 +325,7 @@ class ProgressManager:
         Args:
             backup_file: Path to the backup file.
         """
-        if self._progress:
-            self._progress.stop()
-            self._progress = None
+        self._finish_task("backup")
 
     def print_spinner(self, message: str, spin: bool = True) -> None:
         """Print a message with optional spinner.
@@ -272,7 +334,7 @@ class ProgressManager:
             message: Message to print.
             spin: Whether to show a spinner.
         """
-        if self.enabled and spin:
+        if spin:
             with self._console_spinner(message):
                 pass
         else:
@@ -287,6 +349,63 @@ class ProgressManager:
         return self.console.status(f"[bold blue]{message}")
 
 
+class _NullProgressManager(ProgressManager):
+    """Progress manager used when progress bars are disabled.
+
+    Every progress method is a no-op; plain messages are still printed, to
+    stdout unless a console was passed in, so rich is never loaded.
+    """
+
+    def create_progress_bar(self, description: str = "Working...") -> Optional["Progress"]:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def start_package_updates(self, total: int) -> Optional[int]:
+        return None
+
+    def update_package_progress(self, package_name: str, package_number: int, total: int) -> None:
+        return None
+
+    def complete_package_updates(self) -> None:
+        return None
+
+    def start_test_execution(self, test_command: str) -> Optional[int]:
+        return None
+
+    def update_test_progress(self, description: str = "Running tests...") -> None:
+        return None
+
+    def complete_test_execution(self) -> None:
+        return None
+
+    def start_vulnerability_scan(self, total: int = 0) -> Optional[int]:
+        return None
+
+    def update_vuln_scan_progress(self, package_name: str, completed: int, total: int) -> None:
+        return None
+
+    def complete_vuln_scan(self, vulnerabilities_found: int) -> None:
+        return None
+
+    def start_backup_creation(self) -> Optional[int]:
+        return None
+
+    def update_backup_progress(self, description: str = "Creating backup...") -> None:
+        return None
+
+    def complete_backup_creation(self, backup_file: str) -> None:
+        return None
+
+    def print_spinner(self, message: str, spin: bool = True) -> None:
+        # Plain stdout unless a console was given, so rich stays unloaded
+        if self._console is not None:
+            self._console.print(message)
+        else:
+            print(message)
+
+
 def create_progress_manager(enabled: bool = True) -> ProgressManager:
     """Create a progress manager.
 
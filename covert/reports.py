@@ -6,10 +6,210 @@ This module provides functionality to generate reports in various formats
 """
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from covert import utils
+
+# Display format for timestamps in HTML and Markdown reports
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Per-package status markers for the Markdown report
+_STATUS_EMOJI = {
+    "updated": "✅",
+    "rolled_back": "🔄",
+    "failed_install": "❌",
+    "critical_failure": "⛔",
+    "skipped": "⏭️",
+}
+
+# Overall session status: (colour, text) for HTML and a badge for Markdown
+_HTML_STATUS = {
+    "failures": ("#f44336", "Completed with failures"),
+    "warnings": ("#ff9800", "Completed with warnings"),
+    "success": ("#4caf50", "Completed successfully"),
+}
+_MARKDOWN_STATUS_BADGE = {
+    "failures": "🔴 Completed with failures",
+    "warnings": "🟡 Completed with warnings",
+    "success": "🟢 Completed successfully",
+}
+
+# HTML report templates, parsed once. Every value substituted from report
+# data is HTML-escaped first.
+_HTML_ROW_TEMPLATE = Template("""
+            <tr>
+                <td>$name</td>
+                <td>$current_version</td>
+                <td>$latest_version</td>
+                <td><span class="status-$status">$status</span></td>
+                <td>$error</td>
+            </tr>""")
+
+_HTML_NO_PACKAGES_ROW = '<tr><td colspan="5">No packages processed</td></tr>'
+
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Covert Update Report - $session_name</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            padding: 30px;
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+            margin-bottom: 30px;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .summary-card {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 5px;
+            text-align: center;
+        }
+        .summary-card .value {
+            font-size: 2em;
+            font-weight: bold;
+            color: #3498db;
+        }
+        .summary-card .label {
+            color: #666;
+            font-size: 0.9em;
+        }
+        .status-bar {
+            background: $status_color;
+            color: white;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 30px;
+            font-weight: bold;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }
+        th, td {
+            padding: 12px;
+            text-align: left;
+            border-bottom: 1px solid #ddd;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+        }
+        tr:hover {
+            background-color: #f5f5f5;
+        }
+        .status-updated {
+            color: #4caf50;
+            font-weight: bold;
+        }
+        .status-rolled_back {
+            color: #ff9800;
+            font-weight: bold;
+        }
+        .status-failed_install, .status-critical_failure {
+            color: #f44336;
+            font-weight: bold;
+        }
+        .status-skipped {
+            color: #9e9e9e;
+            font-weight: bold;
+        }
+        .footer {
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            color: #666;
+            font-size: 0.9em;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Covert Update Report</h1>
+        
+        <div class="status-bar">
+            $status_text
+        </div>
+
+        <div class="summary">
+            <div class="summary-card">
+                <div class="value">$updated_packages</div>
+                <div class="label">Updated</div>
+            </div>
+            <div class="summary-card">
+                <div class="value">$rolled_back_packages</div>
+                <div class="label">Rolled Back</div>
+            </div>
+            <div class="summary-card">
+                <div class="value">$failed_packages</div>
+                <div class="label">Failed</div>
+            </div>
+            <div class="summary-card">
+                <div class="value">$skipped_packages</div>
+                <div class="label">Skipped</div>
+            </div>
+            <div class="summary-card">
+                <div class="value">$vulnerabilities_found</div>
+                <div class="label">Vulnerabilities</div>
+            </div>
+            <div class="summary-card">
+                <div class="value">${duration}s</div>
+                <div class="label">Duration</div>
+            </div>
+        </div>
+
+        <h2>Package Details</h2>
+        <table>
+            <thead>
+                <tr>
+                    <th>Package</th>
+                    <th>Current Version</th>
+                    <th>New Version</th>
+                    <th>Status</th>
+                    <th>Error</th>
+                </tr>
+            </thead>
+            <tbody>
+                $package_rows
+            </tbody>
+        </table>
+
+        <div class="footer">
+            <p>Report generated: $generated_at</p>
+            <p>Covert - Safe Package Updater</p>
+        </div>
+    </div>
+</body>
+</html>""")
 
 
 @dataclass
@@ -77,6 +277,15 @@ class ReportGenerator:
             config: Report configuration.
         """
         self.config = config
+        # The format is fixed per generator, so dispatch is resolved once;
+        # unknown formats use JSON
+        generators: Dict[str, Callable[[ReportData], str]] = {
+            "json": self._generate_json,
+            "html": self._generate_html,
+            "markdown": self._generate_markdown,
+            "md": self._generate_markdown,
+        }
+        self._generator = generators.get(config.format.lower(), self._generate_json)
 
     def generate(self, data: ReportData) -> str:
         """Generate a report from the given data.
@@ -87,14 +296,7 @@ class ReportGenerator:
         Returns:
             str: Generated report content.
         """
-        if self.config.format.lower() == "json":
-            return self._generate_json(data)
-        elif self.config.format.lower() == "html":
-            return self._generate_html(data)
-        elif self.config.format.lower() in ("markdown", "md"):
-            return self._generate_markdown(data)
-        else:
-            return self._generate_json(data)
+        return self._generator(data)
 
     def generate_and_save(self, data: ReportData) -> Optional[Path]:
         """Generate a report and save it to a file.
@@ -108,13 +310,15 @@ class ReportGenerator:
         if not self.config.enabled:
             return None
 
-        content = self.generate(data)
-
         output_path = Path(self.config.output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if self._generator == self._generate_json and utils.orjson is None:
+            # Stream stdlib JSON so large reports are never held as one string
+            with open(output_path, "w", encoding="utf-8") as f:
+                self._write_json(data, f)
+        else:
+            _write_report_file(output_path, self.generate(data).encode("utf-8"))
 
         return output_path
 
@@ -127,6 +331,30 @@ class ReportGenerator:
         Returns:
             str: JSON formatted report.
         """
+        return utils.json_dumps_indented(self._json_report(data))
+
+    def _write_json(self, data: ReportData, fp: TextIO) -> None:
+        """Write a JSON report to a file incrementally.
+
+        Produces the same document as _generate_json, encoded chunk by chunk.
+
+        Args:
+            data: Report data.
+            fp: Text file to write to.
+        """
+        encoder = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+        for chunk in encoder.iterencode(self._json_report(data)):
+            fp.write(chunk)
+
+    def _json_report(self, data: ReportData) -> Dict[str, Any]:
+        """Build the JSON report document.
+
+        Args:
+            data: Report data.
+
+        Returns:
+            Dict[str, Any]: Report document.
+        """
         report: Dict[str, Any] = {
             "session_name": data.session_name,
             "timestamp": data.start_time.isoformat(),
@@ -144,7 +372,7 @@ class ReportGenerator:
             "packages": data.package_results,
         }
 
-        return json.dumps(report, indent=2, default=str)
+        return report
 
     def _generate_html(self, data: ReportData) -> str:
         """Generate an HTML report.
@@ -155,188 +383,35 @@ class ReportGenerator:
         Returns:
             str: HTML formatted report.
         """
-        # Determine status color
-        if data.failed_packages > 0 or data.rolled_back_packages > 0:
-            status_color = "#f44336"
-            status_text = "Completed with failures"
-        elif data.vulnerabilities_found > 0:
-            status_color = "#ff9800"
-            status_text = "Completed with warnings"
+        status_color, status_text = _HTML_STATUS[_overall_status(data)]
+
+        if data.package_results:
+            package_rows = "".join(
+                _HTML_ROW_TEMPLATE.substitute(
+                    name=escape(str(pkg.get("name", "N/A"))),
+                    current_version=escape(str(pkg.get("current_version", "N/A"))),
+                    latest_version=escape(str(pkg.get("latest_version", "N/A"))),
+                    status=escape(str(pkg.get("status", "unknown"))),
+                    error=escape(str(pkg.get("error", "-"))),
+                )
+                for pkg in data.package_results
+            )
         else:
-            status_color = "#4caf50"
-            status_text = "Completed successfully"
-
-        # Build package table rows
-        package_rows = ""
-        for pkg in data.package_results:
-            status = pkg.get("status", "unknown")
-            status_class = f"status-{status}"
-            package_rows += f"""
-            <tr>
-                <td>{pkg.get('name', 'N/A')}</td>
-                <td>{pkg.get('current_version', 'N/A')}</td>
-                <td>{pkg.get('latest_version', 'N/A')}</td>
-                <td><span class="{status_class}">{status}</span></td>
-                <td>{pkg.get('error', '-')}</td>
-            </tr>"""
-
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Covert Update Report - {data.session_name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            padding: 30px;
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-            margin-bottom: 30px;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .summary-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 5px;
-            text-align: center;
-        }}
-        .summary-card .value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #3498db;
-        }}
-        .summary-card .label {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .status-bar {{
-            background: {status_color};
-            color: white;
-            padding: 15px;
-            border-radius: 5px;
-            margin-bottom: 30px;
-            font-weight: bold;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #3498db;
-            color: white;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .status-updated {{
-            color: #4caf50;
-            font-weight: bold;
-        }}
-        .status-rolled_back {{
-            color: #ff9800;
-            font-weight: bold;
-        }}
-        .status-failed_install, .status-critical_failure {{
-            color: #f44336;
-            font-weight: bold;
-        }}
-        .status-skipped {{
-            color: #9e9e9e;
-            font-weight: bold;
-        }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            color: #666;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Covert Update Report</h1>
-        
-        <div class="status-bar">
-            {status_text}
-        </div>
-
-        <div class="summary">
-            <div class="summary-card">
-                <div class="value">{data.updated_packages}</div>
-                <div class="label">Updated</div>
-            </div>
-            <div class="summary-card">
-                <div class="value">{data.rolled_back_packages}</div>
-                <div class="label">Rolled Back</div>
-            </div>
-            <div class="summary-card">
-                <div class="value">{data.failed_packages}</div>
-                <div class="label">Failed</div>
-            </div>
-            <div class="summary-card">
-                <div class="value">{data.skipped_packages}</div>
-                <div class="label">Skipped</div>
-            </div>
-            <div class="summary-card">
-                <div class="value">{data.vulnerabilities_found}</div>
-                <div class="label">Vulnerabilities</div>
-            </div>
-            <div class="summary-card">
-                <div class="value">{data.duration:.2f}s</div>
-                <div class="label">Duration</div>
-            </div>
-        </div>
-
-        <h2>Package Details</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Package</th>
-                    <th>Current Version</th>
-                    <th>New Version</th>
-                    <th>Status</th>
-                    <th>Error</th>
-                </tr>
-            </thead>
-            <tbody>
-                {package_rows if package_rows else '<tr><td colspan="5">No packages processed</td></tr>'}
-            </tbody>
-        </table>
-
-        <div class="footer">
-            <p>Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Covert - Safe Package Updater</p>
-        </div>
-    </div>
-</body>
-</html>"""
+            package_rows = _HTML_NO_PACKAGES_ROW
+
+        return _HTML_TEMPLATE.substitute(
+            session_name=escape(data.session_name),
+            status_color=status_color,
+            status_text=status_text,
+            updated_packages=data.updated_packages,
+            rolled_back_packages=data.rolled_back_packages,
+            failed_packages=data.failed_packages,
+            skipped_packages=data.skipped_packages,
+            vulnerabilities_found=data.vulnerabilities_found,
+            duration=f"{data.duration:.2f}",
+            package_rows=package_rows,
+            generated_at=_format_timestamp(datetime.now()),
+        )
 
     def _generate_markdown(self, data: ReportData) -> str:
         """Generate a Markdown report.
@@ -347,13 +422,7 @@ class ReportGenerator:
         Returns:
             str: Markdown formatted report.
         """
-        # Determine status badge
-        if data.failed_packages > 0 or data.rolled_back_packages > 0:
-            status_badge = "🔴 Completed with failures"
-        elif data.vulnerabilities_found > 0:
-            status_badge = "🟡 Completed with warnings"
-        else:
-            status_badge = "🟢 Completed successfully"
+        status_badge = _MARKDOWN_STATUS_BADGE[_overall_status(data)]
 
         # Build package list
         package_lines = []
@@ -364,18 +433,10 @@ class ReportGenerator:
             status = pkg.get("status", "unknown")
             error = pkg.get("error", "")
 
-            status_emoji = {
-                "updated": "✅",
-                "rolled_back": "🔄",
-                "failed_install": "❌",
-                "critical_failure": "⛔",
-                "skipped": "⏭️",
-            }.get(status, "❓")
+            status_emoji = _STATUS_EMOJI.get(status, "❓")
 
-            line = f"- **{name}**: {current} → {latest} {status_emoji} ({status})"
-            if error:
-                line += f" - Error: {error}"
-            package_lines.append(line)
+            error_suffix = f" - Error: {error}" if error else ""
+            package_lines.append(f"- **{name}**: {current} → {latest} {status_emoji} ({status}){error_suffix}")
 
         packages_text = "\n".join(package_lines) if package_lines else "No packages processed"
 
@@ -397,8 +458,8 @@ class ReportGenerator:
 ### Session Details
 
 - **Name**: {data.session_name}
-- **Start Time**: {data.start_time.strftime('%Y-%m-%d %H:%M:%S')}
-- **End Time**: {data.end_time.strftime('%Y-%m-%d %H:%M:%S') if data.end_time else 'N/A'}
+- **Start Time**: {_format_timestamp(data.start_time)}
+- **End Time**: {_format_timestamp(data.end_time) if data.end_time else 'N/A'}
 - **Pre-test Passed**: {'Yes' if data.pre_test_passed else 'No'}
 - **Backup File**: {data.backup_file or 'None'}
 
@@ -412,6 +473,78 @@ class ReportGenerator:
 """
 
 
+def _overall_status(data: ReportData) -> str:
+    """Classify how a session went, for the report's status banner.
+
+    Args:
+        data: Report data.
+
+    Returns:
+        str: "failures", "warnings" or "success".
+    """
+    if data.failed_packages > 0 or data.rolled_back_packages > 0:
+        return "failures"
+    if data.vulnerabilities_found > 0:
+        return "warnings"
+    return "success"
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp for display in HTML and Markdown reports.
+
+    Args:
+        timestamp: Timestamp to format.
+
+    Returns:
+        str: Timestamp as "YYYY-MM-DD HH:MM:SS".
+    """
+    return timestamp.strftime(_TIMESTAMP_FORMAT)
+
+
+def _write_report_file(path: Path, payload: bytes) -> None:
+    """Write a finished report to a file with unbuffered writes.
+
+    The payload is already encoded, so it is handed to ``os.write`` directly
+    instead of going through a buffered text file. A session produces a
+    single report, so there is nothing to gain from batching writes. An
+    existing file with identical content is left untouched, so its
+    modification time does not change.
+
+    Args:
+        path: File to create or truncate.
+        payload: Encoded report.
+    """
+    if _file_has_content(path, payload):
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _file_has_content(path: Path, payload: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes.
+
+    Args:
+        path: File to check.
+        payload: Expected content.
+
+    Returns:
+        bool: True if the file exists with the same content.
+    """
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except OSError:
+        return False
+
+
 def create_report_config(
     output_path: str = "",
     report_format: str = "json",
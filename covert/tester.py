@@ -5,18 +5,45 @@ to verify system integrity. It supports configurable test commands,
 timeout handling, and result parsing.
 """
 
+import os
 import re
+import shutil
 import subprocess
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Any, Callable, Deque, List, Optional
 
 from covert.config import TestingConfig
 from covert.exceptions import TestError
 from covert.logger import get_logger
 
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# RE2 scans in linear time, which matters for multi-megabyte test logs
+_regex = re2 if re2 is not None else re
+
+# Test summary patterns, compiled once
+_PYTEST_RE = _regex.compile(r"(\d+) passed(?:, (\d+) failed(?:, (\d+) skipped)?)?(?: in ([\d.]+)s)?")
+_UNITTEST_RE = _regex.compile(r"Ran (\d+) test(?:s)? in ([\d.]+)s")
+_FAILED_RE = _regex.compile(r"FAILED \(failures=(\d+)(?:, errors=(\d+))?(?:, skipped=(\d+))?\)")
+
+# Only the end of a test run's output is kept; summaries are printed last
+_OUTPUT_TAIL_LINES = 2000
+
+# Seconds to keep reading output after the test command has exited
+_OUTPUT_DRAIN_SECONDS = 1.0
+
+# Test runners print their summary last, so only this much of the output
+# is searched before falling back to the whole of it
+_SUMMARY_TAIL_CHARS = 4096
+
 
 @dataclass
 class TestResult:
@@ -25,7 +52,8 @@ class TestResult:
     Attributes:
         success: Whether tests passed.
         exit_code: Exit code of test command.
-        output: Combined stdout and stderr output.
+        output: Combined stdout and stderr output (the last lines only for
+            long runs).
         duration: Time taken to run tests in seconds.
         passed: Number of passed tests.
         failed: Number of failed tests.
@@ -77,18 +105,17 @@ def run_tests(
 
     logger.info(f"Running tests: {' '.join(command)}")
 
-    # Execute tests
+    # Execute tests, keeping only the tail of the output in memory
+    lines: Deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
     try:
-        result = subprocess.run(
+        process = subprocess.Popen(
             command,
             shell=False,  # Security: Never use shell=True
-            capture_output=True,
-            text=True,
-            timeout=config.timeout_seconds,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding="utf-8",
+            errors="replace",
         )
-    except subprocess.TimeoutExpired as e:
-        logger.error(f"Tests timed out after {config.timeout_seconds} seconds")
-        raise TestError(f"Tests timed out after {config.timeout_seconds} seconds") from e
     except FileNotFoundError as e:
         logger.error(f"Test command not found: {config.command}")
         raise TestError(f"Test command not found: {config.command}") from e
@@ -96,13 +123,27 @@ def run_tests(
         logger.error(f"Failed to run tests: {e}")
         raise TestError(f"Failed to run tests: {e}") from e
 
-    # Combine output
-    output = result.stdout
-    if result.stderr:
-        output += "\n" + result.stderr
+    reader = threading.Thread(target=_drain_output, args=(process.stdout, lines), daemon=True)
+    reader.start()
+    try:
+        exit_code = process.wait(timeout=config.timeout_seconds)
+    except subprocess.TimeoutExpired as e:
+        process.kill()
+        process.wait()
+        logger.error(f"Tests timed out after {config.timeout_seconds} seconds")
+        raise TestError(f"Tests timed out after {config.timeout_seconds} seconds") from e
+    finally:
+        # Processes the tests left running (xdist workers, servers) can keep
+        # the pipe open after the command exits, so the reader gets a bounded
+        # wait; if still blocked, it closes the pipe itself when they exit
+        reader.join(timeout=_OUTPUT_DRAIN_SECONDS)
+
+    # deque.copy() is atomic, so a reader that is still running cannot
+    # mutate the buffer while it is joined
+    output = "".join(lines.copy())
 
     # Parse test results
-    test_result = _parse_test_output(output, result.returncode)
+    test_result = _parse_test_output(output, exit_code)
 
     logger.info(
         f"Tests completed: {test_result.total} total, "
@@ -113,6 +154,44 @@ def run_tests(
     return test_result
 
 
+def _drain_output(stream: Optional[IO[str]], lines: Deque[str]) -> None:
+    """Read a process's output line by line into a bounded buffer.
+
+    Args:
+        stream: Text stream to read until end of file, then close.
+        lines: Buffer receiving the lines; older lines fall off when full.
+    """
+    if stream is None:
+        return
+
+    try:
+        lines.extend(stream)
+    finally:
+        stream.close()
+
+
+def _search_tail(pattern: Any, output: str) -> Optional[Any]:
+    """Search the end of the output first, then all of it.
+
+    The tail starts at a line boundary so a number cut in half by the
+    slice cannot produce a wrong match.
+
+    Args:
+        pattern: Compiled pattern to search for.
+        output: Test command output.
+
+    Returns:
+        Optional[Any]: Match object, or None if the pattern is not found.
+    """
+    if len(output) > _SUMMARY_TAIL_CHARS:
+        start = output.find("\n", len(output) - _SUMMARY_TAIL_CHARS)
+        if start != -1:
+            match = pattern.search(output, start + 1)
+            if match:
+                return match
+    return pattern.search(output)
+
+
 def _parse_test_output(output: str, exit_code: int) -> TestResult:
     """Parse test output to extract statistics.
 
@@ -124,8 +203,7 @@ def _parse_test_output(output: str, exit_code: int) -> TestResult:
         TestResult: Parsed test result.
     """
     # Try to parse pytest output
-    pytest_pattern = r"(\d+) passed(?:, (\d+) failed(?:, (\d+) skipped)?)?(?: in ([\d.]+)s)?"
-    match = re.search(pytest_pattern, output)
+    match = _search_tail(_PYTEST_RE, output)
 
     if match:
         passed = int(match.group(1)) if match.group(1) else 0
@@ -135,8 +213,7 @@ def _parse_test_output(output: str, exit_code: int) -> TestResult:
         duration = float(match.group(4)) if match.group(4) else 0.0
     else:
         # Try to parse unittest output
-        unittest_pattern = r"Ran (\d+) test(?:s)? in ([\d.]+)s"
-        match = re.search(unittest_pattern, output)
+        match = _search_tail(_UNITTEST_RE, output)
 
         if match:
             total = int(match.group(1))
@@ -147,8 +224,7 @@ def _parse_test_output(output: str, exit_code: int) -> TestResult:
                 skipped = 0
             else:
                 # Parse failures
-                failed_pattern = r"FAILED \(failures=(\d+)(?:, errors=(\d+))?(?:, skipped=(\d+))?\)"
-                failed_match = re.search(failed_pattern, output)
+                failed_match = _search_tail(_FAILED_RE, output)
                 if failed_match:
                     failed = int(failed_match.group(1)) if failed_match.group(1) else 0
                     errors = int(failed_match.group(2)) if failed_match.group(2) else 0
@@ -192,16 +268,8 @@ def check_test_command_available(command: str) -> bool:
     Returns:
         bool: True if command is available, False otherwise.
     """
-    try:
-        subprocess.run(
-            [command, "--version"],
-            shell=False,
-            capture_output=True,
-            timeout=5,
-        )
-        return True
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+    # A PATH lookup answers this without spawning the command
+    return shutil.which(command) is not None
 
 
 def get_test_files(
@@ -220,23 +288,44 @@ def get_test_files(
     if exclude_paths is None:
         exclude_paths = []
 
+    is_excluded = _exclude_matcher(exclude_paths)
     test_files = []
 
-    for pattern in ("test_*.py", "*_test.py"):
-        for test_file in root_dir.rglob(pattern):
-            # Check if file is in excluded path
-            excluded = False
-            for exclude_path in exclude_paths:
-                if exclude_path in str(test_file):
-                    excluded = True
-                    break
-
-            if not excluded:
+    # One walk covers both name patterns; excluded directories are pruned
+    # so their subtrees are never listed
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [dirname for dirname in dirnames if not is_excluded(os.path.join(dirpath, dirname))]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            if not (filename.startswith("test_") or filename.endswith("_test.py")):
+                continue
+            test_file = Path(dirpath) / filename
+            if not is_excluded(str(test_file)):
                 test_files.append(test_file)
 
     return sorted(test_files)
 
 
+def _exclude_matcher(exclude_paths: List[str]) -> Callable[[str], bool]:
+    """Build a check for whether a path contains any excluded path fragment.
+
+    The fragments are combined into one pattern so each path is scanned once
+    rather than once per fragment; with RE2 the scan is a single automaton pass.
+
+    Args:
+        exclude_paths: Path fragments to exclude.
+
+    Returns:
+        Callable[[str], bool]: Function returning True for excluded paths.
+    """
+    if not exclude_paths:
+        return lambda path: False
+
+    pattern = _regex.compile("|".join(re.escape(exclude_path) for exclude_path in exclude_paths))
+    return lambda path: pattern.search(path) is not None
+
+
 def validate_test_config(config: TestingConfig) -> bool:
     """Validate test configuration.
 
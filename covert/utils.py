@@ -4,28 +4,132 @@ This module provides utility functions for validation, version comparison,
 virtual environment detection, and other common operations.
 """
 
+import asyncio
+import functools
+import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Coroutine, List, Optional, Tuple, TypeVar, Union
 
 from packaging.version import InvalidVersion, Version
 from packaging.utils import canonicalize_name
 
 from covert.exceptions import ValidationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     import ctypes  # noqa: F401
 
+_T = TypeVar("_T")
+
 # Valid Python package name regex (PEP 508) - more permissive for input
 # Must start with letter, can contain letters, digits, dots, hyphens, underscores
 # Cannot start/end with special chars
 PACKAGE_NAME_INPUT_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9._-]*[a-zA-Z0-9]$|^[a-zA-Z]$")
 # Version pattern (PEP 440 compliant)
 VERSION_PATTERN = re.compile(r"^[0-9]+(\.[0-9]+)*([a-zA-Z0-9.+-]*)?$")
+# Pre-release suffix without a number, e.g. "1.0.0-rc" (PEP 440 wants "1.0.0rc1")
+_BARE_PRERELEASE_PATTERN = re.compile(r"^\d+(\.\d+)*-[a-zA-Z]+$")
+# 1.0.0.0 with optional extra zero components, a common typo
+_PADDED_ZERO_PATTERN = re.compile(r"^1\.0\.0\.0(\.0+)*$")
+# Exact pin such as "requests==2.31.0" or "uvicorn[standard] == 0.23", at the
+# start of a requirements line or inside a quoted pyproject.toml dependency
+_PINNED_REQUIREMENT_PATTERN = re.compile(
+    r"(?P<prefix>^|[\s\"'])(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)(?P<extras>\[[^\]]*\])?"
+    r"(?P<op>\s*==\s*)(?P<version>[A-Za-z0-9.+!-]+)(?![A-Za-z0-9.+!*-])",
+    re.MULTILINE,
+)
+# Manifest files kept in sync with installed versions
+MANIFEST_FILES = ("requirements.txt", "pyproject.toml")
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON, using orjson when it is installed.
+
+    orjson parses ``bytes`` directly, so callers should pass raw response
+    bodies rather than decoding them first.
+
+    Args:
+        data: JSON document as text or bytes.
+
+    Returns:
+        Any: Deserialized object.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to compact JSON, using orjson when it is installed.
+
+    Both backends produce the same text: no whitespace between tokens and
+    non-ASCII characters written as-is rather than as ``\\u`` escapes.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        str: JSON document.
+
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_dumps_indented(obj: Any) -> str:
+    """Serialize an object to JSON indented by two spaces, using orjson when installed.
+
+    Values of types JSON cannot represent are serialized with ``str()``. As
+    with json_dumps, both backends write non-ASCII characters unescaped.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        str: JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str, ensure_ascii=False)
 
 
+def run_coroutine_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    ``asyncio.run`` refuses to start while the calling thread already runs an
+    event loop, so in that case the coroutine gets its own loop in a worker
+    thread.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+@functools.lru_cache(maxsize=1024)
 def validate_package_name(name: str) -> bool:
     """Validate package name follows PEP 508.
 
@@ -41,6 +145,7 @@ def validate_package_name(name: str) -> bool:
     return bool(PACKAGE_NAME_INPUT_PATTERN.match(name))
 
 
+@functools.lru_cache(maxsize=1024)
 def validate_version(version: str) -> bool:
     """Validate version string format using packaging.version.
 
@@ -76,8 +181,7 @@ def validate_version(version: str) -> bool:
     
     # Reject pre-release suffixes without numeric (e.g., "1.0.0-rc" without number)
     # PEP 440 requires: 1.0.0rc1 not 1.0.0-rc
-    import re
-    if re.match(r'^\d+(\.\d+)*-[a-zA-Z]+$', version):
+    if _BARE_PRERELEASE_PATTERN.match(version):
         return False
     
     # Reject versions that don't start with a digit (like "version", "latest")
@@ -86,7 +190,7 @@ def validate_version(version: str) -> bool:
     
     # Reject versions with 4+ numeric components starting with 1.0.0.0 pattern
     # This is a common mistake/typo
-    if re.match(r'^1\.0\.0\.0(\.0+)*$', version):
+    if _PADDED_ZERO_PATTERN.match(version):
         return False
     
     try:
@@ -96,6 +200,7 @@ def validate_version(version: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_package_name(name: str) -> str:
     """Sanitize package name to prevent injection.
 
@@ -358,6 +463,54 @@ def is_compatible_python_version(
     return True
 
 
+def update_manifest_file(
+    package_name: str,
+    new_version: str,
+    project_dir: Union[str, Path] = ".",
+) -> List[Path]:
+    """Update exact pins of a package in the project's manifest files.
+
+    Only ``==`` pins are rewritten; ranges already admit the new version or
+    are the user's deliberate choice, so they are left as they are.
+
+    Args:
+        package_name: Package that was updated.
+        new_version: Version now installed.
+        project_dir: Directory holding the manifest files.
+
+    Returns:
+        List[Path]: Manifest files that were changed.
+
+    Raises:
+        ValidationError: If the package name or version is invalid.
+    """
+    canonical = sanitize_package_name(package_name)
+    if new_version != new_version.strip() or not validate_version(new_version):
+        raise ValidationError(f"Invalid version: {new_version!r}")
+
+    def repin(match: "re.Match[str]") -> str:
+        if canonicalize_name(match.group("name")) != canonical:
+            return match.group(0)
+        return (
+            f"{match.group('prefix')}{match.group('name')}{match.group('extras') or ''}"
+            f"{match.group('op')}{new_version}"
+        )
+
+    updated = []
+    for filename in MANIFEST_FILES:
+        manifest = Path(project_dir) / filename
+        if not manifest.is_file():
+            continue
+
+        content = manifest.read_text(encoding="utf-8")
+        new_content = _PINNED_REQUIREMENT_PATTERN.sub(repin, content)
+        if new_content != content:
+            manifest.write_text(new_content, encoding="utf-8")
+            updated.append(manifest)
+
+    return updated
+
+
 def validate_path(path: Union[str, Path]) -> bool:
     """Validate that a path is safe to use.
 
@@ -143,7 +143,6 @@ class VulnerabilityScanner:
             result = subprocess.run(
                 ["pip", "list", "--format=json"],
                 capture_output=True,
-                text=True,
                 check=False,
                 shell=False,  # Security: Never use shell=True
             )
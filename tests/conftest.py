@@ -192,3 +192,27 @@ django==4.2.0
 pyyaml==6.0
 """)
     return backup_path
+
+
+@pytest.fixture(autouse=True)
+def clear_environment_cache(tmp_path, monkeypatch):
+    """Isolate cached pip query results between tests.
+
+    Points the on-disk cache at a per-test directory, drops in-memory
+    results before and after each test, and disables the persistent pip
+    worker so mocked subprocess calls are honoured.
+
+    Args:
+        tmp_path: Per-test temporary directory fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Yields:
+        None
+    """
+    from covert.pip_interface import _cache, _invalidate_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.setenv("COVERT_PIP_WORKER", "0")
+    _invalidate_cache()
+    yield
+    _cache.clear()
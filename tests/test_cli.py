@@ -107,6 +107,11 @@ class TestParseArgs:
         args = parse_args(["--parallel"])
         assert args.parallel is True
 
+    def test_parse_args_refresh_cache(self):
+        """Test parsing --refresh-cache argument."""
+        assert parse_args(["--refresh-cache"]).refresh_cache is True
+        assert parse_args([]).refresh_cache is False
+
     def test_parse_args_combined(self):
         """Test parsing multiple arguments together."""
         args = parse_args(
@@ -20,9 +20,11 @@ from covert.core import (
     UpdateStatus,
     _filter_packages,
     _update_package,
+    _update_packages_batch,
     run_update_session,
 )
-from covert.exceptions import SecurityError, UpdateError, ValidationError
+from covert.dependency_analyzer import PackageImpact
+from covert.exceptions import PipError, SecurityError, UpdateError, ValidationError
 
 
 class TestUpdateStatus:
@@ -343,6 +345,91 @@ class TestUpdatePackage:
         assert result.error_message is not None
 
 
+def _resolvable(package, version):
+    """Impact analysis result for a package that can be installed."""
+    return PackageImpact(
+        package=package,
+        version=version,
+        can_resolve=True,
+        current_deps_ok=True,
+        current_broken=[],
+        resolution_error=None,
+        recommendation="OK",
+    )
+
+
+class TestUpdatePackagesBatch:
+    """Tests for _update_packages_batch function."""
+
+    @pytest.fixture
+    def config(self):
+        """Configuration with testing disabled."""
+        return Config(
+            project=ProjectConfig(name="Test", python_version="3.11"),
+            testing=TestingConfig(enabled=False),
+            backup=BackupConfig(enabled=False),
+            updates=UpdatesConfig(version_policy="safe"),
+            security=SecurityConfig(require_virtualenv=False),
+        )
+
+    @pytest.fixture
+    def packages(self):
+        """Packages with available updates."""
+        return [
+            PackageInfo(name="requests", current_version="2.25.0", latest_version="2.31.0"),
+            PackageInfo(name="django", current_version="3.2.0", latest_version="4.2.0"),
+            PackageInfo(name="six", current_version="1.15.0", latest_version="1.16.0"),
+        ]
+
+    @patch("covert.core.update_manifest_file", return_value=[])
+    @patch("covert.core.install_package")
+    @patch("covert.core.install_packages")
+    @patch("covert.dependency_analyzer.analyze_package_impact", side_effect=_resolvable)
+    @patch("covert.core.is_breaking_change", side_effect=lambda old, new, policy: new == "4.2.0")
+    def test_single_pip_call(
+        self, mock_breaking, mock_impact, mock_batch, mock_install, mock_manifest,
+        config, packages,
+    ):
+        """Test that all non-breaking packages are installed together."""
+        results = _update_packages_batch(packages, config)
+
+        mock_batch.assert_called_once_with([("requests", "2.31.0"), ("six", "1.16.0")])
+        mock_install.assert_not_called()
+        assert [r.status for r in results] == [
+            UpdateStatus.UPDATED,
+            UpdateStatus.SKIPPED,
+            UpdateStatus.UPDATED,
+        ]
+        assert mock_manifest.call_count == 2
+
+    @patch("covert.core.update_manifest_file", return_value=[])
+    @patch("covert.core.install_package")
+    @patch("covert.core.install_packages", side_effect=PipError("conflict"))
+    @patch("covert.dependency_analyzer.analyze_package_impact", side_effect=_resolvable)
+    @patch("covert.core.is_breaking_change", return_value=False)
+    def test_falls_back_per_package(
+        self, mock_breaking, mock_impact, mock_batch, mock_install, mock_manifest,
+        config, packages,
+    ):
+        """Test that a failed batch is retried one package at a time."""
+        def install(name, version):
+            if name == "django":
+                raise PipError("bad")
+            return {"name": name, "version": version}
+
+        mock_install.side_effect = install
+
+        results = _update_packages_batch(packages, config)
+
+        assert mock_install.call_count == 3
+        assert [r.status for r in results] == [
+            UpdateStatus.UPDATED,
+            UpdateStatus.FAILED_INSTALL,
+            UpdateStatus.UPDATED,
+        ]
+        assert results[1].error_message == "bad"
+
+
 class TestRunUpdateSession:
     """Tests for run_update_session function."""
 
@@ -350,7 +437,6 @@ class TestRunUpdateSession:
     @patch("covert.core.get_outdated_packages")
     def test_no_virtualenv_raises_error(self, mock_outdated, mock_venv):
         """Test that missing virtualenv raises error."""
-        from covert.exceptions import SecurityError
 
         mock_venv.return_value = False
 
@@ -422,7 +508,6 @@ class TestRunUpdateSession:
     @patch("covert.core.get_outdated_packages")
     def test_preflight_test_failure(self, mock_outdated, mock_tests, mock_venv):
         """Test handling of preflight test failure."""
-        from covert.exceptions import UpdateError
         from covert.tester import TestResult
 
         mock_venv.return_value = True
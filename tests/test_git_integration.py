@@ -0,0 +1,473 @@
+"""Tests for the git_integration module.
+
+"""
+
+import asyncio
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from covert import git_integration
+from covert.git_integration import (
+    GitConfig,
+    GitError,
+    GitJob,
+    _CheckPoller,
+    _evaluate_checks,
+    _GitWorker,
+    _invalidate_git_cache,
+    _run_async,
+    auto_merge_pr,
+    auto_merge_prs,
+    commit_changes,
+    create_branch,
+    get_current_branch,
+    get_remote_url,
+    is_git_repo,
+    perform_git_actions_many,
+)
+
+
+def _git(*args, cwd=None):
+    subprocess.run(["git", *args], check=True, capture_output=True, cwd=cwd)
+
+
+def _init_repo(path):
+    _git("init", "-q", "-b", "main", cwd=path)
+    _git("config", "user.name", "Test", cwd=path)
+    _git("config", "user.email", "test@example.com", cwd=path)
+    (path / "requirements.txt").write_text("requests==2.31.0\n")
+    _git("add", "requirements.txt", cwd=path)
+    _git("commit", "-q", "-m", "initial", cwd=path)
+
+
+@pytest.fixture(autouse=True)
+def clear_git_cache():
+    """Reset memoized repository queries between tests."""
+    _invalidate_git_cache()
+    yield
+    _invalidate_git_cache()
+
+
+@pytest.fixture(params=["pygit2", "subprocess"])
+def git_backend(request, monkeypatch):
+    """Run a test with the in-process pygit2 backend and the subprocess fallback."""
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+    else:
+        monkeypatch.setattr(git_integration, "pygit2", None)
+    return request.param
+
+
+@pytest.fixture
+def git_repo(temp_dir, monkeypatch):
+    """Initialized Git repository with a single commit as the working directory."""
+    monkeypatch.chdir(temp_dir)
+    _init_repo(temp_dir)
+    return temp_dir
+
+
+class TestGitWorker:
+    """Tests for the persistent cat-file worker."""
+
+    def test_resolve_existing_ref(self, git_repo):
+        """Test resolving an existing ref returns its SHA."""
+        worker = _GitWorker()
+        try:
+            expected = subprocess.run(
+                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+            ).stdout.strip()
+
+            assert worker.resolve("HEAD") == expected
+            assert worker.resolve("refs/heads/main") == expected
+        finally:
+            worker.close()
+
+    def test_resolve_missing_ref(self, git_repo):
+        """Test resolving a missing ref returns None."""
+        worker = _GitWorker()
+        try:
+            assert worker.resolve("refs/heads/does-not-exist") is None
+        finally:
+            worker.close()
+
+    def test_resolve_reuses_process(self, git_repo):
+        """Test that consecutive lookups share one process."""
+        worker = _GitWorker()
+        try:
+            worker.resolve("HEAD")
+            proc = worker._proc
+            worker.resolve("refs/heads/main")
+
+            assert worker._proc is proc
+        finally:
+            worker.close()
+
+    def test_resolve_outside_repo(self, temp_dir, monkeypatch):
+        """Test resolving outside a repository raises GitError."""
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(temp_dir.parent))
+        worker = _GitWorker()
+
+        with pytest.raises(GitError):
+            worker.resolve("HEAD")
+
+    def test_resolve_rejects_newline(self):
+        """Test that revisions containing newlines are rejected."""
+        worker = _GitWorker()
+
+        with pytest.raises(GitError):
+            worker.resolve("HEAD\nmain")
+
+
+class TestRepositoryQueries:
+    """Tests for memoized repository queries."""
+
+    def test_is_git_repo(self, git_backend, git_repo):
+        """Test detecting a Git repository."""
+        assert is_git_repo() is True
+        assert is_git_repo(git_repo) is True
+
+    def test_is_not_git_repo(self, git_backend, temp_dir, monkeypatch):
+        """Test detecting a directory outside any repository."""
+        monkeypatch.chdir(temp_dir)
+
+        assert is_git_repo() is False
+
+    def test_is_git_repo_memoized(self, git_repo, monkeypatch, mocker):
+        """Test that repeated checks do not spawn git again."""
+        monkeypatch.setattr(git_integration, "pygit2", None)
+        spy = mocker.spy(subprocess, "run")
+
+        is_git_repo()
+        is_git_repo()
+        is_git_repo(git_repo)
+
+        assert spy.call_count == 1
+
+    def test_pygit2_queries_do_not_spawn(self, git_repo, mocker):
+        """Test that read-only queries run in-process with pygit2."""
+        pytest.importorskip("pygit2")
+        spy = mocker.spy(subprocess, "run")
+
+        assert is_git_repo() is True
+        assert get_current_branch() == "main"
+        assert get_remote_url() is None
+
+        spy.assert_not_called()
+
+    def test_get_current_branch_detached(self, git_backend, git_repo):
+        """Test that a detached HEAD has no current branch."""
+        _git("checkout", "-q", "--detach")
+
+        assert get_current_branch() == ""
+
+    def test_get_remote_url(self, git_backend, git_repo):
+        """Test reading the origin remote URL."""
+        assert get_remote_url() is None
+
+        _invalidate_git_cache()
+        _git("remote", "add", "origin", "https://github.com/example/repo.git")
+
+        assert get_remote_url() == "https://github.com/example/repo.git"
+
+
+class TestCreateBranch:
+    """Tests for create_branch."""
+
+    def test_create_new_branch(self, git_backend, git_repo):
+        """Test creating and checking out a new branch."""
+        create_branch("covert/updates")
+
+        assert get_current_branch() == "covert/updates"
+
+    def test_create_branch_invalidates_current_branch(self, git_backend, git_repo):
+        """Test that switching branches refreshes the memoized branch."""
+        assert get_current_branch() == "main"
+
+        create_branch("covert/updates")
+
+        assert get_current_branch() == "covert/updates"
+
+    def test_checkout_existing_branch(self, git_backend, git_repo):
+        """Test checking out a branch that already exists."""
+        _git("branch", "existing")
+
+        create_branch("existing")
+
+        assert get_current_branch() == "existing"
+
+
+class TestCommitChanges:
+    """Tests for commit_changes."""
+
+    def _head(self):
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    def test_commit_tracked_file(self, git_repo, mocker):
+        """Test committing a tracked file uses a single git invocation."""
+        (git_repo / "requirements.txt").write_text("requests==2.32.0\n")
+        (git_repo / "other.txt").write_text("untouched\n")
+        _git("add", "other.txt")
+        spy = mocker.spy(subprocess, "run")
+
+        sha = commit_changes(["requirements.txt"], "chore: update requests")
+
+        assert spy.call_count == 1
+        assert self._head().startswith(sha)
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], capture_output=True, text=True, check=True
+        ).stdout
+        assert "A  other.txt" in status
+
+    def test_commit_untracked_file(self, git_repo):
+        """Test committing a new file stages it first."""
+        (git_repo / "covert.lock").write_text("requests==2.31.0\n")
+
+        sha = commit_changes(["covert.lock"], "chore: add lock file")
+
+        assert self._head().startswith(sha)
+        files = subprocess.run(
+            ["git", "show", "--name-only", "--format=", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        assert files == ["covert.lock"]
+
+    def test_commit_leaves_other_staged_files(self, git_repo):
+        """Test that unrelated staged changes are never swept into the commit."""
+        (git_repo / "other.txt").write_text("staged elsewhere\n")
+        _git("add", "other.txt")
+        (git_repo / "covert.lock").write_text("requests==2.31.0\n")
+
+        commit_changes(["covert.lock"], "chore: add lock file")
+
+        files = subprocess.run(
+            ["git", "show", "--name-only", "--format=", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], capture_output=True, text=True, check=True
+        ).stdout
+        assert files == ["covert.lock"]
+        assert "A  other.txt" in status
+
+
+class TestPerformGitActionsMany:
+    """Tests for perform_git_actions_many."""
+
+    def test_commits_each_repository(self, git_backend, temp_dir):
+        """Test that every job commits in its own repository."""
+        repos = [temp_dir / "one", temp_dir / "two"]
+        for repo in repos:
+            repo.mkdir()
+            _init_repo(repo)
+            (repo / "requirements.txt").write_text("requests==2.32.0\n")
+
+        config = GitConfig(commit=True, commit_message="chore: bump requests")
+        results = perform_git_actions_many(
+            [GitJob(path=repo, files=["requirements.txt"], config=config) for repo in repos],
+            max_workers=2,
+        )
+
+        assert results == dict.fromkeys(repos)
+        for repo in repos:
+            subject = subprocess.run(
+                ["git", "log", "-1", "--format=%s"],
+                capture_output=True, text=True, check=True, cwd=repo,
+            ).stdout.strip()
+            assert subject == "chore: bump requests"
+
+    def test_no_jobs(self):
+        """Test that an empty job list does nothing."""
+        assert perform_git_actions_many([]) == {}
+
+
+class TestAutoMerge:
+    """Tests for auto_merge_pr."""
+
+    def test_evaluate_checks(self):
+        """Test evaluating status checks against required ones."""
+        checks = [
+            {"name": "CI / tests", "conclusion": "SUCCESS"},
+            {"name": "lint", "conclusion": None},
+        ]
+
+        assert _evaluate_checks(checks, ["tests"]) is True
+        assert _evaluate_checks(checks, ["tests", "lint"]) is None
+        assert _evaluate_checks(checks, ["missing"]) is None
+        assert _evaluate_checks(
+            [{"name": "tests", "conclusion": "FAILURE"}], ["tests"]
+        ) is False
+
+    def test_polls_with_exponential_backoff(self):
+        """Test that pending checks are polled with growing delays."""
+        pending = [{"name": "tests", "conclusion": None}]
+        passed = [{"name": "tests", "conclusion": "SUCCESS"}]
+
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._CheckPoller.fetch") as mock_fetch, \
+                patch("covert.git_integration._run_async") as mock_run, \
+                patch("covert.git_integration.asyncio.sleep") as mock_sleep:
+            mock_fetch.side_effect = [pending, None, pending, passed]
+            mock_run.return_value = MagicMock(returncode=0)
+
+            assert auto_merge_pr("https://github.com/o/r/pull/7", required_checks=["Tests"])
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 8]
+        assert "merge" in mock_run.call_args.args[0]
+
+    def test_stops_on_failed_check(self):
+        """Test that a failed required check aborts without merging."""
+        failed = [{"name": "tests", "conclusion": "FAILURE"}]
+
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._CheckPoller.fetch", return_value=failed), \
+                patch("covert.git_integration._run_async") as mock_run, \
+                patch("covert.git_integration.asyncio.sleep") as mock_sleep:
+            assert auto_merge_pr("https://github.com/o/r/pull/7", required_checks=["tests"]) is False
+
+        mock_run.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_gh_not_available(self):
+        """Test that a missing gh CLI skips auto-merge without spawning."""
+        with patch("covert.git_integration._GH_PATH", None), \
+                patch("covert.git_integration._run_async") as mock_run:
+            assert auto_merge_pr("https://github.com/o/r/pull/7") is False
+
+        mock_run.assert_not_called()
+
+    def test_auto_merge_prs_waits_concurrently(self):
+        """Test that several PRs are merged from one event loop."""
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.side_effect = [MagicMock(returncode=0), MagicMock(returncode=1, stderr="x")]
+
+            results = auto_merge_prs([
+                "https://github.com/o/r/pull/7",
+                "https://github.com/o/r/pull/8",
+            ])
+
+        assert results == [True, False]
+        assert [c.args[0][3] for c in mock_run.call_args_list] == ["7", "8"]
+
+    def test_merges_without_polling_when_no_required_checks(self):
+        """Test that no checks are polled when none are required."""
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._CheckPoller.fetch") as mock_fetch, \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            assert auto_merge_pr("https://github.com/o/r/pull/7/", merge_method="rebase")
+
+        mock_fetch.assert_not_called()
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0][1:] == ["pr", "merge", "7", "--rebase", "--auto"]
+
+    def test_auto_merge_pr_inside_running_loop(self):
+        """Test that the sync wrapper works when called from a running event loop."""
+
+        async def caller():
+            return auto_merge_pr("https://github.com/o/r/pull/7")
+
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            assert asyncio.run(caller()) is True
+
+        mock_run.assert_called_once()
+
+    def test_run_async(self):
+        """Test running a subprocess through the event loop."""
+        result = asyncio.run(_run_async(["git", "--version"]))
+
+        assert result.returncode == 0
+        assert result.stdout.startswith("git version")
+
+
+class TestCheckPoller:
+    """Tests for _CheckPoller."""
+
+    def _graphql_response(self, nodes):
+        return {
+            "data": {"repository": {"pullRequest": {"commits": {"nodes": [
+                {"commit": {"statusCheckRollup": {"contexts": {"nodes": nodes}}}}
+            ]}}}}
+        }
+
+    def test_fetch_reuses_graphql_client(self):
+        """Test that polls share one authenticated HTTP client."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=self._graphql_response([
+                {"name": "tests", "conclusion": "SUCCESS"},
+                {"context": "ci/legacy", "state": "PENDING"},
+            ]))
+
+        async def poll_twice(poller):
+            try:
+                return await poller.fetch(), await poller.fetch()
+            finally:
+                await poller.aclose()
+
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="gho_token\n")
+            poller = _CheckPoller(
+                "https://github.com/o/r/pull/7", transport=httpx.MockTransport(handler)
+            )
+            first, second = asyncio.run(poll_twice(poller))
+
+        mock_run.assert_called_once()
+        assert len(requests) == 2
+        assert requests[0].headers["Authorization"] == "Bearer gho_token"
+        assert json.loads(requests[0].content)["variables"] == {
+            "owner": "o", "repo": "r", "number": 7,
+        }
+        assert first == second == [
+            {"name": "tests", "conclusion": "SUCCESS"},
+            {"name": "ci/legacy", "conclusion": "PENDING"},
+        ]
+
+    def test_fetch_falls_back_to_gh(self):
+        """Test falling back to gh pr view when no token is available."""
+        rollup = [{"name": "tests", "conclusion": "SUCCESS"}]
+
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.side_effect = [
+                MagicMock(returncode=1, stdout=""),
+                MagicMock(returncode=0, stdout=json.dumps({"statusCheckRollup": rollup})),
+            ]
+            poller = _CheckPoller("https://github.com/o/r/pull/7")
+
+            assert asyncio.run(poller.fetch()) == rollup
+
+        assert mock_run.call_args.args[0][1:3] == ["pr", "view"]
+
+    def test_fetch_non_github_host_uses_gh(self):
+        """Test that PRs outside github.com are polled through gh."""
+        with patch("covert.git_integration._GH_PATH", "/usr/bin/gh"), \
+                patch("covert.git_integration._run_async") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="")
+            poller = _CheckPoller("https://ghe.example.com/o/r/pull/7")
+
+            assert asyncio.run(poller.fetch()) is None
+
+        mock_run.assert_called_once()
+
+    def test_fetch_without_gh_raises_git_error(self):
+        """Test that a missing gh CLI is reported as a GitError."""
+        with patch("covert.git_integration._GH_PATH", None):
+            poller = _CheckPoller("https://ghe.example.com/o/r/pull/7")
+
+            with pytest.raises(GitError, match="not found"):
+                asyncio.run(poller.fetch())
@@ -120,6 +120,41 @@ class TestInteractivePrompter:
         assert len(result) == 1
         assert result[0]["name"] == "requests"
 
+    def test_prompt_for_packages_multiple_and_invalid(self):
+        """Test selecting several packages after an invalid response."""
+        config = InteractiveConfig(enabled=True)
+        mock_input = MagicMock(side_effect=["x, 9", "2, 1"])
+        prompter = InteractivePrompter(config, input_func=mock_input)
+
+        packages = [
+            {"name": "requests", "version": "2.25.0", "latest_version": "2.26.0"},
+            {"name": "django", "version": "4.0.0", "latest_version": "4.1.0"},
+        ]
+
+        result = prompter.prompt_for_packages(packages)
+
+        assert [p["name"] for p in result] == ["django", "requests"]
+        assert mock_input.call_count == 2
+
+    def test_prompt_for_packages_output(self, capsys):
+        """Test that the package menu is written in one block."""
+        config = InteractiveConfig(enabled=True)
+        mock_input = MagicMock(return_value="a")
+        prompter = InteractivePrompter(config, input_func=mock_input)
+
+        packages = [
+            {"name": "requests", "version": "2.25.0", "latest_version": "2.26.0"},
+            {"name": "django", "version": "4.0.0", "latest_version": "4.1.0"},
+        ]
+
+        prompter.prompt_for_packages(packages)
+
+        out = capsys.readouterr().out
+        assert "Package Selection" in out
+        assert "Found 2 package(s) with updates:" in out
+        assert "  1. requests: 2.25.0 → 2.26.0\n  2. django: 4.0.0 → 4.1.0\n" in out
+        assert out.endswith("-" * 50 + "\n\n")
+
     def test_confirm_update_disabled(self):
         """Test confirm_update when disabled."""
         config = InteractiveConfig(enabled=False)
@@ -204,6 +239,18 @@ class TestInteractivePrompter:
 
         assert result is False
 
+    def test_prompt_continue_after_rollback_retries_invalid(self):
+        """Test prompt_continue_after_rollback asks again on invalid input."""
+        config = InteractiveConfig(enabled=True)
+        mock_input = MagicMock(side_effect=["maybe", "s", "YES"])
+        prompter = InteractivePrompter(config, input_func=mock_input)
+
+        package = {"name": "requests"}
+        result = prompter.prompt_continue_after_rollback(package)
+
+        assert result is True
+        assert mock_input.call_count == 3
+
     def test_summary(self):
         """Test summary method."""
         config = InteractiveConfig(enabled=False)
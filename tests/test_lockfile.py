@@ -0,0 +1,510 @@
+"""Tests for the lockfile module.
+
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import sys
+
+import httpx
+import pytest
+
+from covert import lockfile
+from covert.lockfile import (
+    LockFileConfig,
+    PackageLock,
+    compute_diff,
+    compute_file_hash,
+    fetch_package_hashes,
+    find_input_files,
+    generate_lock_file,
+    generate_requirements_line,
+    get_installed_packages,
+    get_package_hashes,
+    load_existing_lock_file,
+    parse_pyproject_dependencies,
+    parse_requirements_file,
+    parse_setup_py_dependencies,
+    sync_environment,
+)
+
+
+@pytest.fixture(autouse=True)
+def hash_cache(temp_dir, monkeypatch):
+    """Isolated hash cache directory.
+
+    Yields:
+        Path: Root of the pypi_hashes cache.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir / "cache"))
+    monkeypatch.setattr(lockfile, "_hash_memo", {})
+    yield temp_dir / "cache" / "covert" / "pypi_hashes"
+
+
+def _pypi_release(*digests):
+    return {"urls": [{"digests": {"sha256": digest}} for digest in digests]}
+
+
+class TestFetchPackageHashes:
+    """Tests for fetch_package_hashes."""
+
+    def test_fetch_hashes(self):
+        """Test fetching hashes for several packages."""
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            if request.url.path == "/pypi/missing/1.0/json":
+                return httpx.Response(404)
+            return httpx.Response(200, json=_pypi_release("abc", "def"))
+
+        result = fetch_package_hashes(
+            [("requests", "2.31.0"), ("missing", "1.0"), ("requests", "2.31.0")],
+            transport=httpx.MockTransport(handler),
+        )
+
+        assert result == {
+            ("requests", "2.31.0"): ["sha256:abc", "sha256:def"],
+            ("missing", "1.0"): [],
+        }
+        assert sorted(requested) == ["/pypi/missing/1.0/json", "/pypi/requests/2.31.0/json"]
+
+    def test_fetch_uses_cache(self, hash_cache):
+        """Test that cached versions are not requested again."""
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(200, json=_pypi_release("abc"))
+
+        transport = httpx.MockTransport(handler)
+        fetch_package_hashes([("requests", "2.31.0")], transport=transport)
+        lockfile._hash_memo.clear()
+
+        result = fetch_package_hashes(
+            [("requests", "2.31.0"), ("six", "1.16.0")], transport=transport
+        )
+
+        assert requested == ["/pypi/requests/2.31.0/json", "/pypi/six/1.16.0/json"]
+        assert result[("requests", "2.31.0")] == ["sha256:abc"]
+        assert json.loads((hash_cache / "six" / "1.16.0.json").read_text()) == ["sha256:abc"]
+
+    def test_fetch_no_packages(self):
+        """Test that no requests are made for an empty list."""
+        assert fetch_package_hashes([]) == {}
+
+    def test_fetch_inside_running_loop(self, hash_cache):
+        """Test that hashes can be fetched from code running in an event loop."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json=_pypi_release("abc"))
+        )
+
+        async def fetch():
+            return fetch_package_hashes([("requests", "2.31.0")], transport=transport)
+
+        assert asyncio.run(fetch()) == {("requests", "2.31.0"): ["sha256:abc"]}
+
+
+class TestGetPackageHashes:
+    """Tests for get_package_hashes."""
+
+    def test_reads_disk_cache(self, hash_cache, mocker):
+        """Test that a cached version makes no network request."""
+        (hash_cache / "requests").mkdir(parents=True)
+        (hash_cache / "requests" / "2.31.0.json").write_text('["sha256:abc"]')
+        mock_client = mocker.patch("covert.lockfile._get_pypi_client")
+
+        assert get_package_hashes("requests", "2.31.0") == ["sha256:abc"]
+        mock_client.assert_not_called()
+
+    def test_failed_fetch_not_cached(self, hash_cache, mocker):
+        """Test that failures are not written to the cache."""
+        mocker.patch(
+            "covert.lockfile._get_pypi_client",
+            return_value=httpx.Client(transport=httpx.MockTransport(
+                lambda request: httpx.Response(503)
+            )),
+        )
+
+        assert get_package_hashes("requests", "2.31.0") == []
+        assert not (hash_cache / "requests" / "2.31.0.json").exists()
+
+    def test_requests_share_client(self, hash_cache, mocker):
+        """Test that sequential lookups reuse one HTTP client."""
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(200, json=_pypi_release("abc"))
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        mock_client = mocker.patch("covert.lockfile._get_pypi_client", return_value=client)
+
+        assert get_package_hashes("requests", "2.31.0") == ["sha256:abc"]
+        assert get_package_hashes("six", "1.16.0") == ["sha256:abc"]
+
+        assert requested == ["/pypi/requests/2.31.0/json", "/pypi/six/1.16.0/json"]
+        assert mock_client.call_count == 2
+
+
+class TestGenerateLockFile:
+    """Tests for lock file generation."""
+
+    def test_generate_requirements_line_with_hashes(self):
+        """Test that precomputed hashes are used."""
+        line = generate_requirements_line(
+            "requests", "2.31.0", include_hash=True, hashes=["sha256:abc"]
+        )
+
+        assert line == "requests==2.31.0 \\\n    --hash=sha256:abc"
+
+    @pytest.mark.parametrize(
+        "hashes, annotation, expected",
+        [
+            (None, None, "six==1.16.0"),
+            ([], None, "six==1.16.0"),
+            (["sha256:abc", "sha256:def"], None, "six==1.16.0 \\\n    --hash=sha256:abc"),
+            (None, "via six", "six==1.16.0\n    # via six"),
+            (["sha256:abc"], "via six", "six==1.16.0 \\\n    --hash=sha256:abc\n    # via six"),
+        ],
+    )
+    def test_generate_requirements_line_layouts(self, hashes, annotation, expected):
+        """Test each combination of hash and annotation."""
+        line = generate_requirements_line(
+            "six",
+            "1.16.0",
+            include_hash=hashes is not None,
+            annotation=annotation,
+            hashes=hashes,
+        )
+
+        assert line == expected
+
+    def test_generate_lock_file_fetches_hashes_once(self, temp_dir, mocker):
+        """Test that hashes are fetched in one batch."""
+        mock_fetch = mocker.patch(
+            "covert.lockfile.fetch_package_hashes",
+            return_value={("requests", "2.32.0"): ["sha256:abc"]},
+        )
+        output = temp_dir / "requirements.txt"
+
+        generate_lock_file(
+            [
+                {"name": "requests", "version": "2.31.0", "latest_version": "2.32.0"},
+                {"name": "six", "version": "1.16.0", "latest_version": "1.16.0"},
+            ],
+            str(output),
+            LockFileConfig(generate_hashes=True),
+        )
+
+        mock_fetch.assert_called_once_with([("requests", "2.32.0"), ("six", "1.16.0")])
+        content = output.read_text()
+        assert "requests==2.32.0 \\\n    --hash=sha256:abc" in content
+        assert "six==1.16.0\n" in content
+
+
+    def test_generate_lock_file_content(self, temp_dir):
+        """Test the exact layout of a generated lock file."""
+        output = temp_dir / "locks" / "requirements.txt"
+
+        generate_lock_file(
+            [
+                {"name": "requests", "version": "2.31.0", "latest_version": "2.32.0"},
+                {"name": "six", "version": "1.16.0", "latest_version": "1.16.0"},
+            ],
+            str(output),
+            LockFileConfig(),
+        )
+
+        assert output.read_text() == (
+            "# Generated by Covert\n"
+            "# DO NOT EDIT - manually maintained lockfiles may be overwritten\n"
+            "# Use 'covert --upgrade' to update\n"
+            "\n"
+            "requests==2.32.0\n"
+            "    # via requests (was 2.31.0)\n"
+            "\n"
+            "six==1.16.0\n"
+        )
+        assert [p.name for p in output.parent.iterdir()] == ["requirements.txt"]
+
+    def test_generate_lock_file_keeps_old_file_on_error(self, temp_dir, mocker):
+        """Test that a failed write leaves the previous lock file intact."""
+        output = temp_dir / "requirements.txt"
+        output.write_text("six==1.15.0\n")
+        mocker.patch(
+            "covert.lockfile.generate_requirements_line", side_effect=RuntimeError("boom")
+        )
+
+        with pytest.raises(RuntimeError):
+            generate_lock_file(
+                [{"name": "six", "version": "1.16.0"}], str(output), LockFileConfig()
+            )
+
+        assert output.read_text() == "six==1.15.0\n"
+        assert [p.name for p in temp_dir.iterdir()] == ["requirements.txt"]
+
+
+class TestComputeFileHash:
+    """Tests for compute_file_hash."""
+
+    @pytest.mark.parametrize("content", [b"", b"requests==2.31.0\n", b"x" * 300_000])
+    def test_compute_file_hash(self, temp_dir, content):
+        """Test hashing files of various sizes."""
+        path = temp_dir / "requirements.txt"
+        path.write_bytes(content)
+
+        assert compute_file_hash(path) == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.parametrize("content", [b"", b"requests==2.31.0\n", b"x" * 300_000])
+    def test_compute_file_hash_large_file(self, temp_dir, monkeypatch, content):
+        """Test the streaming path used for files above the size limit."""
+        monkeypatch.setattr(lockfile, "SMALL_FILE_HASH_LIMIT", 0)
+        path = temp_dir / "requirements.txt"
+        path.write_bytes(content)
+
+        assert compute_file_hash(path) == hashlib.sha256(content).hexdigest()
+
+    def test_compute_file_hash_without_file_digest(self, temp_dir, monkeypatch):
+        """Test the mmap fallback used before Python 3.11."""
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setattr(lockfile, "SMALL_FILE_HASH_LIMIT", 1)
+        content = b"requests==2.31.0\n"
+        path = temp_dir / "requirements.txt"
+        path.write_bytes(content)
+
+        assert compute_file_hash(path) == hashlib.sha256(content).hexdigest()
+
+
+class TestFindInputFiles:
+    """Tests for find_input_files."""
+
+    def test_find_input_files(self, temp_dir, monkeypatch):
+        """Test that only recognized regular files are returned, in priority order."""
+        (temp_dir / "requirements.in").write_text("requests\n")
+        (temp_dir / "pyproject.toml").write_text("[project]\n")
+        (temp_dir / "setup.py").mkdir()
+        (temp_dir / "README.md").write_text("")
+        monkeypatch.chdir(temp_dir)
+
+        inputs = find_input_files()
+
+        assert list(inputs) == ["pyproject", "requirements.in"]
+        assert inputs["pyproject"] == temp_dir.resolve() / "pyproject.toml"
+
+
+class TestParsePyproject:
+    """Tests for parse_pyproject_dependencies."""
+
+    def test_parse_pyproject(self, temp_dir):
+        """Test collecting dependencies, extras, Python and build requirements."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text("""
+[build-system]
+requires = ["setuptools>=68.0"]
+
+[project]
+name = "example"
+requires-python = ">=3.8"
+dependencies = ["requests>=2.25"]
+
+[project.optional-dependencies]
+dev = ["pytest"]
+""")
+
+        assert parse_pyproject_dependencies(pyproject) == [
+            "requests>=2.25",
+            "pytest [dev]",
+            "python>=3.8",
+            "setuptools>=68.0",
+        ]
+
+    def test_parse_pyproject_without_project_table(self, temp_dir):
+        """Test that a missing [project] table adds no python requirement."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text('[build-system]\nrequires = ["wheel"]\n')
+
+        assert parse_pyproject_dependencies(pyproject) == ["wheel"]
+
+    def test_parse_pyproject_bare_requires_python(self, temp_dir):
+        """Test that a bare requires-python version becomes a lower bound."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "example"\nrequires-python = "3.10"\n')
+
+        assert parse_pyproject_dependencies(pyproject) == ["python>=3.10"]
+
+
+class TestParseSetupPy:
+    """Tests for parse_setup_py_dependencies."""
+
+    def test_parse_setup_py(self, temp_dir):
+        """Test parsing install_requires and multi-line extras_require."""
+        setup_py = temp_dir / "setup.py"
+        setup_py.write_text("""
+from setuptools import setup
+
+setup(
+    name="example",
+    install_requires=[
+        "requests>=2.25",
+        'django>=3.2',
+    ],
+    extras_require={
+        "dev": [
+            "pytest",
+        ],
+        "docs": ["sphinx"],
+    },
+)
+""")
+
+        assert parse_setup_py_dependencies(setup_py) == [
+            "requests>=2.25",
+            "django>=3.2",
+            "pytest [dev]",
+            "sphinx [docs]",
+        ]
+
+
+LOCK_CONTENT = """# Generated by Covert
+
+Django==4.2.0 ; python_version >= "3.8"
+requests==2.31.0 \\
+    --hash=sha256:abc
+    # via requests (was 2.30.0)
+typing_extensions[extra]==4.8.0
+  # indented comment
+pip>=23.0
+"""
+
+
+class TestParseLockFiles:
+    """Tests for lock file and requirements parsing."""
+
+    def test_load_existing_lock_file(self, temp_dir):
+        """Test loading pinned packages from an existing lock file."""
+        lock_path = temp_dir / "requirements.txt"
+        lock_path.write_text(LOCK_CONTENT)
+
+        packages = load_existing_lock_file(lock_path)
+
+        assert {name: pkg.version for name, pkg in packages.items()} == {
+            "Django": "4.2.0",
+            "requests": "2.31.0",
+            "typing_extensions[extra]": "4.8.0",
+        }
+
+    def test_lock_entries_are_immutable(self, temp_dir):
+        """Test that parsed entries are frozen and share interned names."""
+        lock_path = temp_dir / "requirements.txt"
+        lock_path.write_text(LOCK_CONTENT)
+
+        packages = load_existing_lock_file(lock_path)
+        pkg = packages["requests"]
+
+        assert pkg.name is sys.intern("requests")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pkg.version = "0.0.1"
+
+    def test_parse_requirements_file(self, temp_dir):
+        """Test parsing and normalizing pinned requirements."""
+        req_path = temp_dir / "requirements.txt"
+        req_path.write_text(LOCK_CONTENT)
+
+        assert parse_requirements_file(req_path) == {
+            "django": "4.2.0",
+            "requests": "2.31.0",
+            "typing-extensions": "4.8.0",
+        }
+
+
+class TestComputeDiff:
+    """Tests for compute_diff."""
+
+    def test_compute_diff(self):
+        """Test classifying added, removed, upgraded and downgraded packages."""
+        old = {
+            "django": PackageLock(name="django", version="4.2.0"),
+            "requests": PackageLock(name="requests", version="2.31.0"),
+            "six": PackageLock(name="six", version="1.16.0"),
+            "urllib3": PackageLock(name="urllib3", version="2.0.0"),
+            "weird": PackageLock(name="weird", version="not-a-version"),
+        }
+        new = [
+            {"name": "requests", "version": "2.31.0", "latest_version": "2.32.0"},
+            {"name": "urllib3", "version": "1.26.18"},
+            {"name": "django", "version": "4.2.0"},
+            {"name": "weird", "version": "1.0"},
+            {"name": "httpx", "latest_version": "0.27.0"},
+        ]
+
+        diff = compute_diff(old, new)
+
+        assert diff.added == [PackageLock(name="httpx", version="0.27.0")]
+        assert diff.removed == [old["six"]]
+        assert diff.upgraded == [(old["requests"], PackageLock(name="requests", version="2.32.0"))]
+        assert diff.downgraded == [(old["urllib3"], PackageLock(name="urllib3", version="1.26.18"))]
+
+
+class TestGetInstalledPackages:
+    """Tests for get_installed_packages."""
+
+    def test_reads_metadata_in_process(self, mocker):
+        """Test that installed packages are read without spawning pip."""
+        mocker.patch("covert.pip_worker.pip_uses_this_interpreter", return_value=True)
+        mock_run = mocker.patch("subprocess.run")
+
+        installed = get_installed_packages()
+
+        mock_run.assert_not_called()
+        assert "pytest" in installed
+        assert all(name == name.lower() and "_" not in name for name in installed)
+
+    def test_other_environment_uses_pip(self, mocker):
+        """Test that pip is asked when it manages another environment."""
+        mocker.patch("covert.pip_worker.pip_uses_this_interpreter", return_value=False)
+        mock_run = mocker.patch(
+            "subprocess.run",
+            return_value=mocker.Mock(returncode=0, stdout=b'[{"name": "Foo_Bar", "version": "1.0"}]'),
+        )
+
+        assert get_installed_packages() == {"foo-bar": "1.0"}
+        mock_run.assert_called_once()
+
+
+class TestSyncEnvironment:
+    """Tests for sync_environment."""
+
+    def test_sync_batches_pip_calls(self, temp_dir, mocker):
+        """Test that multiple files are merged and pip runs once per phase."""
+        base = temp_dir / "base.txt"
+        base.write_text("requests==2.31.0\nsix==1.16.0\n")
+        dev = temp_dir / "dev.txt"
+        dev.write_text("requests==2.32.0\npytest==8.0.0\n")
+        mocker.patch(
+            "covert.lockfile.get_installed_packages",
+            return_value={"requests": "2.30.0", "six": "1.16.0", "flask": "3.0.0"},
+        )
+        mock_install = mocker.patch("covert.pip_interface.install_packages")
+        mock_uninstall = mocker.patch("covert.pip_interface.uninstall_packages")
+
+        assert sync_environment([str(base), str(dev), str(temp_dir / "missing.txt")]) is True
+
+        mock_uninstall.assert_called_once_with(["flask"])
+        mock_install.assert_called_once()
+        assert sorted(mock_install.call_args[0][0]) == [
+            ("pytest", "8.0.0"),
+            ("requests", "2.32.0"),
+        ]
+        assert mock_install.call_args[1] == {"no_deps": True}
+
+    def test_sync_reports_install_failure(self, temp_dir, mocker):
+        """Test that a failed batch install marks the sync as failed."""
+        req = temp_dir / "requirements.txt"
+        req.write_text("requests==2.31.0\n")
+        mocker.patch("covert.lockfile.get_installed_packages", return_value={})
+        mocker.patch("covert.pip_interface.install_packages", side_effect=Exception("boom"))
+
+        assert sync_environment([str(req)]) is False
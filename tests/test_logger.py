@@ -0,0 +1,139 @@
+"""Tests for the logger module."""
+
+import json
+import logging
+import sys
+
+import pytest
+
+from covert.logger import JsonFormatter, _get_console_handler, _get_log_level, get_logger
+
+
+def _make_record(msg="Parsed %s", args=("requests",), exc_info=None):
+    """Build a log record as a covert module would emit it."""
+    return logging.LogRecord(
+        name="covert.lockfile",
+        level=logging.DEBUG,
+        pathname=__file__,
+        lineno=42,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,
+        func="parse",
+    )
+
+
+class TestJsonFormatter:
+    """Tests for the JsonFormatter class."""
+
+    def test_format_fields(self):
+        """Test that all standard fields are emitted."""
+        record = _make_record()
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data == {
+            "timestamp": JsonFormatter().formatTime(record),
+            "level": "DEBUG",
+            "logger": "covert.lockfile",
+            "message": "Parsed requests",
+            "module": "test_logger",
+            "function": "parse",
+            "line": 42,
+        }
+
+    @pytest.mark.parametrize("message", ['say "hi"', "back\\slash", "new\nline", "naïve ✓"])
+    def test_format_escapes_message(self, message):
+        """Test that messages needing escapes still produce valid JSON."""
+        record = _make_record(msg=message, args=())
+        assert json.loads(JsonFormatter().format(record))["message"] == message
+
+    def test_format_custom_datefmt(self):
+        """Test that a custom date format is encoded safely."""
+        formatter = JsonFormatter(datefmt='%Y "quoted"')
+        data = json.loads(formatter.format(_make_record()))
+
+        assert data["timestamp"].endswith('"quoted"')
+
+    def test_format_exception(self):
+        """Test that exception info is included."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _make_record(exc_info=sys.exc_info())
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert "ValueError: boom" in data["exception"]
+        assert data["message"] == "Parsed requests"
+
+    def test_format_extra(self):
+        """Test that the extra attribute is included."""
+        record = _make_record()
+        record.extra = {"package": "requests"}
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["extra"] == {"package": "requests"}
+
+
+class TestGetLogger:
+    """Tests for the get_logger function."""
+
+    def test_namespaced(self):
+        """Test that loggers live under the covert namespace."""
+        assert get_logger("lockfile") is logging.getLogger("covert.lockfile")
+
+    def test_memoized(self):
+        """Test that repeated calls return the cached logger."""
+        get_logger.cache_clear()
+        assert get_logger("tester") is get_logger("tester")
+        assert get_logger.cache_info().hits == 1
+
+
+class TestGetLogLevel:
+    """Tests for the _get_log_level function."""
+
+    @pytest.mark.parametrize(
+        "config_level, verbose_level, expected",
+        [
+            ("warning", 0, logging.WARNING),
+            ("ERROR", 0, logging.ERROR),
+            ("bogus", 0, logging.INFO),
+            ("WARNING", 1, logging.DEBUG),
+            ("ERROR", 2, logging.DEBUG),
+        ],
+    )
+    def test_get_log_level(self, config_level, verbose_level, expected):
+        """Test mapping configured levels and verbosity to constants."""
+        assert _get_log_level(config_level, verbose_level) == expected
+
+
+class TestGetConsoleHandler:
+    """Tests for the _get_console_handler function."""
+
+    def test_plain_handler_when_not_a_tty(self, monkeypatch):
+        """Test that redirected stderr gets a plain stream handler."""
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: False)
+
+        handler = _get_console_handler("detailed", logging.INFO)
+
+        assert type(handler) is logging.StreamHandler
+        assert handler.stream is sys.stderr
+        assert handler.level == logging.INFO
+
+    def test_rich_handler_on_tty(self, monkeypatch):
+        """Test that a terminal gets a Rich handler."""
+        from rich.logging import RichHandler
+
+        monkeypatch.setattr(sys.stderr, "isatty", lambda: True)
+
+        handler = _get_console_handler("simple", logging.DEBUG, show_locals=True)
+
+        assert isinstance(handler, RichHandler)
+        assert handler.tracebacks_show_locals is True
+
+    def test_json_uses_stdout(self):
+        """Test that JSON output always goes to stdout."""
+        handler = _get_console_handler("json", logging.INFO)
+
+        assert handler.stream is sys.stdout
@@ -2,9 +2,15 @@
 
 """
 
+import email
+import json
+import smtplib
+import threading
 from datetime import datetime
+from email.header import decode_header, make_header
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from covert.notifications import (
@@ -97,12 +103,13 @@ class TestNotificationManager:
         assert result is True  # Should return True when disabled (no failure)
         assert manager._sent_count == 0
 
-    @patch("covert.notifications.urllib.request.urlopen")
-    def test_send_slack_success(self, mock_urlopen):
+    def test_send_slack_success(self):
         """Test sending a Slack notification successfully."""
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_urlopen.return_value.__enter__.return_value = mock_response
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200)
 
         config = NotificationConfig(
             enabled=True,
@@ -110,6 +117,7 @@ class TestNotificationManager:
             slack_webhook="https://hooks.slack.com/test",
         )
         manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(handler))
 
         message = NotificationMessage(
             title="Test",
@@ -120,6 +128,205 @@ class TestNotificationManager:
         result = manager.send(message)
 
         assert result is True
+        assert manager.flush() is True
+        assert manager.summary()["sent"] == 1
+        assert len(requests) == 1
+        assert json.loads(requests[0].content)["attachments"][0]["title"] == "Test"
+
+    def test_http_client_reused(self):
+        """Test that Slack and webhook posts share one HTTP client."""
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200)
+
+        config = NotificationConfig(
+            enabled=True,
+            channels=["slack", "webhook"],
+            slack_webhook="https://hooks.slack.com/test",
+            webhook_url="https://example.com/hook",
+            webhook_headers={"X-Token": "abc"},
+        )
+        manager = NotificationManager(config)
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        manager._http = client
+
+        with patch.object(manager, "_sleep"):
+            manager.send(NotificationMessage(title="One", body="1"))
+            manager.send(NotificationMessage(title="Two", body="2"))
+            assert manager.flush() is True
+
+        assert sorted(hosts) == ["example.com"] * 2 + ["hooks.slack.com"] * 2
+        assert manager._http is client
+
+        assert manager.close() is True
+        assert client.is_closed
+
+    def test_webhook_error_status(self):
+        """Test that a persistent server error is retried, then fails."""
+        statuses = []
+
+        def handler(request):
+            statuses.append(500)
+            return httpx.Response(500)
+
+        config = NotificationConfig(
+            enabled=True, channels=["webhook"], webhook_url="https://example.com/hook"
+        )
+        manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with patch.object(manager, "_sleep") as mock_sleep:
+            manager.send(NotificationMessage(title="Test", body="Body"))
+            assert manager.flush() is False
+
+        assert len(statuses) == 3
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2 and delays[1] > delays[0] >= 0.5
+
+    def test_webhook_client_error_not_retried(self):
+        """Test that a 4xx response fails without retrying."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(404)
+
+        config = NotificationConfig(
+            enabled=True, channels=["webhook"], webhook_url="https://example.com/hook"
+        )
+        manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with patch.object(manager, "_sleep") as mock_sleep:
+            manager.send(NotificationMessage(title="Test", body="Body"))
+            assert manager.flush() is False
+
+        assert len(requests) == 1
+        mock_sleep.assert_not_called()
+
+    def test_slack_rate_limit_honors_retry_after(self):
+        """Test that a 429 waits for Retry-After before retrying."""
+        responses = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200)]
+
+        config = NotificationConfig(
+            enabled=True, channels=["slack"], slack_webhook="https://hooks.slack.com/test"
+        )
+        manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+        with patch.object(manager, "_sleep") as mock_sleep:
+            manager.send(NotificationMessage(title="Test", body="Body"))
+            assert manager.flush() is True
+
+        waits = [c[0][0] for c in mock_sleep.call_args_list]
+        assert waits[0] == 2.0
+        assert responses == []
+
+    def test_slack_posts_spaced(self):
+        """Test that consecutive Slack posts are at least a second apart."""
+        config = NotificationConfig(
+            enabled=True, channels=["slack"], slack_webhook="https://hooks.slack.com/test"
+        )
+        manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+
+        with patch.object(manager, "_sleep") as mock_sleep:
+            manager.send(NotificationMessage(title="One", body="1"))
+            manager.send(NotificationMessage(title="Two", body="2"))
+            assert manager.flush() is True
+
+        assert mock_sleep.call_count == 1
+        assert 0 < mock_sleep.call_args[0][0] <= 1.0
+
+    def test_webhook_payload_compact(self):
+        """Test that webhook payloads are compact JSON encoded once."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content)
+            return httpx.Response(200)
+
+        config = NotificationConfig(
+            enabled=True, channels=["webhook"], webhook_url="https://example.com/hook"
+        )
+        manager = NotificationManager(config)
+        manager._http = httpx.Client(transport=httpx.MockTransport(handler))
+        message = NotificationMessage(title="Test", body="Body", metadata={"count": 2})
+
+        manager.send(message)
+        manager.send(message)
+        assert manager.flush() is True
+
+        assert bodies[0] == bodies[1]
+        assert b", " not in bodies[0] and b": " not in bodies[0]
+        assert json.loads(bodies[0])["metadata"] == {"count": 2}
+        assert "_webhook_json" in vars(message)
+
+    def test_send_does_not_block(self):
+        """Test that send returns before delivery finishes."""
+        config = NotificationConfig(
+            enabled=True,
+            channels=["slack"],
+            slack_webhook="https://hooks.slack.com/test",
+        )
+        manager = NotificationManager(config)
+        release = threading.Event()
+
+        with patch.dict(manager._dispatchers, slack=lambda m: release.wait(5)):
+            assert manager.send(NotificationMessage(title="Test", body="Body")) is True
+            assert manager.flush(timeout=0.01) is False
+
+            release.set()
+            assert manager.close() is True
+
+        assert manager.summary()["sent"] == 1
+
+    def test_channels_sent_concurrently(self):
+        """Test that all channels of a message are dispatched in parallel."""
+        config = NotificationConfig(enabled=True, channels=["slack", "email", "webhook", "sms"])
+        manager = NotificationManager(config)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others(message):
+            barrier.wait()
+            return True
+
+        with patch.dict(
+            manager._dispatchers,
+            slack=wait_for_others,
+            email=wait_for_others,
+            webhook=wait_for_others,
+        ):
+            manager.send(NotificationMessage(title="Test", body="Body"))
+            assert manager.close() is True
+
+        assert manager.summary()["sent"] == 1
+
+    def test_one_failed_channel_fails_message(self):
+        """Test that a single failing channel marks the message as failed."""
+        config = NotificationConfig(enabled=True, channels=["slack", "webhook"])
+        manager = NotificationManager(config)
+
+        mock_slack = MagicMock(return_value=True)
+        with patch.dict(manager._dispatchers, slack=mock_slack, webhook=MagicMock(return_value=False)):
+            manager.send(NotificationMessage(title="Test", body="Body"))
+            assert manager.flush() is False
+
+        mock_slack.assert_called_once()
+        assert manager.summary()["sent"] == 0
+
+    def test_flush_reports_failure(self):
+        """Test that flush reports a failed delivery."""
+        config = NotificationConfig(enabled=True, channels=["slack"])
+        manager = NotificationManager(config)
+
+        manager.send(NotificationMessage(title="Test", body="Body"))
+
+        # No webhook configured, so the Slack channel fails
+        assert manager.flush() is False
+        assert manager.summary()["sent"] == 0
 
     def test_send_update_summary(self):
         """Test sending update summary."""
@@ -138,6 +345,28 @@ class TestNotificationManager:
 
         assert result is True  # Returns True when disabled
 
+    def test_send_update_summary_disabled_skips_formatting(self):
+        """Test that a disabled manager does not build the summary message."""
+        manager = NotificationManager(NotificationConfig(enabled=False))
+
+        with patch("covert.notifications.NotificationMessage") as mock_message, \
+                patch.object(manager, "send") as mock_send:
+            assert manager.send_update_summary("Test", 1, 0, 0, 0, 1.0) is True
+
+        mock_message.assert_not_called()
+        mock_send.assert_not_called()
+
+    def test_send_update_summary_enabled(self):
+        """Test that an enabled manager queues the summary message."""
+        manager = NotificationManager(NotificationConfig(enabled=True))
+
+        with patch.object(manager, "send", return_value=True) as mock_send:
+            manager.send_update_summary("Test", 1, 1, 0, 0, 1.0)
+
+        message = mock_send.call_args[0][0]
+        assert message.title == "Covert Update: Test"
+        assert message.severity == "error"
+
     def test_summary(self):
         """Test getting summary of sent notifications."""
         config = NotificationConfig(enabled=False)
@@ -150,6 +379,116 @@ class TestNotificationManager:
         assert summary["sent"] == 0
 
 
+class TestEmailConnectionReuse:
+    """Tests for SMTP connection reuse in NotificationManager."""
+
+    @pytest.fixture
+    def email_manager(self):
+        """Notification manager configured for email only."""
+        config = NotificationConfig(
+            enabled=True,
+            channels=["email"],
+            email_enabled=True,
+            email_from="covert@example.com",
+            email_to=["dev@example.com"],
+            email_username="covert",
+            email_password="secret",
+        )
+        return NotificationManager(config)
+
+    @patch("covert.notifications.smtplib.SMTP")
+    def test_connection_reused(self, mock_smtp, email_manager):
+        """Test that consecutive emails share one authenticated connection."""
+        server = mock_smtp.return_value
+        server.noop.return_value = (250, b"OK")
+
+        assert email_manager.send(NotificationMessage(title="One", body="1")) is True
+        assert email_manager.send(NotificationMessage(title="Two", body="2")) is True
+        assert email_manager.flush() is True
+
+        mock_smtp.assert_called_once_with("smtp.gmail.com", 587)
+        server.starttls.assert_called_once()
+        server.login.assert_called_once_with("covert", "secret")
+        assert server.sendmail.call_count == 2
+        server.quit.assert_not_called()
+
+        email_manager.close()
+        server.quit.assert_called_once()
+
+    @patch("covert.notifications.smtplib.SMTP")
+    def test_reconnects_after_disconnect(self, mock_smtp, email_manager):
+        """Test that a dead cached connection is replaced."""
+        first, second = MagicMock(), MagicMock()
+        first.noop.side_effect = smtplib.SMTPServerDisconnected()
+        first.quit.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp.side_effect = [first, second]
+
+        email_manager.send(NotificationMessage(title="One", body="1"))
+        email_manager.send(NotificationMessage(title="Two", body="2"))
+        assert email_manager.flush() is True
+
+        assert mock_smtp.call_count == 2
+        first.close.assert_called_once()
+        second.sendmail.assert_called_once()
+
+    @patch("covert.notifications.smtplib.SMTP")
+    def test_failed_login_not_cached(self, mock_smtp, email_manager):
+        """Test that a connection whose login failed is not kept."""
+        mock_smtp.return_value.login.side_effect = smtplib.SMTPAuthenticationError(535, b"no")
+
+        email_manager.send(NotificationMessage(title="One", body="1"))
+        assert email_manager.flush() is False
+
+        assert email_manager._smtp is None
+        mock_smtp.return_value.close.assert_called_once()
+
+
+class TestEmailRendering:
+    """Tests for raw email rendering in NotificationManager."""
+
+    @staticmethod
+    def _manager(email_to):
+        """Notification manager sending email to the given recipients."""
+        config = NotificationConfig(
+            enabled=True,
+            channels=["email"],
+            email_enabled=True,
+            email_from="covert@example.com",
+            email_to=email_to,
+        )
+        return NotificationManager(config)
+
+    def test_render_email_parts(self):
+        """Test that the rendered email parses as multipart/alternative."""
+        manager = self._manager(["dev@example.com", "ops@example.com"])
+        message = NotificationMessage(title="Updaté\ndone", body="Body ✓\n", severity="error")
+
+        raw = manager._render_email(message)
+        parsed = email.message_from_bytes(raw)
+
+        assert isinstance(raw, bytes)
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+        assert parsed.get_content_type() == "multipart/alternative"
+        assert str(make_header(decode_header(parsed["Subject"]))) == "Updaté done"
+        assert parsed["To"] == "dev@example.com, ops@example.com"
+        text, html = parsed.get_payload()
+        assert text.get_payload(decode=True).decode("utf-8") == "Body ✓\n"
+        assert html.get_content_type() == "text/html"
+        assert "#f44336" in html.get_payload(decode=True).decode("utf-8")
+
+    def test_render_email_non_ascii_address(self):
+        """Test that non-ASCII recipients fall back to MIME assembly."""
+        manager = self._manager(["José <jose@example.com>"])
+
+        raw = manager._render_email(NotificationMessage(title="Test", body="Body"))
+        parsed = email.message_from_bytes(raw)
+
+        assert b"\n" not in raw.replace(b"\r\n", b"")
+
+        assert str(make_header(decode_header(parsed["To"]))) == "José <jose@example.com>"
+        assert len(parsed.get_payload()) == 2
+
+
 class TestCreateNotificationConfig:
     """Tests for the create_notification_config function."""
 
@@ -232,3 +571,21 @@ class TestNotificationMessageFormatting:
         html = manager._format_html_message(message)
 
         assert "#f44336" in html  # Error color
+
+    def test_format_html_message_layout(self):
+        """Test that CSS and the timestamp are rendered into the template."""
+        manager = NotificationManager(NotificationConfig(enabled=False))
+
+        message = NotificationMessage(
+            title="Title",
+            body="Body",
+            severity="unknown",
+            timestamp=datetime(2024, 1, 1, 10, 0, 0),
+        )
+
+        html = manager._format_html_message(message)
+
+        assert "body { font-family: Arial, sans-serif; line-height: 1.6; }" in html
+        assert "background-color: #2196f3;" in html  # Default color
+        assert "Sent by Covert Updater at 2024-01-01 10:00:00" in html
+        assert "{" not in html.replace("{ ", "")
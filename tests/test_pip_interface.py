@@ -1,23 +1,42 @@
 """Unit tests for pip_interface module."""
 
+import hashlib
 import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from covert import pip_interface
 from covert.exceptions import PipError, ValidationError
 from covert.pip_interface import (
+    CommandResult,
     check_package_exists,
+    check_packages_exist,
+    clear_pip_cache,
     freeze_requirements,
     get_outdated_packages,
+    get_package_hash,
     get_package_version,
+    get_package_versions,
     install_package,
+    install_packages,
+    iter_installed_packages,
     list_installed_packages,
     run_secure_command,
     uninstall_package,
+    uninstall_packages,
+    verify_and_install_package,
 )
 
 
+@pytest.fixture(autouse=True)
+def same_environment(monkeypatch):
+    """Let installed packages be read in-process, as when pip is covert's own."""
+    monkeypatch.setattr(pip_interface.pip_worker, "pip_uses_this_interpreter", lambda: True)
+
+
 class TestRunSecureCommand:
     """Tests for run_secure_command function."""
 
@@ -26,8 +45,8 @@ class TestRunSecureCommand:
         """Test executing command as string."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"output"
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         result = run_secure_command("echo hello")
@@ -40,8 +59,8 @@ class TestRunSecureCommand:
         """Test executing command as list."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"output"
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         result = run_secure_command(["echo", "hello"])
@@ -49,13 +68,31 @@ class TestRunSecureCommand:
         mock_run.assert_called_once()
         assert result.returncode == 0
 
+    @patch("covert.pip_interface.subprocess.run")
+    def test_command_string_respects_quotes(self, mock_run):
+        """Test that string commands are split with shell-like quoting."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_secure_command('echo "hello world"')
+
+        assert mock_run.call_args[0][0] == ["echo", "hello world"]
+
+    @patch("covert.pip_interface.subprocess.run")
+    def test_command_as_tuple(self, mock_run):
+        """Test that tuple commands are passed to subprocess as a list."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_secure_command(("pip", "freeze"))
+
+        assert mock_run.call_args[0][0] == ["pip", "freeze"]
+
     @patch("covert.pip_interface.subprocess.run")
     def test_shell_false(self, mock_run):
         """Test that shell=False is always used."""
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"output"
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         run_secure_command("echo hello")
@@ -63,6 +100,31 @@ class TestRunSecureCommand:
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["shell"] is False
 
+    @patch("covert.pip_interface.subprocess.run")
+    def test_closes_inherited_fds(self, mock_run):
+        """Test that inherited descriptors are not leaked into the child."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_secure_command(["echo", "hello"])
+
+        assert mock_run.call_args[1]["close_fds"] is True
+
+    @patch("covert.pip_interface.subprocess.run")
+    def test_output_captured_as_bytes(self, mock_run):
+        """Test that output is captured as bytes and decoded on access."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "héllo".encode()
+        mock_result.stderr = b"\xff"
+        mock_run.return_value = mock_result
+
+        result = run_secure_command(["echo", "hello"])
+
+        assert "text" not in mock_run.call_args[1]
+        assert result.stdout_bytes == "héllo".encode()
+        assert result.stdout == "héllo"
+        assert result.stderr == "�"
+
     @patch("covert.pip_interface.subprocess.run")
     def test_timeout_expired(self, mock_run):
         """Test handling of timeout."""
@@ -86,30 +148,161 @@ class TestRunSecureCommand:
         """Test that check=True raises error on non-zero exit."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "error"
+        mock_result.stdout = b""
+        mock_result.stderr = b"error"
         mock_run.return_value = mock_result
 
         with pytest.raises(PipError):
             run_secure_command("false", check=True)
 
 
+class TestGetPackageHash:
+    """Tests for get_package_hash function."""
+
+    @staticmethod
+    def _pypi(files):
+        """HTTP client serving a PyPI release with the given files."""
+        return httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"urls": files}))
+        )
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_prefers_compatible_wheel(self, mock_run):
+        """Test that the published digest of the best matching wheel is used."""
+        files = [
+            {"filename": "pkg-1.0.tar.gz", "packagetype": "sdist", "digests": {"sha256": "sdist"}},
+            {
+                "filename": "pkg-1.0-cp27-cp27mu-manylinux1_i686.whl",
+                "packagetype": "bdist_wheel",
+                "digests": {"sha256": "incompatible"},
+            },
+            {
+                "filename": "pkg-1.0-py3-none-any.whl",
+                "packagetype": "bdist_wheel",
+                "digests": {"sha256": "universal"},
+            },
+        ]
+
+        with patch("covert.lockfile._get_pypi_client", return_value=self._pypi(files)):
+            result = get_package_hash("pkg", "1.0")
+
+        assert result == "sha256:universal"
+        mock_run.assert_not_called()
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_sdist_when_no_wheel(self, mock_run):
+        """Test falling back to the sdist digest without downloading."""
+        files = [
+            {"filename": "pkg-1.0.tar.gz", "packagetype": "sdist", "digests": {"sha256": "sdist"}},
+        ]
+
+        with patch("covert.lockfile._get_pypi_client", return_value=self._pypi(files)):
+            assert get_package_hash("pkg", "1.0") == "sha256:sdist"
+
+        mock_run.assert_not_called()
+
+    @patch("covert.pip_interface._get_published_hash", return_value=None)
+    @patch("covert.pip_interface.run_secure_command")
+    def test_hashes_downloaded_file(self, mock_run, mock_published):
+        """Test hashing the downloaded distribution when PyPI has no digest."""
+        content = b"wheel contents" * 1000
+
+        def download(cmd, timeout=None):
+            dest = Path(cmd[cmd.index("--dest") + 1])
+            (dest / "requests-2.31.0-py3-none-any.whl").write_bytes(content)
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        mock_run.side_effect = download
+
+        result = get_package_hash("requests", "2.31.0")
+
+        assert result == f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+    @patch("covert.pip_interface._get_published_hash", return_value=None)
+    @patch("covert.pip_interface.run_secure_command")
+    def test_download_failure(self, mock_run, mock_published):
+        """Test that a failed download yields no hash."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error")
+
+        assert get_package_hash("requests", "2.31.0") is None
+
+
+class TestVerifyAndInstallPackage:
+    """Tests for verify_and_install_package function."""
+
+    CONTENT = b"wheel contents"
+
+    def _pip(self, commands):
+        """Fake pip that records commands and downloads a wheel."""
+
+        def run(cmd, timeout=None):
+            commands.append(cmd)
+            if cmd[1] == "download":
+                dest = Path(cmd[cmd.index("--dest") + 1])
+                (dest / "requests-2.31.0-py3-none-any.whl").write_bytes(self.CONTENT)
+            elif "-r" in cmd:
+                requirements = Path(cmd[cmd.index("-r") + 1])
+                commands.append(requirements.read_text())
+            return CommandResult(cmd, 0, b"", b"")
+
+        return run
+
+    @patch("covert.lockfile.get_package_hashes")
+    @patch("covert.pip_interface.run_secure_command")
+    def test_installs_downloaded_file(self, mock_run, mock_hashes):
+        """Test that the verified download is installed without re-downloading."""
+        file_hash = f"sha256:{hashlib.sha256(self.CONTENT).hexdigest()}"
+        mock_hashes.return_value = ["sha256:other", file_hash]
+        commands = []
+        mock_run.side_effect = self._pip(commands)
+
+        result = verify_and_install_package("requests", "2.31.0")
+
+        download, install, requirements, deps = commands
+        assert download[:2] == ["pip", "download"]
+        assert install[:2] == ["pip", "install"]
+        assert "--no-index" in install and "--require-hashes" in install
+        assert install[install.index("--find-links") + 1] == download[download.index("--dest") + 1]
+        assert requirements == f"requests==2.31.0 --hash={file_hash}\n"
+        assert deps[:2] == ["pip", "install"] and "requests==2.31.0" in deps
+        assert "--no-deps" not in deps
+        assert result == {"name": "requests", "version": "2.31.0"}
+
+    @patch("covert.lockfile.get_package_hashes", return_value=["sha256:expected"])
+    @patch("covert.pip_interface.run_secure_command")
+    def test_hash_mismatch(self, mock_run, mock_hashes):
+        """Test that a download not matching PyPI's digests is not installed."""
+        commands = []
+        mock_run.side_effect = self._pip(commands)
+
+        with pytest.raises(PipError, match="Hash verification failed"):
+            verify_and_install_package("requests", "2.31.0")
+
+        assert len(commands) == 1
+
+    @patch("covert.lockfile.get_package_hashes", return_value=[])
+    @patch("covert.pip_interface.run_secure_command")
+    def test_no_published_hashes(self, mock_run, mock_hashes):
+        """Test that a release without published digests is not installed."""
+        with pytest.raises(PipError, match="No published hashes"):
+            verify_and_install_package("requests", "2.31.0")
+
+        mock_run.assert_not_called()
+
+
 class TestGetOutdatedPackages:
     """Tests for get_outdated_packages function."""
 
     @patch("covert.pip_interface.run_secure_command")
     def test_successful_list(self, mock_run):
         """Test successful listing of outdated packages."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(
+        output = json.dumps(
             [
                 {"name": "requests", "version": "2.25.0", "latest_version": "2.31.0"},
                 {"name": "django", "version": "4.2.0", "latest_version": "5.0.0"},
             ]
-        )
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        ).encode()
+        mock_run.return_value = CommandResult(["pip"], 0, output, b"")
 
         packages = get_outdated_packages()
 
@@ -120,11 +313,7 @@ class TestGetOutdatedPackages:
     @patch("covert.pip_interface.run_secure_command")
     def test_no_outdated_packages(self, mock_run):
         """Test handling when no outdated packages."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "[]"
-        mock_result.stderr = "WARNING: No packages found"
-        mock_run.return_value = mock_result
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"WARNING: No packages found")
 
         packages = get_outdated_packages()
 
@@ -133,11 +322,7 @@ class TestGetOutdatedPackages:
     @patch("covert.pip_interface.run_secure_command")
     def test_invalid_json(self, mock_run):
         """Test handling of invalid JSON output."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "invalid json"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_run.return_value = CommandResult(["pip"], 0, b"invalid json", b"")
 
         with pytest.raises(PipError):
             get_outdated_packages()
@@ -145,11 +330,7 @@ class TestGetOutdatedPackages:
     @patch("covert.pip_interface.run_secure_command")
     def test_command_failure(self, mock_run):
         """Test handling of pip command failure."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "pip error"
-        mock_run.return_value = mock_result
+        mock_run.return_value = CommandResult(["pip"], 1, b"", b"pip error")
 
         with pytest.raises(PipError):
             get_outdated_packages()
@@ -175,21 +356,38 @@ class TestInstallPackage:
         assert result["version"] == "2.31.0"
 
     @patch("covert.pip_interface.run_secure_command")
-    @patch("covert.pip_interface.get_package_version")
-    def test_install_without_version(self, mock_get_version, mock_run):
+    @patch("covert.pip_interface.get_package_versions")
+    def test_install_without_version(self, mock_get_versions, mock_run):
         """Test installing without specifying version."""
         mock_result = MagicMock()
         mock_result.returncode = 0
         mock_result.stdout = "Successfully installed"
         mock_result.stderr = ""
         mock_run.return_value = mock_result
-        mock_get_version.return_value = "2.31.0"
+        mock_get_versions.return_value = {"requests": "2.31.0"}
 
         result = install_package("requests")
 
         assert result["name"] == "requests"
         assert result["version"] == "2.31.0"
 
+    @patch("covert.pip_interface.run_secure_command")
+    @patch("covert.pip_interface.get_package_versions")
+    def test_install_version_from_pip_output(self, mock_get_version, mock_run):
+        """Test that the installed version is read from pip's own output."""
+        mock_run.return_value = CommandResult(
+            ["pip"],
+            0,
+            b"Collecting Typing_Extensions\n"
+            b"Successfully installed idna-3.6 typing_extensions-4.9.0 urllib3-2.1.0\n",
+            b"",
+        )
+
+        result = install_package("typing-extensions")
+
+        assert result["version"] == "4.9.0"
+        mock_get_version.assert_not_called()
+
     @patch("covert.pip_interface.run_secure_command")
     def test_install_with_upgrade(self, mock_run):
         """Test installing with upgrade flag."""
@@ -238,6 +436,133 @@ class TestInstallPackage:
             install_package("requests", version="invalid.version")
 
 
+class TestInstallPackages:
+    """Tests for install_packages function."""
+
+    @patch("covert.pip_interface._pip_supports_report", return_value=False)
+    @patch("covert.pip_interface.get_package_versions", return_value={"django": "5.0.0"})
+    @patch("covert.pip_interface.run_secure_command")
+    def test_single_invocation(self, mock_run, mock_versions, mock_report):
+        """Test that all packages are installed with one pip call."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        result = install_packages([("requests", "2.31.0"), ("django", None)])
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["pip", "install", "requests==2.31.0", "django"]
+        mock_versions.assert_called_once_with(["django"])
+        assert result == [
+            {"name": "requests", "version": "2.31.0"},
+            {"name": "django", "version": "5.0.0"},
+        ]
+
+    @patch("covert.pip_interface._pip_supports_report", return_value=False)
+    @patch("covert.pip_interface.get_package_versions")
+    @patch("covert.pip_interface.run_secure_command")
+    def test_versions_from_pip_output(self, mock_run, mock_versions, mock_report):
+        """Test that versions pip reports are used without scanning the environment."""
+        mock_run.return_value = CommandResult(
+            ["pip"], 0, b"Successfully installed Django-5.0.1 flask-3.0.0\n", b""
+        )
+
+        result = install_packages([("django", None), ("flask", None)])
+
+        assert [p["version"] for p in result] == ["5.0.1", "3.0.0"]
+        mock_versions.assert_not_called()
+
+    @patch("covert.pip_interface._pip_supports_report", return_value=True)
+    @patch("covert.pip_interface.get_package_versions")
+    @patch("covert.pip_interface.run_secure_command")
+    def test_versions_from_install_report(self, mock_run, mock_versions, mock_report):
+        """Test that unpinned versions are read from pip's JSON install report."""
+        report = {"install": [
+            {"metadata": {"name": "Django", "version": "5.0.1"}},
+            {"metadata": {"name": "asgiref", "version": "3.7.2"}},
+        ]}
+        mock_run.return_value = CommandResult(["pip"], 0, json.dumps(report).encode(), b"")
+
+        result = install_packages([("django", None)])
+
+        assert mock_run.call_args[0][0] == ["pip", "install", "django", "--quiet", "--report", "-"]
+        assert result == [{"name": "django", "version": "5.0.1"}]
+        mock_versions.assert_not_called()
+
+    @patch("covert.pip_interface._pip_supports_report", return_value=True)
+    @patch("covert.pip_interface.get_package_versions", return_value={"django": "5.0.0"})
+    @patch("covert.pip_interface.run_secure_command")
+    def test_already_satisfied_falls_back_to_environment(self, mock_run, mock_versions, mock_report):
+        """Test that packages missing from the report are looked up locally."""
+        mock_run.return_value = CommandResult(["pip"], 0, b'{"install": []}', b"")
+
+        result = install_packages([("django", None)])
+
+        assert result == [{"name": "django", "version": "5.0.0"}]
+        mock_versions.assert_called_once_with(["django"])
+
+    @patch("covert.pip_interface._pip_supports_report", return_value=True)
+    @patch("covert.pip_interface.run_secure_command")
+    def test_pinned_packages_skip_report(self, mock_run, mock_report):
+        """Test that no report is requested when every version is pinned."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        install_packages([("requests", "2.31.0")])
+
+        assert "--report" not in mock_run.call_args[0][0]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_no_deps(self, mock_run):
+        """Test that dependency resolution can be skipped."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        install_packages([("requests", "2.31.0")], no_deps=True)
+
+        assert mock_run.call_args[0][0] == ["pip", "install", "--no-deps", "requests==2.31.0"]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_upgrade_and_pre_release(self, mock_run):
+        """Test that upgrade and pre-release flags apply to the whole batch."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        install_packages([("requests", "2.31.0"), ("django", "5.0.0")], upgrade=True, pre_release=True)
+
+        assert mock_run.call_args[0][0] == [
+            "pip", "install", "requests==2.31.0", "django==5.0.0", "--upgrade", "--pre",
+        ]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_empty_list(self, mock_run):
+        """Test that nothing is run for an empty list."""
+        assert install_packages([]) == []
+        mock_run.assert_not_called()
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_failure(self, mock_run):
+        """Test handling of batch installation failure."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="boom")
+
+        with pytest.raises(PipError):
+            install_packages([("requests", "2.31.0")])
+
+    def test_invalid_version_raises_error(self):
+        """Test that an invalid version is rejected before running pip."""
+        with pytest.raises(ValidationError):
+            install_packages([("requests", "invalid.version")])
+
+
+class TestUninstallPackages:
+    """Tests for uninstall_packages function."""
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_single_invocation(self, mock_run):
+        """Test that all packages are uninstalled with one pip call."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        uninstall_packages(["requests", "django"])
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["pip", "uninstall", "-y", "requests", "django"]
+
+
 class TestUninstallPackage:
     """Tests for uninstall_package function."""
 
@@ -301,6 +626,26 @@ class TestFreezeRequirements:
         assert result[0]["name"] == "requests"
         assert result[0]["version"] == "2.31.0"
 
+    @patch("covert.pip_interface.run_secure_command")
+    def test_freeze_json_skips_unpinned_lines(self, mock_run):
+        """Test that only pinned requirements are parsed into JSON."""
+        mock_run.return_value = CommandResult(
+            ["pip"],
+            0,
+            b"-e git+https://example.com/repo.git#egg=local\r\n"
+            b"Django==5.0.0\r\n"
+            b"mypkg @ file:///tmp/mypkg\n"
+            b"zope.interface==6.1 \n",
+            b"",
+        )
+
+        result = freeze_requirements(format_type="json")
+
+        assert result == [
+            {"name": "Django", "version": "5.0.0"},
+            {"name": "zope.interface", "version": "6.1"},
+        ]
+
     @patch("covert.pip_interface.run_secure_command")
     def test_invalid_format(self, mock_run):
         """Test that invalid format raises ValidationError."""
@@ -314,18 +659,38 @@ class TestFreezeRequirements:
             freeze_requirements(format_type="invalid")
 
     @patch("covert.pip_interface.run_secure_command")
-    @patch("pathlib.Path.write_text")
-    def test_save_to_file(self, mock_write, mock_run):
-        """Test saving requirements to file."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "requests==2.31.0\n"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+    def test_save_to_file(self, mock_run, tmp_path):
+        """Test saving requirements to file with pip's bytes unchanged."""
+        output = "requests==2.31.0\ncafé==1.0\n".encode()
+        mock_run.return_value = CommandResult(["pip"], 0, output, b"")
+        output_path = tmp_path / "reqs" / "requirements.txt"
+
+        freeze_requirements(output_path=output_path, format_type="txt")
+
+        assert output_path.read_bytes() == output
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_save_json_to_file(self, mock_run, tmp_path):
+        """Test saving requirements as JSON."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"requests==2.31.0\n", b"")
+        output_path = tmp_path / "requirements.json"
+
+        freeze_requirements(output_path=output_path, format_type="json")
 
-        freeze_requirements(output_path="requirements.txt", format_type="txt")
+        assert json.loads(output_path.read_text()) == [{"name": "requests", "version": "2.31.0"}]
 
-        mock_write.assert_called_once()
+    @patch("covert.pip_interface.run_secure_command")
+    def test_output_directory_created_once(self, mock_run, tmp_path):
+        """Test that repeated saves to one directory only create it once."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"requests==2.31.0\n", b"")
+        output_dir = tmp_path / "phases"
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            freeze_requirements(output_path=output_dir / "before.txt")
+            freeze_requirements(output_path=output_dir / "after.txt")
+
+        assert [c[0][0] for c in mock_mkdir.call_args_list] == [output_dir]
+        assert (output_dir / "after.txt").exists()
 
 
 class TestGetPackageVersion:
@@ -333,64 +698,294 @@ class TestGetPackageVersion:
 
     @patch("covert.pip_interface.run_secure_command")
     def test_get_version(self, mock_run):
-        """Test getting package version."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Name: requests\nVersion: 2.31.0\n"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        """Test getting package version from installed metadata."""
+        version = get_package_version("pytest")
 
-        version = get_package_version("requests")
+        assert version == pytest.__version__
+        mock_run.assert_not_called()
 
-        assert version == "2.31.0"
+    @patch("covert.pip_interface.importlib.metadata.version")
+    def test_get_version_normalized_name(self, mock_version):
+        """Test that the sanitized name is looked up."""
+        mock_version.return_value = "2.31.0"
 
-    @patch("covert.pip_interface.run_secure_command")
-    def test_package_not_found(self, mock_run):
-        """Test handling of package not found."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        assert get_package_version("Requests") == "2.31.0"
+        mock_version.assert_called_once_with("requests")
 
-        version = get_package_version("nonexistent")
+    def test_package_not_found(self):
+        """Test handling of package not found."""
+        version = get_package_version("nonexistent-covert-test-package")
 
         assert version is None
 
+    @patch("covert.pip_interface.run_secure_command")
+    def test_get_version_with_pip(self, mock_run):
+        """Test asking pip show for the version."""
+        mock_run.return_value = CommandResult(
+            ["pip"], 0, b"Name: requests\nVersion: 2.31.0\nSummary: HTTP\n", b""
+        )
+
+        assert get_package_version("requests", use_pip=True) == "2.31.0"
+        assert mock_run.call_args[0][0] == ["pip", "show", "requests"]
+
+    @patch("covert.pip_interface.importlib.metadata.version")
+    @patch("covert.pip_interface.run_secure_command")
+    def test_get_version_other_environment(self, mock_run, mock_version, monkeypatch):
+        """Test that pip is asked when it manages another environment."""
+        monkeypatch.setattr(pip_interface.pip_worker, "pip_uses_this_interpreter", lambda: False)
+        mock_run.return_value = CommandResult(
+            ["pip"], 0, b"Name: requests\nVersion: 2.31.0\n", b""
+        )
+
+        assert get_package_version("requests") == "2.31.0"
+        mock_version.assert_not_called()
+
 
 class TestListInstalledPackages:
     """Tests for list_installed_packages function."""
 
     @patch("covert.pip_interface.run_secure_command")
     def test_list_packages(self, mock_run):
-        """Test listing installed packages."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(
-            [
-                {"name": "requests", "version": "2.31.0"},
-                {"name": "django", "version": "5.0.0"},
-            ]
-        )
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
+        """Test listing installed packages from metadata."""
         packages = list_installed_packages()
 
-        assert len(packages) == 2
-        assert packages[0]["name"] == "requests"
+        mock_run.assert_not_called()
+        by_name = {p["name"].lower(): p["version"] for p in packages}
+        assert by_name["pytest"] == pytest.__version__
+        assert [p["name"].lower() for p in packages] == sorted(by_name)
+
+    @patch("covert.pip_interface.importlib.metadata.distributions")
+    def test_first_distribution_wins(self, mock_distributions):
+        """Test that shadowed duplicate distributions are ignored."""
+        mock_distributions.return_value = [
+            MagicMock(metadata={"Name": "requests"}, version="2.31.0"),
+            MagicMock(metadata={"Name": "Django"}, version="5.0.0"),
+            MagicMock(metadata={"Name": "requests"}, version="2.0.0"),
+            MagicMock(metadata={"Name": None}, version="0.0.0"),
+        ]
+
+        assert list_installed_packages() == [
+            {"name": "Django", "version": "5.0.0"},
+            {"name": "requests", "version": "2.31.0"},
+        ]
+
+    @patch("covert.pip_interface.importlib.metadata.distributions")
+    def test_iter_installed_packages_streams(self, mock_distributions):
+        """Test that packages are yielded in sys.path order as they are read."""
+        read = []
+
+        def distributions():
+            for name, version in [("zope", "1.0"), ("Django", "5.0.0"), ("zope", "0.9")]:
+                read.append(name)
+                yield MagicMock(metadata={"Name": name}, version=version)
+
+        mock_distributions.side_effect = distributions
+
+        packages = iter_installed_packages()
+        assert next(packages) == {"name": "zope", "version": "1.0"}
+        assert read == ["zope"]
+        assert list(packages) == [{"name": "Django", "version": "5.0.0"}]
 
     @patch("covert.pip_interface.run_secure_command")
-    def test_command_failure(self, mock_run):
-        """Test handling of command failure."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "error"
-        mock_run.return_value = mock_result
+    def test_list_packages_with_pip(self, mock_run):
+        """Test asking pip list, cached separately from the metadata view."""
+        mock_run.return_value = CommandResult(
+            ["pip"], 0, b'[{"name": "requests", "version": "2.31.0"}]', b""
+        )
+
+        assert list_installed_packages(use_pip=True) == [{"name": "requests", "version": "2.31.0"}]
+        assert list_installed_packages(use_pip=True) == [{"name": "requests", "version": "2.31.0"}]
+        assert mock_run.call_count == 1
+        assert list_installed_packages() != [{"name": "requests", "version": "2.31.0"}]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_list_packages_with_pip_failure(self, mock_run):
+        """Test that a failing pip list raises PipError."""
+        mock_run.return_value = CommandResult(["pip"], 1, b"", b"boom")
 
         with pytest.raises(PipError):
-            list_installed_packages()
+            list_installed_packages(use_pip=True)
+
+
+class TestEnvironmentCache:
+    """Tests for caching of environment listings."""
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_outdated_packages_cached(self, mock_run):
+        """Test that repeated calls reuse the cached pip output."""
+        mock_run.return_value = CommandResult(["pip"], 0, b'[{"name": "requests"}]', b"")
+
+        first = get_outdated_packages()
+        first[0]["name"] = "mutated"
+        second = get_outdated_packages()
+
+        assert mock_run.call_count == 1
+        assert second == [{"name": "requests"}]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_install_invalidates_cache(self, mock_run):
+        """Test that a successful install drops cached listings."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+
+        get_outdated_packages()
+        install_package("requests", version="2.31.0")
+        get_outdated_packages()
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["list", "install", "list"]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_uninstall_invalidates_cache(self, mock_run):
+        """Test that a successful uninstall drops cached listings."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+
+        get_outdated_packages()
+        uninstall_package("requests")
+        get_outdated_packages()
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["list", "uninstall", "list"]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_cache_expires(self, mock_run, monkeypatch):
+        """Test that cached listings expire after the TTL."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+        monkeypatch.setenv("COVERT_PIP_CACHE_TTL", "-1")
+        monkeypatch.setattr("covert.pip_interface.time.monotonic", lambda: 0.0)
+        get_outdated_packages()
+
+        monkeypatch.setattr("covert.pip_interface.time.monotonic", lambda: 31.0)
+        get_outdated_packages()
+
+        assert mock_run.call_count == 2
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_outdated_packages_persisted(self, mock_run, tmp_path):
+        """Test that a later run reads outdated packages from disk."""
+        mock_run.return_value = CommandResult(["pip"], 0, b'[{"name": "requests"}]', b"")
+
+        get_outdated_packages()
+        pip_interface._cache.clear()  # a new process starts with an empty memory cache
+        packages = get_outdated_packages()
+
+        assert packages == [{"name": "requests"}]
+        assert mock_run.call_count == 1
+        assert len(list((tmp_path / "xdg-cache" / "covert" / "pip").glob("*.json"))) == 1
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_install_removes_persisted_listing(self, mock_run):
+        """Test that installing drops the on-disk outdated listing."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+
+        get_outdated_packages()
+        install_package("requests", version="2.31.0")
+        pip_interface._cache.clear()
+        get_outdated_packages()
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["list", "install", "list"]
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_outdated_listing_stale_after_environment_change(self, mock_run, monkeypatch):
+        """Test that a persisted listing is not reused once site-packages changed."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+        monkeypatch.setattr(pip_interface, "_environment_state", lambda: "1")
+        get_outdated_packages()
+        pip_interface._cache.clear()
+
+        monkeypatch.setattr(pip_interface, "_environment_state", lambda: "2")
+        get_outdated_packages()
+
+        assert mock_run.call_count == 2
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_outdated_listing_not_persisted_for_other_environment(self, mock_run, monkeypatch):
+        """Test that a listing is kept off disk when pip's site-packages is unknown."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"[]", b"")
+        monkeypatch.setattr(pip_interface, "_environment_state", lambda: None)
+        get_outdated_packages()
+        pip_interface._cache.clear()
+        get_outdated_packages()
+
+        assert mock_run.call_count == 2
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_package_exists_persisted(self, mock_run):
+        """Test that only positive package lookups are cached."""
+        mock_run.side_effect = [
+            CommandResult(["pip"], 0, b"", b""),
+            CommandResult(["pip"], 1, b"", b""),
+            CommandResult(["pip"], 1, b"", b""),
+            CommandResult(["pip"], 1, b"", b""),
+        ]
+
+        assert check_package_exists("requests") is True
+        assert check_package_exists("missing") is False
+        assert check_package_exists("missing") is False
+        pip_interface._cache.clear()
+
+        assert check_package_exists("requests") is True
+        assert check_package_exists("missing") is False
+        assert mock_run.call_count == 4
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_clear_pip_cache(self, mock_run):
+        """Test that clearing the cache forces fresh lookups."""
+        mock_run.return_value = CommandResult(["pip"], 0, b"", b"")
+
+        check_package_exists("requests")
+        clear_pip_cache()
+        check_package_exists("requests")
+
+        assert mock_run.call_count == 2
+
+
+class TestGetPackageVersions:
+    """Tests for get_package_versions function."""
+
+    @patch("covert.pip_interface.importlib.metadata.distributions")
+    def test_single_scan(self, mock_distributions):
+        """Test that several lookups share one scan of the environment."""
+        mock_distributions.return_value = [
+            MagicMock(metadata={"Name": "Django"}, version="5.0.0"),
+            MagicMock(metadata={"Name": "typing_extensions"}, version="4.9.0"),
+        ]
+
+        first = get_package_versions(["django", "typing-extensions", "missing"])
+        second = get_package_versions(["Django"])
+
+        assert first == {"django": "5.0.0", "typing-extensions": "4.9.0", "missing": None}
+        assert second == {"Django": "5.0.0"}
+        mock_distributions.assert_called_once()
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_with_pip_single_invocation(self, mock_run):
+        """Test that pip show is run once for all packages."""
+        mock_run.return_value = CommandResult(
+            ["pip"],
+            1,
+            b"Name: Django\nVersion: 5.0.0\nSummary: Web\n---\n"
+            b"Name: typing_extensions\nVersion: 4.9.0\n",
+            b"WARNING: Package(s) not found: missing",
+        )
+
+        result = get_package_versions(["django", "Typing-Extensions", "missing"], use_pip=True)
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "pip", "show", "django", "typing-extensions", "missing",
+        ]
+        assert result == {"django": "5.0.0", "Typing-Extensions": "4.9.0", "missing": None}
+
+    @patch("covert.pip_interface.run_secure_command")
+    @patch("covert.pip_interface.importlib.metadata.distributions")
+    def test_invalidated_by_install(self, mock_distributions, mock_run):
+        """Test that installing a package rescans the environment."""
+        mock_distributions.return_value = []
+        mock_run.return_value = CommandResult(["pip"], 0, b"", b"")
+
+        get_package_versions(["requests"])
+        install_packages([("requests", "2.31.0")])
+        get_package_versions(["requests"])
+
+        assert mock_distributions.call_count == 2
 
 
 class TestCheckPackageExists:
@@ -421,3 +1016,29 @@ class TestCheckPackageExists:
         result = check_package_exists("nonexistent-package-123")
 
         assert result is False
+
+
+class TestCheckPackagesExist:
+    """Tests for check_packages_exist function."""
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_results_in_given_order(self, mock_run):
+        """Test that every name is checked and order is preserved."""
+        mock_run.side_effect = lambda cmd: CommandResult(cmd, 0 if cmd[-1] != "missing" else 1, b"", b"")
+
+        result = check_packages_exist(["requests", "missing", "django"])
+
+        assert list(result.items()) == [("requests", True), ("missing", False), ("django", True)]
+        assert mock_run.call_count == 3
+
+    @patch("covert.pip_interface.run_secure_command")
+    def test_invalid_name_fails_before_lookups(self, mock_run):
+        """Test that invalid names are rejected before any pip call."""
+        with pytest.raises(ValidationError):
+            check_packages_exist(["requests", "bad;name"])
+
+        mock_run.assert_not_called()
+
+    def test_empty_list(self):
+        """Test that no names gives an empty result."""
+        assert check_packages_exist([]) == {}
@@ -0,0 +1,252 @@
+"""Tests for the pip_worker module.
+
+"""
+
+import io
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from covert import pip_worker
+from covert.pip_worker import PipWorker, handles, pip_interpreter, worker_enabled
+
+
+def _process(responses):
+    """Build a fake worker process that answers with the given lines."""
+    process = MagicMock()
+    process.poll.return_value = None
+    process.stdin = io.BytesIO()
+    process.stdout = io.BytesIO(b"".join(responses))
+    return process
+
+
+class TestPipWorker:
+    """Tests for the PipWorker class."""
+
+    @patch("covert.pip_worker.subprocess.Popen")
+    def test_run_returns_worker_response(self, mock_popen):
+        """Test that a request is written and the response decoded."""
+        process = _process([b'{"returncode": 0, "stdout": "requests==2.31.0\\n", "stderr": ""}\n'])
+        mock_popen.return_value = process
+        stdin = process.stdin
+
+        result = PipWorker(python="python").run(["freeze"])
+
+        assert result == (0, b"requests==2.31.0\n", b"")
+        assert b'"args"' in stdin.getvalue() and b'"freeze"' in stdin.getvalue()
+
+    @patch("covert.pip_worker.subprocess.Popen")
+    def test_process_started_once(self, mock_popen):
+        """Test that consecutive requests reuse the same process."""
+        line = b'{"returncode": 0, "stdout": "", "stderr": ""}\n'
+        mock_popen.return_value = _process([line, line])
+        worker = PipWorker(python="python")
+
+        worker.run(["list"])
+        worker.run(["show", "requests"])
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args[0][0][:3] == ["python", "-u", "-c"]
+
+    def test_ignores_metadata_in_cwd(self, tmp_path, monkeypatch):
+        """Test that the worker, like the pip script, does not see the cwd."""
+        pytest.importorskip("pip")
+        dist_info = tmp_path / "covert_cwd_probe-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text("Name: covert-cwd-probe\nVersion: 1.0\n")
+        monkeypatch.chdir(tmp_path)
+        worker = PipWorker(python=sys.executable)
+
+        try:
+            result = worker.run(["list", "--format=freeze"])
+        finally:
+            worker.close()
+
+        assert result is not None
+        assert b"covert-cwd-probe" not in result[1]
+
+    @patch("covert.pip_worker.subprocess.Popen")
+    def test_dead_worker_disables_itself(self, mock_popen):
+        """Test that an exited worker returns None and is not restarted."""
+        mock_popen.return_value = _process([])
+        worker = PipWorker(python="python")
+
+        assert worker.run(["list"]) is None
+        assert worker.run(["list"]) is None
+        mock_popen.assert_called_once()
+
+    @patch("covert.pip_worker.subprocess.Popen")
+    def test_busy_worker_returns_none(self, mock_popen):
+        """Test that a request made while the worker is busy is not queued."""
+        worker = PipWorker(python="python")
+        worker._lock.acquire()
+
+        try:
+            assert worker.run(["list"]) is None
+        finally:
+            worker._lock.release()
+
+        mock_popen.assert_not_called()
+
+    @patch("covert.pip_worker.subprocess.Popen", side_effect=OSError("no python"))
+    def test_start_failure_returns_none(self, mock_popen):
+        """Test that a worker that cannot start returns None."""
+        assert PipWorker(python="python").run(["list"]) is None
+
+
+class TestHandles:
+    """Tests for routing commands to the worker."""
+
+    @pytest.mark.parametrize("command", [["pip", "list"], ["pip", "show", "x"], ["pip", "freeze"]])
+    def test_read_only_commands(self, command, monkeypatch):
+        """Test that read-only pip commands are routed to the worker."""
+        monkeypatch.setenv("COVERT_PIP_WORKER", "1")
+
+        assert handles(command) is True
+
+    @pytest.mark.parametrize("command", [["pip", "install", "x"], ["pip", "uninstall", "-y", "x"], ["git", "status"]])
+    def test_other_commands(self, command, monkeypatch):
+        """Test that mutating or non-pip commands are not routed."""
+        monkeypatch.setenv("COVERT_PIP_WORKER", "1")
+
+        assert handles(command) is False
+
+    def test_disabled_by_environment(self, monkeypatch):
+        """Test that COVERT_PIP_WORKER=0 disables the worker."""
+        monkeypatch.setenv("COVERT_PIP_WORKER", "0")
+
+        assert worker_enabled() is False
+        assert handles(["pip", "list"]) is False
+
+
+@pytest.fixture
+def fake_pip(tmp_path):
+    """Create an executable ``pip`` script with the given shebang."""
+    pip_interpreter.cache_clear()
+
+    def make(shebang):
+        pip = tmp_path / "pip"
+        pip.write_text(f"{shebang}\nimport pip\n")
+        pip.chmod(0o755)
+        return str(tmp_path)
+
+    yield make
+    pip_interpreter.cache_clear()
+
+
+class TestPipInterpreter:
+    """Tests for finding the interpreter behind the pip on PATH."""
+
+    def test_reads_shebang(self, fake_pip, tmp_path):
+        """Test that the interpreter comes from the pip script's shebang."""
+        python = tmp_path / "python3.11"
+        python.touch()
+
+        assert pip_interpreter(fake_pip(f"#!{python}")) == str(python)
+
+    def test_env_shebang(self, fake_pip, tmp_path):
+        """Test that an env shebang is resolved on the same PATH."""
+        python = tmp_path / "python3"
+        python.touch()
+        python.chmod(0o755)
+
+        assert pip_interpreter(fake_pip("#!/usr/bin/env python3")) == str(python)
+
+    def test_unknown_interpreter(self, fake_pip):
+        """Test that a shim outside covert's environment is not guessed at."""
+        assert pip_interpreter(fake_pip("#!/usr/bin/env bash")) is None
+
+    def test_no_pip(self, tmp_path):
+        """Test that a PATH without pip has no interpreter."""
+        pip_interpreter.cache_clear()
+
+        assert pip_interpreter(str(tmp_path)) is None
+
+    def test_pip_uses_this_interpreter(self, fake_pip, monkeypatch):
+        """Test that a pip running sys.executable shares covert's environment."""
+        monkeypatch.setenv("PATH", fake_pip(f"#!{sys.executable}"))
+
+        assert pip_worker.pip_uses_this_interpreter() is True
+
+    def test_pip_uses_other_interpreter(self, fake_pip, tmp_path, monkeypatch):
+        """Test that a pip in another environment is not treated as covert's."""
+        python = tmp_path / "python"
+        python.symlink_to(sys.executable)
+        monkeypatch.setenv("PATH", fake_pip(f"#!{python}"))
+
+        assert pip_worker.pip_uses_this_interpreter() is False
+
+    @patch("covert.pip_worker.PipWorker")
+    def test_run_pip_uses_pip_interpreter(self, mock_worker, fake_pip, tmp_path, monkeypatch):
+        """Test that the shared worker runs the pip on PATH's interpreter."""
+        python = tmp_path / "python"
+        python.touch()
+        monkeypatch.setenv("PATH", fake_pip(f"#!{python}"))
+        monkeypatch.setattr(pip_worker, "_worker", None)
+
+        pip_worker.run_pip(["list"])
+
+        mock_worker.assert_called_once_with(str(python))
+
+    @patch("covert.pip_worker.PipWorker")
+    def test_run_pip_without_interpreter(self, mock_worker, fake_pip, monkeypatch):
+        """Test that the worker is not used when the interpreter is unknown."""
+        monkeypatch.setenv("PATH", fake_pip("#!/bin/sh"))
+
+        assert pip_worker.run_pip(["list"]) is None
+        mock_worker.assert_not_called()
+
+
+class TestRunSecureCommandDispatch:
+    """Tests for run_secure_command routing through the worker."""
+
+    @patch("covert.pip_interface.subprocess.run")
+    @patch("covert.pip_worker.run_pip", return_value=(0, b"[]", b""))
+    def test_read_only_pip_uses_worker(self, mock_run_pip, mock_run, monkeypatch):
+        """Test that pip list is served by the worker."""
+        from covert.pip_interface import run_secure_command
+
+        monkeypatch.setenv("COVERT_PIP_WORKER", "1")
+
+        result = run_secure_command(["pip", "list", "--format=json"])
+
+        mock_run_pip.assert_called_once_with(["list", "--format=json"])
+        mock_run.assert_not_called()
+        assert result.stdout_bytes == b"[]"
+
+    @patch("covert.pip_interface.subprocess.run")
+    @patch("covert.pip_worker.run_pip", return_value=None)
+    def test_falls_back_to_subprocess(self, mock_run_pip, mock_run, monkeypatch):
+        """Test that an unavailable worker falls back to subprocess."""
+        from covert.pip_interface import run_secure_command
+
+        monkeypatch.setenv("COVERT_PIP_WORKER", "1")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"[]", stderr=b"")
+
+        run_secure_command(["pip", "list", "--format=json"])
+
+        mock_run.assert_called_once()
+
+    @patch("covert.pip_interface.subprocess.run")
+    @patch("covert.pip_worker.run_pip")
+    def test_install_uses_subprocess(self, mock_run_pip, mock_run, monkeypatch):
+        """Test that installs always spawn a fresh pip process."""
+        from covert.pip_interface import run_secure_command
+
+        monkeypatch.setenv("COVERT_PIP_WORKER", "1")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+
+        run_secure_command(["pip", "install", "requests"])
+
+        mock_run_pip.assert_not_called()
+        mock_run.assert_called_once()
+
+    @patch("covert.pip_worker.restart_worker")
+    def test_invalidate_cache_restarts_worker(self, mock_restart):
+        """Test that environment changes restart the worker."""
+        from covert.pip_interface import _invalidate_cache
+
+        _invalidate_cache()
+
+        mock_restart.assert_called_once()
@@ -6,9 +6,11 @@ import json
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
+from covert import utils
 from covert.reports import ReportConfig, ReportData, ReportGenerator, create_report_config
 
 
@@ -108,6 +110,16 @@ class TestReportGenerator:
         assert parsed["session_name"] == "Test Session"
         assert parsed["summary"]["updated"] == 2
 
+    @pytest.mark.parametrize(
+        "report_format, marker",
+        [("MD", "# Covert Update Report"), ("Html", "<!DOCTYPE html>"), ("yaml", '"session_name"')],
+    )
+    def test_generate_format_dispatch(self, report_format, marker):
+        """Test that formats are matched case-insensitively, defaulting to JSON."""
+        generator = ReportGenerator(ReportConfig(format=report_format))
+
+        assert marker in generator.generate(ReportData())
+
     def test_generate_html(self):
         """Test generating an HTML report."""
         config = ReportConfig(format="html")
@@ -134,6 +146,24 @@ class TestReportGenerator:
         assert "Covert Update Report" in result
         assert "Test Session" in result
 
+    def test_generate_html_escapes_values(self):
+        """Test that report values cannot inject markup into the HTML report."""
+        generator = ReportGenerator(ReportConfig(format="html"))
+        data = ReportData(
+            session_name="<b>s</b>",
+            package_results=[
+                {"name": "<script>x</script>", "status": "failed_install", "error": "a & b"},
+            ],
+        )
+
+        result = generator.generate(data)
+
+        assert "<script>" not in result
+        assert "&lt;script&gt;x&lt;/script&gt;" in result
+        assert "a &amp; b" in result
+        assert "&lt;b&gt;s&lt;/b&gt;" in result
+        assert "No packages processed" not in result
+
     def test_generate_markdown(self):
         """Test generating a Markdown report."""
         config = ReportConfig(format="markdown")
@@ -159,6 +189,53 @@ class TestReportGenerator:
         assert "# Covert Update Report" in result
         assert "Test Session" in result
 
+    @pytest.mark.parametrize(
+        "counts, html_status, markdown_badge",
+        [
+            ({"failed_packages": 1}, "#f44336", "🔴 Completed with failures"),
+            ({"rolled_back_packages": 1, "vulnerabilities_found": 2}, "#f44336", "🔴 Completed with failures"),
+            ({"vulnerabilities_found": 2}, "#ff9800", "🟡 Completed with warnings"),
+            ({}, "#4caf50", "🟢 Completed successfully"),
+        ],
+    )
+    def test_overall_status(self, counts, html_status, markdown_badge):
+        """Test the session status shown in HTML and Markdown reports."""
+        data = ReportData(**counts)
+
+        html = ReportGenerator(ReportConfig(format="html")).generate(data)
+        markdown = ReportGenerator(ReportConfig(format="markdown")).generate(data)
+
+        assert f"background: {html_status};" in html
+        assert f"## {markdown_badge}" in markdown
+
+    def test_markdown_session_times(self):
+        """Test that session times are formatted the same across renders."""
+        generator = ReportGenerator(ReportConfig(format="markdown"))
+        data = ReportData(start_time=datetime(2024, 1, 1, 10, 0, 0), end_time=None)
+
+        first = generator.generate(data)
+        second = generator.generate(data)
+
+        assert "- **Start Time**: 2024-01-01 10:00:00" in first
+        assert "- **End Time**: N/A" in first
+        assert first == second
+
+    def test_package_rows_for_large_reports(self):
+        """Test that every package gets exactly one row or line."""
+        packages = [
+            {"name": f"pkg{i}", "current_version": "1", "latest_version": "2", "status": "updated"}
+            for i in range(2000)
+        ]
+        packages[-1].update(status="failed_install", error="boom")
+        data = ReportData(package_results=packages)
+
+        html = ReportGenerator(ReportConfig(format="html")).generate(data)
+        markdown = ReportGenerator(ReportConfig(format="markdown")).generate(data)
+
+        assert html.count("<tr>") == 2001  # header row plus one per package
+        assert markdown.count("\n- **pkg") == 2000
+        assert "- **pkg1999**: 1 → 2 ❌ (failed_install) - Error: boom" in markdown
+
     def test_generate_and_save_json(self):
         """Test generating and saving a JSON report."""
         with TemporaryDirectory() as tmpdir:
@@ -188,6 +265,61 @@ class TestReportGenerator:
             content = output_path.read_text()
             assert "Test Session" in content
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_saved_json_matches_generate(self, use_orjson, monkeypatch):
+        """Test that the saved JSON file matches the generated report."""
+        if not use_orjson:
+            monkeypatch.setattr(utils, "orjson", None)
+        elif utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "report.json"
+            generator = ReportGenerator(
+                ReportConfig(enabled=True, format="json", output_path=str(output_path))
+            )
+            data = ReportData(
+                session_name="Test Session",
+                start_time=datetime(2024, 1, 1, 10, 0, 0),
+                package_results=[{"name": f"pkg{i}", "status": "updated", "error": "échec"} for i in range(50)],
+            )
+
+            generator.generate_and_save(data)
+
+            assert output_path.read_text(encoding="utf-8") == generator.generate(data)
+
+    def test_generate_and_save_overwrites(self):
+        """Test that saving replaces a longer existing report completely."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "report.html"
+            output_path.write_text("x" * 100000)
+            generator = ReportGenerator(
+                ReportConfig(enabled=True, format="html", output_path=str(output_path))
+            )
+            data = ReportData(session_name="Sessão")
+
+            generator.generate_and_save(data)
+
+            assert output_path.read_text(encoding="utf-8") == generator.generate(data)
+
+    def test_generate_and_save_skips_unchanged(self):
+        """Test that an identical existing report is not rewritten."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "report.md"
+            generator = ReportGenerator(
+                ReportConfig(enabled=True, format="markdown", output_path=str(output_path))
+            )
+            data = ReportData(session_name="Test", start_time=datetime(2024, 1, 1, 10, 0, 0))
+
+            generator.generate_and_save(data)
+            with patch("covert.reports.os.write", side_effect=lambda fd, buf: len(buf)) as mock_write:
+                generator.generate_and_save(data)
+                mock_write.assert_not_called()
+
+                data.updated_packages = 1
+                generator.generate_and_save(data)
+                mock_write.assert_called_once()
+
     def test_generate_and_save_disabled(self):
         """Test generate_and_save when disabled."""
         config = ReportConfig(enabled=False)
@@ -1,5 +1,10 @@
 """Unit tests for tester module."""
 
+import io
+import os
+import subprocess
+import sys
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,17 +20,21 @@ from covert.tester import (
 )
 
 
+def _process(output, returncode):
+    """Build a fake test process that prints the given output."""
+    process = MagicMock()
+    process.stdout = io.StringIO(output)
+    process.wait.return_value = returncode
+    return process
+
+
 class TestRunTests:
     """Tests for run_tests function."""
 
-    @patch("covert.tester.subprocess.run")
+    @patch("covert.tester.subprocess.Popen")
     def test_successful_tests(self, mock_run):
         """Test successful test execution."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "5 passed in 0.5s"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_run.return_value = _process("5 passed in 0.5s\n", 0)
 
         config = TestingConfig(
             enabled=True,
@@ -39,14 +48,10 @@ class TestRunTests:
         assert result.success is True
         assert result.exit_code == 0
 
-    @patch("covert.tester.subprocess.run")
+    @patch("covert.tester.subprocess.Popen")
     def test_failed_tests(self, mock_run):
         """Test failed test execution."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "1 failed, 4 passed in 0.5s"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_run.return_value = _process("1 failed, 4 passed in 0.5s\n", 1)
 
         config = TestingConfig(
             enabled=True,
@@ -60,7 +65,7 @@ class TestRunTests:
         assert result.success is False
         assert result.exit_code == 1
 
-    @patch("covert.tester.subprocess.run")
+    @patch("covert.tester.subprocess.Popen")
     def test_disabled_testing(self, mock_run):
         """Test that disabled testing returns success."""
         config = TestingConfig(enabled=False)
@@ -71,12 +76,14 @@ class TestRunTests:
         assert result.exit_code == 0
         mock_run.assert_not_called()
 
-    @patch("covert.tester.subprocess.run")
+    @patch("covert.tester.subprocess.Popen")
     def test_timeout(self, mock_run):
         """Test handling of test timeout."""
         from subprocess import TimeoutExpired
 
-        mock_run.side_effect = TimeoutExpired("pytest", 300)
+        process = _process("", 0)
+        process.wait.side_effect = [TimeoutExpired("pytest", 300), -9]
+        mock_run.return_value = process
 
         config = TestingConfig(
             enabled=True,
@@ -88,7 +95,9 @@ class TestRunTests:
         with pytest.raises(TestError):
             run_tests(config)
 
-    @patch("covert.tester.subprocess.run")
+        process.kill.assert_called_once()
+
+    @patch("covert.tester.subprocess.Popen")
     def test_command_not_found(self, mock_run):
         """Test handling of command not found."""
         mock_run.side_effect = FileNotFoundError("pytest not found")
@@ -103,14 +112,10 @@ class TestRunTests:
         with pytest.raises(TestError):
             run_tests(config)
 
-    @patch("covert.tester.subprocess.run")
+    @patch("covert.tester.subprocess.Popen")
     def test_with_extra_args(self, mock_run):
         """Test test execution with extra arguments."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "5 passed in 0.5s"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_run.return_value = _process("5 passed in 0.5s\n", 0)
 
         config = TestingConfig(
             enabled=True,
@@ -124,6 +129,60 @@ class TestRunTests:
         call_args = mock_run.call_args[0][0]
         assert "--cov=covert" in call_args
 
+    @patch("covert.tester._OUTPUT_TAIL_LINES", 3)
+    @patch("covert.tester.subprocess.Popen")
+    def test_only_output_tail_kept(self, mock_run):
+        """Test that only the last lines of output are kept and parsed."""
+        output = "".join(f"line {i}\n" for i in range(100)) + "7 passed in 1.00s\n"
+        mock_run.return_value = _process(output, 0)
+
+        config = TestingConfig(enabled=True, command="pytest", args=[], timeout_seconds=300)
+
+        result = run_tests(config)
+
+        assert result.output == "line 98\nline 99\n7 passed in 1.00s\n"
+        assert result.passed == 7
+        assert mock_run.call_args[1]["stderr"] == subprocess.STDOUT
+
+
+class TestRunTestsLeftoverProcesses:
+    """Tests for run_tests when the tests leave processes holding the output pipe."""
+
+    # Prints a summary, then starts a grandchild that inherits stdout
+    SCRIPT = (
+        "import subprocess, sys, time; "
+        "print('1 passed in 0.01s', flush=True); "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(8)']); "
+        "time.sleep({sleep})"
+    )
+
+    def _config(self, sleep, timeout):
+        """Build a config running SCRIPT, which then sleeps for ``sleep`` seconds."""
+        return TestingConfig(
+            enabled=True,
+            command=sys.executable,
+            args=["-c", self.SCRIPT.format(sleep=sleep)],
+            timeout_seconds=timeout,
+        )
+
+    def test_exit_not_blocked_by_grandchild(self):
+        """Test that a grandchild holding stdout does not delay the result."""
+        start = time.monotonic()
+
+        result = run_tests(self._config(sleep=0, timeout=30))
+
+        assert result.passed == 1
+        assert time.monotonic() - start < 6
+
+    def test_timeout_enforced_with_grandchild(self):
+        """Test that the timeout holds when a grandchild keeps stdout open."""
+        start = time.monotonic()
+
+        with pytest.raises(TestError):
+            run_tests(self._config(sleep=30, timeout=2))
+
+        assert time.monotonic() - start < 6
+
 
 class TestParseTestOutput:
     """Tests for _parse_test_output function."""
@@ -141,27 +200,45 @@ class TestParseTestOutput:
         assert result.total == 5
         assert result.duration == 1.23
 
+    def test_summary_at_end_of_long_output(self):
+        """Test that the final summary wins over earlier look-alike lines."""
+        from covert.tester import _parse_test_output
+
+        output = "log: 1 passed in 0.01s\n" + "x" * 10000 + "\n== 12 passed, 3 failed in 4.50s =="
+        result = _parse_test_output(output, 1)
+
+        assert (result.passed, result.failed, result.total) == (12, 3, 15)
+        assert result.duration == 4.5
+
+    def test_summary_before_long_trailer(self):
+        """Test falling back to the full output when the tail has no summary."""
+        from covert.tester import _parse_test_output
+
+        output = "Ran 7 tests in 0.30s\n\nOK\n" + "y\n" * 5000
+        result = _parse_test_output(output, 0)
+
+        assert (result.total, result.passed) == (7, 7)
+
 
 class TestCheckTestCommandAvailable:
     """Tests for check_test_command_available function."""
 
     @patch("covert.tester.subprocess.run")
-    def test_command_available(self, mock_run):
-        """Test that available command returns True."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "pytest 7.0.0"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+    @patch("covert.tester.shutil.which")
+    def test_command_available(self, mock_which, mock_run):
+        """Test that available command returns True without running it."""
+        mock_which.return_value = "/usr/bin/pytest"
 
         result = check_test_command_available("pytest")
 
         assert result is True
+        mock_which.assert_called_once_with("pytest")
+        mock_run.assert_not_called()
 
-    @patch("covert.tester.subprocess.run")
-    def test_command_not_available(self, mock_run):
+    @patch("covert.tester.shutil.which")
+    def test_command_not_available(self, mock_which):
         """Test that unavailable command returns False."""
-        mock_run.side_effect = FileNotFoundError("pytest not found")
+        mock_which.return_value = None
 
         result = check_test_command_available("pytest")
 
@@ -171,39 +248,61 @@ class TestCheckTestCommandAvailable:
 class TestGetTestFiles:
     """Tests for get_test_files function."""
 
-    @patch("covert.tester.Path.rglob")
-    def test_find_test_files(self, mock_rglob):
-        """Test finding test files."""
-        from pathlib import Path
+    @staticmethod
+    def _make_files(root, names):
+        """Create empty files under root."""
+        for name in names:
+            path = root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
 
-        # Mock test files
-        mock_files = [
-            Path("tests/test_example.py"),
-            Path("tests/utils_test.py"),
-            Path("tests/e2e/test_e2e.py"),
-        ]
-        mock_rglob.return_value = iter(mock_files)
+    def test_find_test_files(self, tmp_path):
+        """Test finding test files."""
+        self._make_files(
+            tmp_path,
+            ["tests/test_example.py", "tests/utils_test.py", "tests/e2e/test_e2e.py", "tests/helpers.py"],
+        )
 
-        test_files = get_test_files(Path("tests"))
+        test_files = get_test_files(tmp_path / "tests")
 
         assert len(test_files) == 3
 
-    @patch("covert.tester.Path.rglob")
-    def test_exclude_paths(self, mock_rglob):
+    def test_exclude_paths(self, tmp_path):
         """Test excluding certain paths."""
-        from pathlib import Path
-
-        # Mock test files
-        mock_files = [
-            Path("tests/test_example.py"),
-            Path("tests/e2e/test_e2e.py"),
-        ]
-        mock_rglob.return_value = iter(mock_files)
+        self._make_files(tmp_path, ["tests/test_example.py", "tests/e2e/test_e2e.py"])
 
-        test_files = get_test_files(Path("tests"), exclude_paths=["tests/e2e"])
+        test_files = get_test_files(tmp_path / "tests", exclude_paths=["tests/e2e"])
 
         assert len(test_files) == 1
-        assert test_files[0] == Path("tests/test_example.py")
+        assert test_files[0] == tmp_path / "tests" / "test_example.py"
+
+    def test_excluded_directory_not_walked(self, tmp_path):
+        """Test that excluded directories are pruned rather than listed."""
+        self._make_files(tmp_path, ["test_a.py", "test_a_test.py", ".venv/lib/test_site.py"])
+
+        walked = []
+        real_walk = os.walk
+
+        def recording_walk(top):
+            for entry in real_walk(top):
+                walked.append(entry[0])
+                yield entry
+
+        with patch("covert.tester.os.walk", recording_walk):
+            test_files = get_test_files(tmp_path, exclude_paths=[".venv"])
+
+        assert test_files == [tmp_path / "test_a.py", tmp_path / "test_a_test.py"]
+        assert walked == [str(tmp_path)]
+
+
+    def test_exclude_paths_are_literal(self, tmp_path):
+        """Test that exclude fragments match literally, among many excludes."""
+        self._make_files(tmp_path, ["a.b/test_x.py", "aXb/test_y.py", "c+d/test_z.py"])
+        excludes = [f"vendor{i}" for i in range(50)] + ["a.b", "c+d"]
+
+        test_files = get_test_files(tmp_path, exclude_paths=excludes)
+
+        assert test_files == [tmp_path / "aXb" / "test_y.py"]
 
 
 class TestValidateTestConfig:
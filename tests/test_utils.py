@@ -2,6 +2,7 @@
 
 import pytest
 
+from covert import utils
 from covert.exceptions import ValidationError
 from covert.utils import (
     check_elevated_privileges,
@@ -12,8 +13,12 @@ from covert.utils import (
     is_breaking_change,
     is_compatible_python_version,
     is_in_virtualenv,
+    json_dumps,
+    json_dumps_indented,
+    json_loads,
     parse_version,
     sanitize_package_name,
+    update_manifest_file,
     validate_package_name,
     validate_version,
 )
@@ -108,6 +113,56 @@ class TestSanitizePackageName:
         with pytest.raises(ValidationError):
             sanitize_package_name("-invalid")
 
+    def test_results_memoized(self):
+        """Test that repeat names are served from the cache and errors are not cached."""
+        sanitize_package_name.cache_clear()
+
+        sanitize_package_name("Requests")
+        sanitize_package_name("Requests")
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                sanitize_package_name("-invalid")
+
+        info = sanitize_package_name.cache_info()
+        assert (info.hits, info.currsize) == (1, 1)
+
+
+class TestUpdateManifestFile:
+    """Tests for update_manifest_file function."""
+
+    def test_updates_exact_pins(self, tmp_path):
+        """Test that == pins are rewritten in requirements.txt and pyproject.toml."""
+        (tmp_path / "requirements.txt").write_text(
+            "Requests[socks] == 2.25.0  # http\nrequests-toolbelt==1.0.0\nflask>=2.0\n"
+        )
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nversion = "1.0"\ndependencies = ["requests==2.25.0", "rich>=13"]\n'
+        )
+
+        updated = update_manifest_file("requests", "2.31.0", tmp_path)
+
+        assert updated == [tmp_path / "requirements.txt", tmp_path / "pyproject.toml"]
+        assert (tmp_path / "requirements.txt").read_text() == (
+            "Requests[socks] == 2.31.0  # http\nrequests-toolbelt==1.0.0\nflask>=2.0\n"
+        )
+        assert '"requests==2.31.0", "rich>=13"' in (tmp_path / "pyproject.toml").read_text()
+
+    def test_ranges_and_wildcards_untouched(self, tmp_path):
+        """Test that files without an exact pin are left unchanged."""
+        (tmp_path / "requirements.txt").write_text("requests>=2.0\nrequests==2.*\n")
+
+        assert update_manifest_file("requests", "2.31.0", tmp_path) == []
+        assert (tmp_path / "requirements.txt").read_text() == "requests>=2.0\nrequests==2.*\n"
+
+    def test_no_manifests(self, tmp_path):
+        """Test that a project without manifest files changes nothing."""
+        assert update_manifest_file("requests", "2.31.0", tmp_path) == []
+
+    def test_invalid_version_raises_error(self, tmp_path):
+        """Test that an invalid version is rejected before any file is touched."""
+        with pytest.raises(ValidationError):
+            update_manifest_file("requests", "2.31.0\nevil==1", tmp_path)
+
 
 class TestIsInVirtualenv:
     """Tests for is_in_virtualenv function."""
@@ -256,3 +311,48 @@ class TestIsCompatiblePythonVersion:
         """Test == comparison."""
         current = get_python_version()
         assert is_compatible_python_version(f"=={current[0]}.{current[1]}.{current[2]}") is True
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without orjson available."""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+class TestJsonHelpers:
+    """Tests for json_loads and json_dumps functions."""
+
+    def test_round_trip(self, json_backend):
+        """Test that dumped data loads back unchanged."""
+        data = {"name": "requests", "hashes": ["sha256:abc"], "line": 1}
+        assert json_loads(json_dumps(data)) == data
+
+    def test_loads_bytes(self, json_backend):
+        """Test parsing a bytes payload."""
+        assert json_loads(b'{"version": "2.31.0"}') == {"version": "2.31.0"}
+
+    def test_dumps_compact(self, json_backend):
+        """Test that output is compact and identical across backends."""
+        assert json_dumps({"a": [1, 2], "b": "x"}) == '{"a":[1,2],"b":"x"}'
+
+    def test_dumps_non_ascii(self, json_backend):
+        """Test that non-ASCII text is written unescaped by both backends."""
+        assert json_dumps({"name": "café"}) == '{"name":"café"}'
+
+    def test_loads_invalid(self, json_backend):
+        """Test that invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            json_loads(b"{not json")
+
+    def test_dumps_indented(self, json_backend):
+        """Test indented output, with unsupported values serialized as strings."""
+        result = json_dumps_indented({"a": [1], "b": "é", "c": ValidationError})
+
+        assert result.startswith('{\n  "a": [\n    1\n  ],')
+        assert '"b": "é"' in result
+        assert json_loads(result)["c"] == str(ValidationError)